@@ -1,8 +1,11 @@
-from datetime import date
+from datetime import date, timedelta
+from typing import Tuple
 
-def get_current_academic_year() -> str:
+ACADEMIC_YEAR_START_MONTH = 4 # April
+
+def get_academic_year_for(day: date) -> str:
     """
-    Determines the academic year based on the current date.
+    Academic year (YYYY-YY) containing the given date.
     Assumes academic year starts in April.
     
     If Month >= April (4):
@@ -13,11 +16,10 @@ def get_current_academic_year() -> str:
         Year = (Current Year - 1) - Current Year
         Example: March 2025 -> 2024-25
     """
-    today = date.today()
-    month = today.month
-    year = today.year
+    month = day.month
+    year = day.year
     
-    if month >= 4:
+    if month >= ACADEMIC_YEAR_START_MONTH:
         start_year = year
         end_year = year + 1
     else:
@@ -27,3 +29,18 @@ def get_current_academic_year() -> str:
     # Format: YYYY-YY (e.g., 2025-26)
     short_end_year = str(end_year)[-2:]
     return f"{start_year}-{short_end_year}"
+
+def get_current_academic_year() -> str:
+    """
+    Determines the academic year based on the current date.
+    """
+    return get_academic_year_for(date.today())
+
+def get_academic_year_bounds(academic_year: str) -> Tuple[date, date]:
+    """
+    First and last day of an academic year, e.g. "2025-26" -> (2025-04-01, 2026-03-31).
+    """
+    start_year = int(academic_year[:4])
+    start = date(start_year, ACADEMIC_YEAR_START_MONTH, 1)
+    next_start = date(start_year + 1, ACADEMIC_YEAR_START_MONTH, 1)
+    return start, next_start - timedelta(days=1)
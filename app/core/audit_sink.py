@@ -0,0 +1,192 @@
+import asyncio
+import logging
+import random
+from typing import Dict, List, Optional
+from pymongo.errors import BulkWriteError
+from app.core.config import settings
+
+logger = logging.getLogger("audit")
+
+OVERFLOW_DROP = "drop"
+OVERFLOW_SAMPLE = "sample"
+
+class AuditSink:
+    """
+    Buffered audit_logs writer.
+    Requests only enqueue their entry; a background task flushes batches with
+    insert_many when batch_size entries are waiting or every flush_interval seconds.
+    When the queue is full the overflow policy applies:
+      drop   -> the new entry is discarded
+      sample -> 1 in overflow_sample_every new entries replaces the oldest queued one
+    """
+
+    def __init__(
+        self,
+        max_queue: int,
+        batch_size: int,
+        flush_interval: float,
+        overflow_policy: str = OVERFLOW_DROP,
+        overflow_sample_every: int = 10
+    ):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.overflow_sample_every = max(1, overflow_sample_every)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.sampled_out = 0 # Skipped by per-route sampling rules
+        self.overflow_replaced = 0 # Oldest entries evicted by the "sample" overflow policy
+        self.flushes = 0
+        self.failed_batches = 0
+        self.failed_entries = 0
+        self._overflow_seen = 0
+
+    def start(self):
+        if self._task is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """
+        Stop the flusher and write whatever is still queued (lifespan shutdown).
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        while not self._queue.empty():
+            await self._flush(self._take_batch())
+
+    def should_record(self, path: str, status_code: int) -> bool:
+        """
+        Per-route rules: skipped paths never record; sampled prefixes record a
+        fraction of successful requests (errors are always kept).
+        """
+        if path in settings.AUDIT_SKIP_PATHS:
+            return False
+
+        rate = 1.0
+        matched = ""
+        for prefix, prefix_rate in settings.AUDIT_SAMPLE_RATES.items():
+            if path.startswith(prefix) and len(prefix) > len(matched):
+                matched, rate = prefix, prefix_rate
+
+        if rate >= 1.0 or status_code >= 400:
+            return True
+        if random.random() < rate:
+            return True
+        self.sampled_out += 1
+        return False
+
+    def submit(self, entry: dict):
+        if self._queue is None:
+            # Sink not running (scripts, tests); nothing to write to
+            self.dropped += 1
+            return
+
+        try:
+            self._queue.put_nowait(entry)
+            self.enqueued += 1
+            return
+        except asyncio.QueueFull:
+            pass
+
+        self._overflow_seen += 1
+        if self.overflow_policy == OVERFLOW_SAMPLE and self._overflow_seen % self.overflow_sample_every == 0:
+            self._queue.get_nowait()
+            self._queue.put_nowait(entry)
+            self.enqueued += 1
+            self.overflow_replaced += 1
+        self.dropped += 1
+
+    def _take_batch(self) -> List[dict]:
+        batch = []
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _flush(self, batch: List[dict]):
+        if not batch:
+            return
+        try:
+            from app.core.database import db
+            if db.client:
+                await db.get_db()["audit_logs"].insert_many(batch, ordered=False)
+                self.written += len(batch)
+            self.flushes += 1
+        except BulkWriteError as e:
+            # insert_many sets _id on the entries before sending. A batch handed back by a
+            # cancelled flush keeps them, so entries that did reach the server come back as
+            # duplicate keys on the drain: already written, not failed.
+            errors = e.details.get("writeErrors", [])
+            failed = sum(1 for error in errors if error.get("code") != 11000)
+            self.written += len(batch) - failed
+            self.flushes += 1
+            if failed:
+                self.failed_batches += 1
+                self.failed_entries += failed
+                logger.error(f"Failed to write {failed} of {len(batch)} audit logs: {e}")
+        except Exception as e:
+            self.failed_batches += 1
+            self.failed_entries += len(batch)
+            logger.error(f"Failed to write {len(batch)} audit logs: {e}")
+
+    async def _run(self):
+        while True:
+            batch = []
+            try:
+                # Wait for the first entry, then give the batch up to flush_interval to fill
+                batch.append(await self._queue.get())
+                deadline = asyncio.get_running_loop().time() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    timeout = deadline - asyncio.get_running_loop().time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                await self._flush(batch)
+            except asyncio.CancelledError:
+                # Shutdown mid-batch: hand the entries back for stop() to drain
+                # (entries already inserted are recognised by their _id, see _flush)
+                for entry in batch:
+                    if not self._queue.full():
+                        self._queue.put_nowait(entry)
+                raise
+
+    def stats(self) -> dict:
+        return {
+            "queue_size": self._queue.qsize() if self._queue else 0,
+            "max_queue": self.max_queue,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "overflow_policy": self.overflow_policy,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+            "overflow_replaced": self.overflow_replaced,
+            "flushes": self.flushes,
+            "failed_batches": self.failed_batches,
+            "failed_entries": self.failed_entries
+        }
+
+audit_sink = AuditSink(
+    max_queue=settings.AUDIT_QUEUE_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_SECONDS,
+    overflow_policy=settings.AUDIT_OVERFLOW_POLICY,
+    overflow_sample_every=settings.AUDIT_OVERFLOW_SAMPLE_EVERY
+)
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import AnyHttpUrl
 
@@ -16,6 +16,16 @@ class Settings(BaseSettings):
     MONGO_USER: str = ""
     MONGO_PASS: str = ""
 
+    # Database connection pool (per uvicorn worker)
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 10 # Opened by db.warm_up() at startup and kept open
+    MONGO_MAX_IDLE_TIME_MS: int = 300000 # Idle connections above minPoolSize are closed after this. 0 = never
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 10000 # Fail a request waiting this long for a free connection. 0 = wait forever
+    MONGO_COMPRESSORS: str = "zstd,zlib" # Wire compression, in preference order. "" disables
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGO_CONNECT_TIMEOUT_MS: int = 10000
+    MONGO_SOCKET_TIMEOUT_MS: int = 0 # 0 = no limit (rollup rebuilds and archives run long aggregations)
+
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
@@ -33,7 +43,82 @@ class Settings(BaseSettings):
     # Teacher Security
     TEACHER_SECRET_KEY: str = "teacher_super_secret_key" # In prod, override with env
     TEACHER_ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 # 24 hours
-    
+
+    # Password Hashing (bcrypt runs off the event loop)
+    PASSWORD_HASH_WORKERS: int = 2 # Process pool size. 0 = use default thread pool
+    PASSWORD_HASH_MAX_PENDING: int = 256 # Max concurrent hash/verify calls before callers queue
+
+    # Verified JWT cache (per worker)
+    TOKEN_CACHE_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: int = 300 # Upper bound; entries also expire with the token's exp
+
+    # Resolved principal cache for get_current_* dependencies (per worker)
+    PRINCIPAL_CACHE_SIZE: int = 20000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30 # Max time a status change on another worker goes unnoticed
+
+    # Tenant (org/school) status cache, see app/core/tenant_status.py
+    TENANT_STATUS_CACHE_SIZE: int = 50000
+    TENANT_STATUS_CACHE_TTL_SECONDS: int = 600 # Safety net; version sync normally invalidates first
+    TENANT_STATUS_SYNC_SECONDS: float = 5.0 # Max delay before another worker's status change is seen
+
+    # Per-school settings sections (attendance policy, calendar, ...)
+    SCHOOL_SETTINGS_CACHE_SIZE: int = 5000
+    SCHOOL_SETTINGS_TTL_SECONDS: int = 60 # Bound for changes made on another worker
+
+    # Teacher authorization graphs (coordinated sections + assignments)
+    TEACHER_GRAPH_CACHE_SIZE: int = 20000
+    TEACHER_GRAPH_TTL_SECONDS: int = 60 # Bound for assignment changes made on another worker
+
+    # Background jobs (Mongo-backed queue, see app/core/jobs/)
+    JOB_WORKER_CONCURRENCY: int = 4 # Jobs run at once per uvicorn worker. 0 = enqueue only, never run jobs
+    JOB_POLL_INTERVAL_SECONDS: float = 2.0 # Max delay before a job queued by another worker is picked up
+    JOB_LEASE_SECONDS: int = 60 # A job whose worker stops heartbeating is taken over after this
+    JOB_MAX_ATTEMPTS: int = 3 # Default per job kind
+    JOB_RETRY_BASE_SECONDS: float = 5.0 # Retry backoff: base * 2^(attempt-1) ...
+    JOB_RETRY_MAX_SECONDS: float = 600.0 # ... capped here
+    JOB_RETENTION_DAYS: int = 7 # Finished jobs (and their results) are deleted after this
+    JOB_SECRET_KEY: str = "" # Encrypts one-time job secrets (temporary passwords). Empty = derived from SECRET_KEY
+
+    # Tenant data purge (POST /org/{org_id}/purge after the organization is deleted)
+    TENANT_PURGE_DELAY_HOURS: int = 72 # Grace period before the purge runs; DELETE /org/{org_id}/purge cancels it
+
+    # Bulk student admission
+    BULK_ADMISSION_MAX_ROWS: int = 5000
+
+    # Roll numbers: >0 leases blocks of this size per worker (see app/core/roll_number.py)
+    ROLL_NUMBER_LEASE_SIZE: int = 0
+
+    # Attendance report results (per worker, keyed by attendance data versions, see app/core/report_cache.py)
+    REPORT_CACHE_SIZE: int = 5000
+    REPORT_CACHE_TTL_SECONDS: int = 300 # Also bounds holiday changes in calendar_working_days. 0 disables
+    REPORT_CACHE_VERSION_SYNC_SECONDS: float = 2.0 # Max delay before another worker's attendance write is seen
+
+    # List endpoint totals (per worker, see app/utils/pagination.py count_total)
+    LIST_COUNT_CACHE_SIZE: int = 2000
+    LIST_COUNT_CACHE_TTL_SECONDS: int = 30 # Totals may lag writes by this much. 0 counts every time
+
+    # APIResponse serialization (see app/utils/response.py)
+    FAST_JSON_RESPONSES: bool = True # One-pass encoding to bytes (orjson when installed). False = jsonable_encoder + JSONResponse
+
+    # Holiday calendars (per school / academic year bitmaps)
+    HOLIDAY_CALENDAR_CACHE_SIZE: int = 5000
+    HOLIDAY_CALENDAR_TTL_SECONDS: int = 300
+    HOLIDAY_CALENDAR_VERSION_SYNC_SECONDS: float = 2.0 # Max delay before another worker's holiday / weekly off change is seen
+
+    # Audit log writer (buffered, see app/core/audit_sink.py)
+    AUDIT_QUEUE_SIZE: int = 10000
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_OVERFLOW_POLICY: str = "drop" # drop | sample
+    AUDIT_OVERFLOW_SAMPLE_EVERY: int = 10 # "sample": keep 1 in N entries arriving while the queue is full
+    AUDIT_SKIP_PATHS: List[str] = ["/", "/docs", "/docs/oauth2-redirect", "/redoc", "/api/v1/openapi.json"]
+    AUDIT_SAMPLE_RATES: Dict[str, float] = {} # Path prefix -> fraction of successful requests recorded, e.g. {"/student": 0.1}
+
+    # Audit retention (rollover into audit_logs_archive_YYYY_MM)
+    AUDIT_RETENTION_DAYS: int = 30 # Kept in the live audit_logs collection
+    AUDIT_ARCHIVE_RETENTION_MONTHS: int = 12 # Archive months older than this are dropped
+    AUDIT_ARCHIVE_COMPRESSOR: str = "zstd" # WiredTiger block compressor for archive collections
+
     # Init
     FIRST_SUPER_ADMIN_EMAIL: str = "admin@example.com"
     FIRST_SUPER_ADMIN_PASSWORD: str = "changeme"
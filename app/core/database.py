@@ -1,23 +1,161 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from typing import Dict
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
 from app.core.config import settings
 
+class PoolStatsListener(monitoring.ConnectionPoolListener):
+    """
+    Connection pool counters per server, from driver pool events.
+    Events arrive on the driver's (executor / monitor) threads, hence the lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pools: Dict[str, dict] = {}
+        self._checkout_started = threading.local()
+
+    def _pool(self, address) -> dict:
+        key = "%s:%s" % address
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = {
+                "open": 0,
+                "in_use": 0,
+                "max_in_use": 0,
+                "checkouts": 0,
+                "checkout_failures": Counter(),
+                "wait_ms_total": 0.0,
+                "wait_ms_max": 0.0,
+                "cleared": 0
+            }
+        return pool
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                address: {
+                    **pool,
+                    "checkout_failures": dict(pool["checkout_failures"]),
+                    "wait_ms_avg": round(pool["wait_ms_total"] / pool["checkouts"], 3) if pool["checkouts"] else 0.0,
+                    "wait_ms_total": round(pool["wait_ms_total"], 3),
+                    "wait_ms_max": round(pool["wait_ms_max"], 3)
+                }
+                for address, pool in self._pools.items()
+            }
+
+    # Connections
+
+    def connection_created(self, event):
+        with self._lock:
+            self._pool(event.address)["open"] += 1
+
+    def connection_closed(self, event):
+        with self._lock:
+            self._pool(event.address)["open"] -= 1
+
+    def connection_check_out_started(self, event):
+        # Checkout runs start to finish on one thread
+        self._checkout_started.value = time.perf_counter()
+
+    def connection_checked_out(self, event):
+        duration = getattr(event, "duration", None) # Seconds, pymongo >= 4.7
+        if duration is None:
+            started = getattr(self._checkout_started, "value", None)
+            duration = time.perf_counter() - started if started is not None else 0.0
+        wait_ms = duration * 1000
+
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["in_use"] += 1
+            pool["max_in_use"] = max(pool["max_in_use"], pool["in_use"])
+            pool["checkouts"] += 1
+            pool["wait_ms_total"] += wait_ms
+            pool["wait_ms_max"] = max(pool["wait_ms_max"], wait_ms)
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self._pool(event.address)["checkout_failures"][str(event.reason)] += 1
+
+    def connection_checked_in(self, event):
+        with self._lock:
+            self._pool(event.address)["in_use"] -= 1
+
+    # Pools
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self._pool(event.address)["cleared"] += 1
+
+    def pool_created(self, event): pass
+    def pool_ready(self, event): pass
+    def pool_closed(self, event): pass
+    def connection_ready(self, event): pass
+
+def _client_options() -> dict:
+    options = {
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGO_CONNECT_TIMEOUT_MS
+    }
+    # Unset = driver default (no limit)
+    if settings.MONGO_MAX_IDLE_TIME_MS:
+        options["maxIdleTimeMS"] = settings.MONGO_MAX_IDLE_TIME_MS
+    if settings.MONGO_WAIT_QUEUE_TIMEOUT_MS:
+        options["waitQueueTimeoutMS"] = settings.MONGO_WAIT_QUEUE_TIMEOUT_MS
+    if settings.MONGO_SOCKET_TIMEOUT_MS:
+        options["socketTimeoutMS"] = settings.MONGO_SOCKET_TIMEOUT_MS
+    if settings.MONGO_COMPRESSORS:
+        # Negotiated with the server; compressors whose library is missing are skipped by the driver
+        options["compressors"] = settings.MONGO_COMPRESSORS
+    return options
+
 class Database:
     client: AsyncIOMotorClient = None
 
+    def __init__(self):
+        self.pool_listener = PoolStatsListener()
+
     def connect(self):
         self.client = AsyncIOMotorClient(
             host=settings.MONGO_HOST,
             port=settings.MONGO_PORT,
             username=settings.MONGO_USER,
-            password=settings.MONGO_PASS
+            password=settings.MONGO_PASS,
+            event_listeners=[self.pool_listener],
+            **_client_options()
         )
         print("Connected to MongoDB")
 
+    async def warm_up(self):
+        """
+        Open minPoolSize connections before serving traffic (lifespan startup), instead of
+        letting the first requests pay for connection setup. Fails if the server is unreachable.
+        """
+        if not self.client:
+            return
+        # Concurrent pings each check out their own connection
+        count = max(1, settings.MONGO_MIN_POOL_SIZE)
+        await asyncio.gather(*(self.client.admin.command("ping") for _ in range(count)))
+        open_connections = sum(pool["open"] for pool in self.pool_listener.stats().values())
+        print(f"MongoDB pool warmed up ({open_connections} connections open)")
+
+    def pool_stats(self) -> dict:
+        return {
+            "max_pool_size": settings.MONGO_MAX_POOL_SIZE,
+            "min_pool_size": settings.MONGO_MIN_POOL_SIZE,
+            "servers": self.pool_listener.stats()
+        }
+
     def close(self):
         if self.client:
             self.client.close()
             print("Disconnected from MongoDB")
-    
+
     def get_db(self):
         return self.client[settings.MONGO_DB_NAME]
 
@@ -1,8 +1,10 @@
 from typing import Annotated, List
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from app.core.config import settings
+from app.core.tokens import verify_request_token
+from app.core.security import PLATFORM_TOKEN_SCOPE, ORG_TOKEN_SCOPE
+from app.core.principal_cache import get_principal, set_principal
+from app.core.tenant_status import is_school_active
 from app.modules.auth.service import AuthService
 from app.modules.auth.model import AdminUser
 from app.modules.auth.schema import TokenData
@@ -18,24 +20,30 @@ org_oauth2_scheme = OAuth2PasswordBearer(
     scheme_name="Organization User Auth"
 )
 
-async def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> AdminUser:
+async def get_current_user(request: Request, token: Annotated[str, Depends(oauth2_scheme)]) -> AdminUser:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        token_data = TokenData(email=email)
-    except JWTError:
+    # Already verified by platform_auth_check in most cases; this is a request-state lookup
+    payload = verify_request_token(request, PLATFORM_TOKEN_SCOPE, token)
+    if not payload:
+        raise credentials_exception
+    email: str = payload.get("sub")
+    if email is None:
         raise credentials_exception
+    token_data = TokenData(email=email)
+
+    cache_key = ("platform", token_data.email)
+    user = get_principal(cache_key)
+    if user is not None:
+        return user
     
     user = await AuthService.get_user_by_email(token_data.email)
     if user is None:
         raise credentials_exception
+    set_principal(cache_key, user)
     return user
 
 async def get_current_active_user(
@@ -63,23 +71,27 @@ def check_permissions(required_permissions: List[Permission]):
 
 from app.core.database import get_database
 
-async def get_current_org_user(token: Annotated[str, Depends(org_oauth2_scheme)]) -> dict:
+async def get_current_org_user(request: Request, token: Annotated[str, Depends(org_oauth2_scheme)]) -> dict:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        # Decode using ORG_SECRET_KEY
-        payload = jwt.decode(token, settings.ORG_SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: str = payload.get("sub")
-        org_id: str = payload.get("org_id")
-        
-        if user_id is None or org_id is None:
-            raise credentials_exception
-            
-    except JWTError:
+    # Verified with ORG_SECRET_KEY (shared with org_context_check)
+    payload = verify_request_token(request, ORG_TOKEN_SCOPE, token)
+    if not payload:
+        raise credentials_exception
+
+    user_id: str = payload.get("sub")
+    org_id: str = payload.get("org_id")
+
+    if user_id is None or org_id is None:
         raise credentials_exception
+
+    cache_key = ("org", user_id, org_id)
+    user = get_principal(cache_key)
+    if user is not None:
+        return user
     
     db = await get_database()
     user = await db["org_users"].find_one({"_id": user_id, "org_id": org_id, "status": "active"})
@@ -87,25 +99,26 @@ async def get_current_org_user(token: Annotated[str, Depends(org_oauth2_scheme)]
     if user is None:
         raise credentials_exception
         
+    set_principal(cache_key, user)
     return user
 
 # --- School User Dependencies ---
 
-from app.core.security_school import decode_access_token
+from app.core.security_school import SCHOOL_TOKEN_SCOPE
 
 school_oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/school/auth/token",
     scheme_name="School User Auth"
 )
 
-async def get_current_school_user(token: Annotated[str, Depends(school_oauth2_scheme)]) -> dict:
+async def get_current_school_user(request: Request, token: Annotated[str, Depends(school_oauth2_scheme)]) -> dict:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    payload = decode_access_token(token)
+    payload = verify_request_token(request, SCHOOL_TOKEN_SCOPE, token)
     if not payload:
         raise credentials_exception
         
@@ -114,6 +127,11 @@ async def get_current_school_user(token: Annotated[str, Depends(school_oauth2_sc
     
     if not user_id or not school_id:
         raise credentials_exception
+
+    cache_key = ("school", user_id, school_id)
+    user = get_principal(cache_key)
+    if user is not None:
+        return user
         
     db = await get_database()
     
@@ -127,29 +145,29 @@ async def get_current_school_user(token: Annotated[str, Depends(school_oauth2_sc
          raise HTTPException(status_code=403, detail="School Context Mismatch")
 
     # 3. Check School Status (CRITICAL: Block access if school is suspended)
-    school = await db["schools"].find_one({"_id": school_id})
-    if not school or school.get("status") != "active":
+    if not await is_school_active(school_id):
         raise HTTPException(status_code=403, detail="School is suspended or inactive")
 
+    set_principal(cache_key, user)
     return user
 
 # --- Student User Dependencies ---
 
-from app.core.security_student import decode_access_token as decode_student_token
+from app.core.security_student import STUDENT_TOKEN_SCOPE
 
 student_oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/student/auth/token",
     scheme_name="Student User Auth"
 )
 
-async def get_current_student_user(token: Annotated[str, Depends(student_oauth2_scheme)]) -> dict:
+async def get_current_student_user(request: Request, token: Annotated[str, Depends(student_oauth2_scheme)]) -> dict:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    payload = decode_student_token(token)
+    payload = verify_request_token(request, STUDENT_TOKEN_SCOPE, token)
     if not payload:
         raise credentials_exception
         
@@ -159,6 +177,11 @@ async def get_current_student_user(token: Annotated[str, Depends(student_oauth2_
     
     if not user_id or not student_id:
         raise credentials_exception
+
+    cache_key = ("student", user_id, student_id, school_id)
+    user = get_principal(cache_key)
+    if user is not None:
+        return user
         
     db = await get_database()
     
@@ -173,32 +196,32 @@ async def get_current_student_user(token: Annotated[str, Depends(student_oauth2_
         raise HTTPException(status_code=403, detail="Student account is inactive")
         
     # 3. Check School Status - If school is down, student cannot login
-    school = await db["schools"].find_one({"_id": school_id})
-    if not school or school.get("status") != "active":
+    if not await is_school_active(school_id):
         raise HTTPException(status_code=403, detail="School is suspended or inactive")
 
     # Return combined data or just user, depending on need. Returning user for now.
     user["student_details"] = student
+    set_principal(cache_key, user)
     return user
 
 
 # --- Teacher User Dependencies ---
 
-from app.core.security_teacher import decode_access_token as decode_teacher_token
+from app.core.security_teacher import TEACHER_TOKEN_SCOPE
 
 teacher_oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/teacher/auth/token",
     scheme_name="Teacher User Auth"
 )
 
-async def get_current_teacher_user(token: Annotated[str, Depends(teacher_oauth2_scheme)]) -> dict:
+async def get_current_teacher_user(request: Request, token: Annotated[str, Depends(teacher_oauth2_scheme)]) -> dict:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    payload = decode_teacher_token(token)
+    payload = verify_request_token(request, TEACHER_TOKEN_SCOPE, token)
     if not payload:
         raise credentials_exception
         
@@ -208,6 +231,11 @@ async def get_current_teacher_user(token: Annotated[str, Depends(teacher_oauth2_
     
     if not user_id or not teacher_id:
         raise credentials_exception
+
+    cache_key = ("teacher", user_id, teacher_id, school_id)
+    user = get_principal(cache_key)
+    if user is not None:
+        return user
         
     db = await get_database()
     
@@ -222,10 +250,10 @@ async def get_current_teacher_user(token: Annotated[str, Depends(teacher_oauth2_
         raise HTTPException(status_code=403, detail="Teacher account is inactive")
         
     # 3. Check School Status
-    school = await db["schools"].find_one({"_id": school_id})
-    if not school or school.get("status") != "active":
+    if not await is_school_active(school_id):
         raise HTTPException(status_code=403, detail="School is suspended or inactive")
 
     # Return combined data
     user["teacher_details"] = teacher
+    set_principal(cache_key, user)
     return user
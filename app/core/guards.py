@@ -1,5 +1,6 @@
 from fastapi import HTTPException, status, Request
 from app.core.database import get_database
+from app.core.tenant_status import get_org, get_school
 
 async def validate_login_status(db, org_id: str, school_id: str = None, user_status: str = "active", role: str = None):
     """
@@ -7,7 +8,7 @@ async def validate_login_status(db, org_id: str, school_id: str = None, user_sta
     FAIL FAST: Org -> School -> User
     """
     # 1. Organization Check
-    org = await db["organizations"].find_one({"_id": org_id})
+    org = await get_org(org_id)
     if not org or org.get("status") != "active":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, 
@@ -16,7 +17,7 @@ async def validate_login_status(db, org_id: str, school_id: str = None, user_sta
         
     # 2. School Check (If applicable)
     if school_id:
-        school = await db["schools"].find_one({"_id": school_id})
+        school = await get_school(school_id)
         school_status = school.get("status") if school else "inactive"
         
         if school_status != "active":
@@ -0,0 +1,24 @@
+"""
+One-time secrets of a job (e.g. temporary passwords from bulk admission).
+
+A handler seals them with JobContext.store_secret; they are kept encrypted on the
+job document and removed ($unset) the first time the job's creator reads the job.
+"""
+import base64
+import hashlib
+import json
+from typing import Any
+from cryptography.fernet import Fernet
+from app.core.config import settings
+
+def _fernet() -> Fernet:
+    key = settings.JOB_SECRET_KEY or settings.SECRET_KEY
+    # Fernet wants 32 url-safe base64 bytes; derive them so any configured string works
+    digest = hashlib.sha256(f"jobs:{key}".encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(digest))
+
+def seal(value: Any) -> str:
+    return _fernet().encrypt(json.dumps(value, default=str).encode()).decode()
+
+def unseal(token: str) -> Any:
+    return json.loads(_fernet().decrypt(token.encode()))
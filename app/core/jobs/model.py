@@ -0,0 +1,50 @@
+"""
+Mongo-backed job queue (one document per job in "jobs").
+
+Lifecycle:
+    queued -> running -> completed
+                      -> queued   (failed attempt, retried after backoff)
+                      -> failed   (attempts exhausted / no handler)
+
+A running job holds a lease (lease_owner + lease_expires_at) renewed by the
+worker's heartbeat. A job whose lease expired (worker died) is claimable again.
+"""
+import pymongo
+from app.core.config import settings
+from app.core.database import db
+
+COLLECTION_NAME = "jobs"
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+FINISHED = (COMPLETED, FAILED)
+
+async def ensure_job_indexes():
+    if db.client:
+        collection = db.get_db()[COLLECTION_NAME]
+
+        # Claim scans: due queued jobs / expired leases
+        await collection.create_index(
+            [("status", pymongo.ASCENDING), ("run_at", pymongo.ASCENDING)],
+            name="status_run_at_idx"
+        )
+        await collection.create_index(
+            [("status", pymongo.ASCENDING), ("lease_expires_at", pymongo.ASCENDING)],
+            name="status_lease_idx"
+        )
+        # Idempotency keys are unique while the job document exists
+        await collection.create_index(
+            [("idempotency_key", pymongo.ASCENDING)],
+            unique=True,
+            partialFilterExpression={"idempotency_key": {"$type": "string"}},
+            name="unique_idempotency_key_idx"
+        )
+        # Finished jobs (and their results) expire
+        await collection.create_index(
+            [("finished_at", pymongo.ASCENDING)],
+            expireAfterSeconds=settings.JOB_RETENTION_DAYS * 86400,
+            name="finished_at_ttl_idx"
+        )
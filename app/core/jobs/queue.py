@@ -0,0 +1,134 @@
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+from uuid import uuid4
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from app.core.config import settings
+from app.core.database import db
+from app.core.jobs.credentials import unseal
+from app.core.jobs.model import COLLECTION_NAME, QUEUED
+
+# Never returned by the API: handler input (may hold personal data) and sealed one-time secrets
+PRIVATE_FIELDS = ("payload", "secret")
+
+def public_view(job: dict) -> dict:
+    return {key: value for key, value in job.items() if key not in PRIVATE_FIELDS}
+
+class JobHandler:
+    def __init__(self, kind: str, func: Callable[..., Awaitable[Any]], max_attempts: int):
+        self.kind = kind
+        self.func = func
+        self.max_attempts = max_attempts
+
+# kind -> handler. Handlers register at import time with @job_handler.
+HANDLERS: Dict[str, JobHandler] = {}
+
+def job_handler(kind: str, max_attempts: int = None):
+    """
+    Register async func(ctx: JobContext) as the handler of a job kind.
+    Its return value becomes the job result. Handlers run at least once and may
+    run again after a worker dies mid-job, so they must be safe to repeat;
+    use max_attempts=1 for work that must never be retried (such jobs fail, rather
+    than being re-queued, when a worker shuts down or dies mid-run).
+    """
+    def decorator(func):
+        HANDLERS[kind] = JobHandler(kind, func, max_attempts or settings.JOB_MAX_ATTEMPTS)
+        return func
+    return decorator
+
+# Set by the runner so local enqueues are picked up without waiting for the next poll
+_wakeup: Optional[Callable[[], None]] = None
+
+def set_wakeup(callback: Optional[Callable[[], None]]):
+    global _wakeup
+    _wakeup = callback
+
+async def enqueue(
+    kind: str,
+    payload: dict = None,
+    school_id: str = None,
+    org_id: str = None,
+    created_by: str = None,
+    idempotency_key: str = None,
+    run_at: datetime = None
+) -> dict:
+    """
+    Queue a job and return its document. With an idempotency_key, a job already
+    recorded under that key is returned instead of queuing a second one.
+    run_at delays the first attempt (cancel_queued_job can withdraw it until then).
+    """
+    handler = HANDLERS.get(kind)
+    if handler is None:
+        raise ValueError(f"No handler registered for job kind '{kind}'")
+
+    now = datetime.utcnow()
+    job = {
+        "_id": f"job_{uuid4().hex[:16]}",
+        "kind": kind,
+        "payload": payload or {},
+        "school_id": school_id,
+        "org_id": org_id,
+        "created_by": created_by,
+        "idempotency_key": idempotency_key,
+        "status": QUEUED,
+        "attempts": 0,
+        "max_attempts": handler.max_attempts,
+        "run_at": run_at or now,
+        "lease_owner": None,
+        "lease_expires_at": None,
+        "progress": {"done": 0, "total": None, "stage": None},
+        "result": None,
+        "error": None,
+        "created_at": now,
+        "started_at": None,
+        "finished_at": None
+    }
+
+    collection = db.get_db()[COLLECTION_NAME]
+    try:
+        await collection.insert_one(job)
+    except DuplicateKeyError:
+        existing = await collection.find_one(
+            {"idempotency_key": idempotency_key}, {field: 0 for field in PRIVATE_FIELDS}
+        )
+        if existing:
+            return existing
+        raise
+
+    if _wakeup:
+        _wakeup()
+    return public_view(job)
+
+async def get_job(job_id: str, school_id: str = None, org_id: str = None) -> Optional[dict]:
+    """
+    A job by id (without payload and secrets), optionally restricted to one tenant.
+    """
+    query = {"_id": job_id}
+    if school_id:
+        query["school_id"] = school_id
+    if org_id:
+        query["org_id"] = org_id
+    return await db.get_db()[COLLECTION_NAME].find_one(query, {field: 0 for field in PRIVATE_FIELDS})
+
+async def cancel_queued_job(idempotency_key: str) -> Optional[dict]:
+    """
+    Delete the job recorded under idempotency_key if no worker has claimed it yet.
+    Returns the cancelled job, or None (no such job, or it already started).
+    """
+    return await db.get_db()[COLLECTION_NAME].find_one_and_delete(
+        {"idempotency_key": idempotency_key, "status": QUEUED, "attempts": 0},
+        projection={field: 0 for field in PRIVATE_FIELDS}
+    )
+
+async def take_job_secret(job_id: str, user_id: str) -> Optional[Any]:
+    """
+    The job's one-time secret, if the job was created by user_id and the secret was
+    not taken yet. It is removed in the same operation, so only one read ever sees it.
+    """
+    job = await db.get_db()[COLLECTION_NAME].find_one_and_update(
+        {"_id": job_id, "created_by": user_id, "secret": {"$exists": True}},
+        {"$unset": {"secret": ""}},
+        projection={"secret": 1},
+        return_document=ReturnDocument.BEFORE
+    )
+    return unseal(job["secret"]) if job else None
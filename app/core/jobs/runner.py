@@ -0,0 +1,278 @@
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Set
+from uuid import uuid4
+from pymongo import ReturnDocument
+from app.core.config import settings
+from app.core.database import db
+from app.core.jobs.credentials import seal
+from app.core.jobs.model import COLLECTION_NAME, QUEUED, RUNNING, COMPLETED, FAILED
+from app.core.jobs.queue import HANDLERS, set_wakeup
+
+logger = logging.getLogger("jobs")
+
+class JobContext:
+    """
+    What a handler sees of its job: id, payload, attempt number and progress reporting.
+    """
+
+    def __init__(self, runner: "JobRunner", job: dict):
+        self._runner = runner
+        self.job = job
+        self.job_id = job["_id"]
+        self.payload = job.get("payload", {})
+        self.attempt = job["attempts"]
+
+    async def progress(self, done: int, total: Optional[int] = None, stage: Optional[str] = None):
+        update = {"progress.done": done}
+        if total is not None:
+            update["progress.total"] = total
+        if stage is not None:
+            update["progress.stage"] = stage
+        await self._runner._update_owned(self.job_id, {"$set": update})
+
+    async def store_secret(self, value: Any):
+        """
+        Keep a value encrypted on the job until its creator reads the job once
+        (temporary passwords and the like; never put them in the result).
+        """
+        await self._runner._update_owned(self.job_id, {"$set": {"secret": seal(value)}})
+
+class JobRunner:
+    """
+    Claims and runs jobs from the jobs collection, up to `concurrency` at a time.
+
+    Claiming is one find_one_and_update, so a job goes to exactly one worker.
+    While it runs, a heartbeat renews the lease every lease_seconds / 3; if the
+    renewal finds the lease taken over (this worker stalled past its expiry), the
+    local run is cancelled. All state writes are conditional on still owning the
+    lease. Failed attempts are retried with exponential backoff; 4xx HTTPExceptions
+    are treated as permanent. On shutdown running jobs go back to the queue, except
+    single-attempt ones (max_attempts=1), which fail as interrupted.
+    """
+
+    def __init__(
+        self,
+        concurrency: int,
+        lease_seconds: float,
+        poll_interval: float,
+        retry_base_seconds: float,
+        retry_max_seconds: float
+    ):
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:6]}"
+
+        self._loop_task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._lost: Set[str] = set()
+        self._stopping = False
+
+        # Metrics
+        self.claimed = 0
+        self.recovered = 0 # Claimed after another worker's lease expired
+        self.completed = 0
+        self.retried = 0
+        self.failed = 0
+        self.leases_lost = 0
+
+    def start(self):
+        """
+        Start polling (lifespan startup). concurrency <= 0 leaves this process enqueue-only.
+        """
+        if self.concurrency <= 0 or self._loop_task is not None:
+            return
+        self._stopping = False
+        self._wake = asyncio.Event()
+        set_wakeup(self._wake.set)
+        self._loop_task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self):
+        """
+        Stop claiming, cancel running jobs and hand them back to the queue (lifespan shutdown).
+        """
+        if self._loop_task is None:
+            return
+        self._stopping = True
+        set_wakeup(None)
+        self._loop_task.cancel()
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(self._loop_task, *tasks, return_exceptions=True)
+        self._loop_task = None
+
+    async def _poll_loop(self):
+        while True:
+            self._wake.clear()
+            try:
+                while len(self._tasks) < self.concurrency:
+                    job = await self._claim()
+                    if job is None:
+                        break
+                    task = asyncio.create_task(self._execute(job))
+                    self._tasks[job["_id"]] = task
+                    task.add_done_callback(lambda _, job_id=job["_id"]: self._job_done(job_id))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Job poll failed")
+
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _job_done(self, job_id: str):
+        self._tasks.pop(job_id, None)
+        self._lost.discard(job_id)
+        if self._wake and not self._stopping:
+            self._wake.set() # A slot is free
+
+    async def _claim(self) -> Optional[dict]:
+        if not HANDLERS:
+            return None
+        now = datetime.utcnow()
+        job = await db.get_db()[COLLECTION_NAME].find_one_and_update(
+            {
+                "kind": {"$in": list(HANDLERS)},
+                "$or": [
+                    {"status": QUEUED, "run_at": {"$lte": now}},
+                    {"status": RUNNING, "lease_expires_at": {"$lt": now}}
+                ]
+            },
+            {
+                "$set": {
+                    "status": RUNNING,
+                    "lease_owner": self.worker_id,
+                    "lease_expires_at": now + timedelta(seconds=self.lease_seconds),
+                    "started_at": now
+                },
+                "$inc": {"attempts": 1}
+            },
+            sort=[("run_at", 1)],
+            return_document=ReturnDocument.AFTER
+        )
+        if job:
+            self.claimed += 1
+            if job["attempts"] > 1 and job.get("error") is None:
+                self.recovered += 1
+        return job
+
+    async def _update_owned(self, job_id: str, update: dict) -> bool:
+        result = await db.get_db()[COLLECTION_NAME].update_one(
+            {"_id": job_id, "status": RUNNING, "lease_owner": self.worker_id},
+            update
+        )
+        return result.matched_count == 1
+
+    async def _heartbeat(self, job_id: str, task: asyncio.Task):
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                owned = await self._update_owned(job_id, {"$set": {
+                    "lease_expires_at": datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+                }})
+            except Exception:
+                logger.exception("Heartbeat for job %s failed", job_id)
+                continue
+            if not owned:
+                logger.warning("Lost the lease on job %s; cancelling the local run", job_id)
+                self.leases_lost += 1
+                self._lost.add(job_id)
+                task.cancel()
+                return
+
+    async def _execute(self, job: dict):
+        job_id = job["_id"]
+        handler = HANDLERS[job["kind"]]
+
+        if job["attempts"] > job["max_attempts"]:
+            # Recovered from a dead worker, but that was already the last attempt
+            await self._finish(job_id, FAILED, error=job.get("error") or "Worker stopped during the last attempt")
+            return
+
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, asyncio.current_task()))
+        try:
+            result = await handler.func(JobContext(self, job))
+        except asyncio.CancelledError:
+            if job_id not in self._lost and self._stopping:
+                if job["max_attempts"] <= 1:
+                    # Must never run twice (it may have written part of its work already)
+                    if await self._finish(job_id, FAILED, error="Interrupted by shutdown"):
+                        self.failed += 1
+                else:
+                    # Shutdown: hand the job back without counting this attempt
+                    await self._update_owned(job_id, {
+                        "$set": {"status": QUEUED, "run_at": datetime.utcnow(), "lease_owner": None, "lease_expires_at": None},
+                        "$inc": {"attempts": -1}
+                    })
+            raise
+        except Exception as exc:
+            await self._retry_or_fail(job, exc)
+        else:
+            if await self._finish(job_id, COMPLETED, result=result):
+                self.completed += 1
+        finally:
+            heartbeat.cancel()
+
+    async def _retry_or_fail(self, job: dict, exc: Exception):
+        error = getattr(exc, "detail", None) or str(exc) or exc.__class__.__name__
+        permanent = getattr(exc, "status_code", 500) < 500
+
+        if not permanent and job["attempts"] < job["max_attempts"]:
+            delay = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (job["attempts"] - 1))
+            logger.warning("Job %s attempt %s failed (%s); retrying in %ss", job["_id"], job["attempts"], error, delay)
+            if await self._update_owned(job["_id"], {"$set": {
+                "status": QUEUED,
+                "run_at": datetime.utcnow() + timedelta(seconds=delay),
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "error": error
+            }}):
+                self.retried += 1
+            return
+
+        logger.error("Job %s failed: %s", job["_id"], error, exc_info=not permanent)
+        if await self._finish(job["_id"], FAILED, error=error):
+            self.failed += 1
+
+    async def _finish(self, job_id: str, status: str, result: Any = None, error: str = None) -> bool:
+        return await self._update_owned(job_id, {"$set": {
+            "status": status,
+            "result": result,
+            "error": error,
+            "lease_owner": None,
+            "lease_expires_at": None,
+            "payload": None, # Input is not needed any more and may hold personal data
+            "finished_at": datetime.utcnow()
+        }})
+
+    def stats(self) -> dict:
+        return {
+            "worker_id": self.worker_id,
+            "concurrency": self.concurrency,
+            "running": len(self._tasks),
+            "handlers": sorted(HANDLERS),
+            "claimed": self.claimed,
+            "recovered": self.recovered,
+            "completed": self.completed,
+            "retried": self.retried,
+            "failed": self.failed,
+            "leases_lost": self.leases_lost
+        }
+
+job_runner = JobRunner(
+    concurrency=settings.JOB_WORKER_CONCURRENCY,
+    lease_seconds=settings.JOB_LEASE_SECONDS,
+    poll_interval=settings.JOB_POLL_INTERVAL_SECONDS,
+    retry_base_seconds=settings.JOB_RETRY_BASE_SECONDS,
+    retry_max_seconds=settings.JOB_RETRY_MAX_SECONDS
+)
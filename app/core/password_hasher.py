@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Optional
+from passlib.context import CryptContext
+from app.core.config import settings
+
+logger = logging.getLogger("password_hasher")
+
+# Shared bcrypt context. Lives at module level so pool workers build their own copy on import.
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+class PasswordHasher:
+    """
+    Async facade over bcrypt.
+    Hashing/verification runs in a bounded process pool so a ~200ms bcrypt call
+    never blocks the event loop. PASSWORD_HASH_WORKERS=0 falls back to the default thread pool.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        # Metrics
+        self.queued = 0 # Waiting for a free slot
+        self.in_flight = 0 # Submitted to the pool
+        self.max_queue_depth = 0
+        self.completed = 0 # Succeeded
+        self.failed = 0
+
+    def start(self):
+        if self._executor is None and self.workers > 0:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            logger.info(f"Password hasher started with {self.workers} workers")
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, fn, *args):
+        # Semaphore is created lazily so it binds to the running loop
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        if self._executor is None:
+            self.start()
+
+        self.queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queued + self.in_flight)
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, fn, *args)
+            self.completed += 1
+            return result
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(_verify, plain_password, hashed_password)
+
+    async def hash_many(self, passwords: list) -> list:
+        """
+        Hash a batch concurrently (bulk admissions, imports).
+        Concurrency is still bounded by the pool size and max_pending.
+        """
+        return list(await asyncio.gather(*(self.hash(p) for p in passwords)))
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "queued": self.queued,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queued + self.in_flight,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+            "failed": self.failed
+        }
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
@@ -0,0 +1,47 @@
+import copy
+from typing import Any, Hashable
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import get_database
+
+# Resolved principals for the get_current_* dependencies.
+# Keys are tuples: (kind, user_id, *context ids from the token), e.g.
+#   ("student", user_id, student_id, school_id)
+# A hit means the user, its business record and its school were all active when cached.
+_principals = TTLCache(
+    "principals",
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+def get_principal(key: Hashable) -> Any:
+    principal = _principals.get(key)
+    if isinstance(principal, dict):
+        # Deep copy: student_details / teacher_details are nested dicts, and handlers
+        # must not leak edits into other requests
+        return copy.deepcopy(principal)
+    return principal
+
+def set_principal(key: Hashable, principal: Any):
+    _principals.set(key, principal)
+
+def invalidate_principals(*ids: str):
+    """
+    Drop every cached principal whose key mentions one of the given ids
+    (user id, student/teacher id, school id or org id).
+    Call after status changes, deactivation or credential updates.
+    """
+    targets = set(ids)
+    _principals.invalidate_where(lambda key: any(part in targets for part in key))
+
+async def invalidate_org_principals(org_id: str):
+    """
+    Drop every cached principal of an organization: its org users, and the school,
+    student and teacher principals of its schools (their keys carry the school id only).
+    """
+    db = await get_database()
+    school_ids = await db["schools"].distinct("_id", {"org_id": org_id})
+    invalidate_principals(org_id, *school_ids)
+
+def principal_cache_stats() -> dict:
+    return _principals.stats()
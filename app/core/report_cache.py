@@ -0,0 +1,148 @@
+"""
+Attendance report results, cached per worker and keyed by the data they were built from.
+
+Attendance writes bump version counters in attendance_data_versions (shared by all
+workers), one per scope:
+
+    all              every report of the school (rollup rebuilds)
+    records          any attendance change in the school
+    section:<id>     a change in that section
+    date:<YYYY-MM-DD> a change on that date
+
+A report key is (report, school, params, versions of its scopes). A bump makes old
+keys unreachable; they age out of the LRU. Identical concurrent misses share one
+computation (single flight).
+"""
+import asyncio
+import functools
+import inspect
+from typing import Any, Callable, Dict, Hashable, Iterable, Tuple
+from pymongo import UpdateOne
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import db
+
+VERSION_COLLECTION = "attendance_data_versions"
+
+ALL = "all"
+RECORDS = "records"
+
+def section_scope(section_id: str) -> str:
+    return f"section:{section_id}"
+
+def date_scope(day) -> str:
+    return f"date:{day}"
+
+_results = TTLCache(
+    "attendance_reports",
+    maxsize=settings.REPORT_CACHE_SIZE,
+    ttl=settings.REPORT_CACHE_TTL_SECONDS
+)
+
+# (school_id, scope) -> version, re-read from Mongo every REPORT_CACHE_VERSION_SYNC_SECONDS
+_versions = TTLCache(
+    "attendance_data_versions",
+    maxsize=settings.REPORT_CACHE_SIZE,
+    ttl=settings.REPORT_CACHE_VERSION_SYNC_SECONDS
+)
+
+_in_flight: Dict[Hashable, asyncio.Task] = {}
+_MISSING = object()
+
+class _Counters:
+    computed: int = 0
+    coalesced: int = 0
+
+_counters = _Counters()
+
+def _version_id(school_id: str, scope: str) -> str:
+    return f"{school_id}:{scope}"
+
+async def get_versions(school_id: str, scopes: Iterable[str]) -> Tuple[int, ...]:
+    """
+    Current versions of the given scopes (0 for scopes never bumped), in order.
+    """
+    scopes = tuple(scopes)
+    versions = {scope: _versions.get((school_id, scope)) for scope in scopes}
+
+    missing = [scope for scope, version in versions.items() if version is None]
+    if missing:
+        ids = {_version_id(school_id, scope): scope for scope in missing}
+        docs = await db.get_db()[VERSION_COLLECTION].find(
+            {"_id": {"$in": list(ids)}}, {"version": 1}
+        ).to_list(length=None)
+        found = {doc["_id"]: doc.get("version", 0) for doc in docs}
+        for doc_id, scope in ids.items():
+            versions[scope] = found.get(doc_id, 0)
+            _versions.set((school_id, scope), versions[scope])
+
+    return tuple(versions[scope] for scope in scopes)
+
+async def bump_attendance_versions(school_id: str, *scopes: str):
+    """
+    Mark attendance data of the given scopes as changed. Call after the write.
+    This worker sees the change immediately, others within REPORT_CACHE_VERSION_SYNC_SECONDS.
+    """
+    if not scopes:
+        return
+    await db.get_db()[VERSION_COLLECTION].bulk_write([
+        UpdateOne({"_id": _version_id(school_id, scope)}, {"$inc": {"version": 1}}, upsert=True)
+        for scope in scopes
+    ], ordered=False)
+    for scope in scopes:
+        _versions.invalidate((school_id, scope))
+
+def _finish(key: Hashable, task: asyncio.Task):
+    _in_flight.pop(key, None)
+    if not task.cancelled() and task.exception() is None:
+        _results.set(key, task.result())
+
+async def _get_or_compute(key: Hashable, compute: Callable[[], Any]) -> Any:
+    value = _results.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    task = _in_flight.get(key)
+    if task is None:
+        _counters.computed += 1
+        task = asyncio.ensure_future(compute())
+        _in_flight[key] = task
+        task.add_done_callback(functools.partial(_finish, key))
+    else:
+        _counters.coalesced += 1
+
+    # Shielded: one caller disconnecting must not cancel the others' result
+    return await asyncio.shield(task)
+
+def cached_report(name: str, scopes: Callable[[dict], Iterable[str]]):
+    """
+    Cache an async report function taking school_id plus hashable params.
+    scopes(params) names the data the report reads (see module docstring).
+    Cached results are shared between callers and must be treated as read-only.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if settings.REPORT_CACHE_TTL_SECONDS <= 0:
+                return await func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            params = bound.arguments
+            school_id = params["school_id"]
+
+            versions = await get_versions(school_id, (ALL, *scopes(params)))
+            key = (name, school_id, tuple(sorted(params.items())), versions)
+            return await _get_or_compute(key, lambda: func(*args, **kwargs))
+
+        return wrapper
+    return decorator
+
+def report_cache_stats() -> dict:
+    return {
+        "computed": _counters.computed,
+        "coalesced": _counters.coalesced,
+        "in_flight": len(_in_flight)
+    }
@@ -1,5 +1,12 @@
+import asyncio
+from typing import Dict, List, Tuple
+from app.core.config import settings
 from app.core.database import get_database
 
+def _sequence_key(school_id: str, class_id: str, section_id: str, academic_year: str) -> str:
+    # Key to uniquely identify the sequence
+    return f"{school_id}_{academic_year}_{class_id}_{section_id}_roll_no"
+
 async def generate_next_roll_number(
     school_id: str,
     class_id: str,
@@ -9,17 +16,139 @@ async def generate_next_roll_number(
     """
     Atomically generates the next roll number for a given section in an academic year.
     Uses a separate 'sequences' collection to ensure uniqueness and concurrency safety.
+    With ROLL_NUMBER_LEASE_SIZE > 0 numbers come from this worker's leased block
+    (no round trip per admission, but numbers are not strictly in admission order across workers).
     """
+    if settings.ROLL_NUMBER_LEASE_SIZE > 0:
+        return await roll_number_leases.next(school_id, class_id, section_id, academic_year)
+
+    first, _ = await reserve_roll_numbers(school_id, class_id, section_id, academic_year, 1)
+    return first
+
+async def reserve_roll_numbers(
+    school_id: str,
+    class_id: str,
+    section_id: str,
+    academic_year: str,
+    count: int
+) -> Tuple[int, int]:
+    """
+    Reserve a contiguous block of `count` roll numbers in one round trip.
+    Returns (first, last), both inclusive.
+    """
+    if count < 1:
+        raise ValueError("count must be at least 1")
+
     db = await get_database()
-    
-    # Key to uniquely identify the sequence
-    sequence_key = f"{school_id}_{academic_year}_{class_id}_{section_id}_roll_no"
-    
     result = await db["sequences"].find_one_and_update(
-        {"_id": sequence_key},
-        {"$inc": {"seq": 1}},
+        {"_id": _sequence_key(school_id, class_id, section_id, academic_year)},
+        {"$inc": {"seq": count}},
         upsert=True,
         return_document=True
     )
     
-    return result["seq"]
+    last = result["seq"]
+    return last - count + 1, last
+
+async def release_roll_numbers(
+    school_id: str,
+    class_id: str,
+    section_id: str,
+    academic_year: str,
+    first: int,
+    last: int
+):
+    """
+    Record a reserved range that will never be assigned (failed writes, returned leases).
+    Numbers are not reused; the ranges are kept on the sequence for reporting.
+    """
+    if last < first:
+        return
+    db = await get_database()
+    await db["sequences"].update_one(
+        {"_id": _sequence_key(school_id, class_id, section_id, academic_year)},
+        {"$push": {"unused": {"from": first, "to": last}}}
+    )
+
+async def get_unused_roll_numbers(
+    school_id: str,
+    class_id: str,
+    section_id: str,
+    academic_year: str
+) -> dict:
+    """
+    Unused numbers of a section: released ranges plus blocks currently leased by this worker.
+    """
+    db = await get_database()
+    sequence = await db["sequences"].find_one(
+        {"_id": _sequence_key(school_id, class_id, section_id, academic_year)}
+    ) or {}
+
+    released = sequence.get("unused", [])
+    leased = roll_number_leases.pending(school_id, class_id, section_id, academic_year)
+    return {
+        "last_issued": sequence.get("seq", 0),
+        "released": released,
+        "leased_by_this_worker": leased,
+        "unused_count": sum(r["to"] - r["from"] + 1 for r in released + leased)
+    }
+
+class RollNumberLeases:
+    """
+    Per-worker roll-number blocks. A worker reserves `block_size` numbers with one $inc
+    and hands them out locally; concurrent admissions in a section then share one round
+    trip per block instead of queueing on the sequence document.
+    """
+
+    def __init__(self, block_size: int):
+        self.block_size = block_size
+        self._blocks: Dict[tuple, List[int]] = {} # key -> [next, last]
+        self._locks: Dict[tuple, asyncio.Lock] = {}
+
+        # Metrics
+        self.issued = 0
+        self.blocks_reserved = 0
+
+    async def next(self, school_id: str, class_id: str, section_id: str, academic_year: str) -> int:
+        key = (school_id, class_id, section_id, academic_year)
+        while True:
+            block = self._blocks.get(key)
+            if block and block[0] <= block[1]:
+                # No await between check and take: safe within the event loop
+                number = block[0]
+                block[0] += 1
+                self.issued += 1
+                return number
+
+            lock = self._locks.setdefault(key, asyncio.Lock())
+            async with lock:
+                block = self._blocks.get(key)
+                if not block or block[0] > block[1]:
+                    first, last = await reserve_roll_numbers(*key, self.block_size)
+                    self._blocks[key] = [first, last]
+                    self.blocks_reserved += 1
+
+    def pending(self, school_id: str, class_id: str, section_id: str, academic_year: str) -> List[dict]:
+        block = self._blocks.get((school_id, class_id, section_id, academic_year))
+        if block and block[0] <= block[1]:
+            return [{"from": block[0], "to": block[1]}]
+        return []
+
+    async def release_all(self):
+        """
+        Lifespan shutdown: return unissued numbers of every block as unused ranges.
+        """
+        blocks, self._blocks = self._blocks, {}
+        for key, (first, last) in blocks.items():
+            if first <= last:
+                await release_roll_numbers(*key, first, last)
+
+    def stats(self) -> dict:
+        return {
+            "block_size": self.block_size,
+            "open_blocks": len(self._blocks),
+            "issued": self.issued,
+            "blocks_reserved": self.blocks_reserved
+        }
+
+roll_number_leases = RollNumberLeases(block_size=max(1, settings.ROLL_NUMBER_LEASE_SIZE))
@@ -1,10 +1,77 @@
-from typing import Optional, Literal
+from typing import Any, Dict, List, Optional, Literal
+from app.core.cache import TTLCache
+from app.core.config import settings as app_settings
 from app.core.database import db
 
 COLLECTION_NAME = "school_settings"
 DEFAULT_MODE = "COORDINATOR_ONLY"
+DEFAULT_WEEKLY_OFFS = (6,) # Sunday
+
+# Per-school settings live in one document, one sub-document per section.
+# New sections only need an entry here (defaults are merged on read).
+SECTION_DEFAULTS: Dict[str, dict] = {
+    "attendance_policy": {
+        "mode": DEFAULT_MODE,
+        "past_attendance_days_allowed": 0
+    },
+    "calendar": {
+        "weekly_offs": list(DEFAULT_WEEKLY_OFFS)
+    }
+}
+
+# school_id -> {"version": int, <section>: {...}}
+_settings_cache = TTLCache(
+    "school_settings",
+    maxsize=app_settings.SCHOOL_SETTINGS_CACHE_SIZE,
+    ttl=app_settings.SCHOOL_SETTINGS_TTL_SECONDS
+)
 
 class SchoolSettings:
+
+    @staticmethod
+    async def _load(school_id: str, fresh: bool = False) -> dict:
+        """
+        All sections of a school, read once and cached (fresh=True re-reads them).
+        Every write bumps "version", so readers can tell settings generations apart.
+        """
+        doc = None if fresh else _settings_cache.get(school_id)
+        if doc is None:
+            database = db.get_db()
+            doc = await database[COLLECTION_NAME].find_one({"school_id": school_id}) or {}
+            doc.setdefault("version", 0)
+            _settings_cache.set(school_id, doc)
+        return doc
+
+    @staticmethod
+    async def get_section(school_id: str, section: str, fresh: bool = False) -> dict:
+        """
+        One settings section merged over its defaults. The result is a copy.
+        """
+        doc = await SchoolSettings._load(school_id, fresh)
+        return {**SECTION_DEFAULTS.get(section, {}), **doc.get(section, {})}
+
+    @staticmethod
+    async def get_version(school_id: str) -> int:
+        return (await SchoolSettings._load(school_id))["version"]
+
+    @staticmethod
+    async def set_section(school_id: str, section: str, values: Dict[str, Any], replace: bool = False):
+        """
+        Write a settings section (or only the given keys of it) and invalidate the cache.
+        Other workers pick the change up within SCHOOL_SETTINGS_TTL_SECONDS.
+        """
+        if replace:
+            update = {section: values}
+        else:
+            update = {f"{section}.{key}": value for key, value in values.items()}
+
+        database = db.get_db()
+        await database[COLLECTION_NAME].update_one(
+            {"school_id": school_id},
+            {"$set": update, "$inc": {"version": 1}},
+            upsert=True
+        )
+        _settings_cache.invalidate(school_id)
     
     @staticmethod
     async def get_attendance_policy(school_id: str) -> dict:
@@ -16,20 +83,7 @@ class SchoolSettings:
             "past_attendance_days_allowed": int (default 0)
         }
         """
-        database = db.get_db()
-        settings = await database[COLLECTION_NAME].find_one({"school_id": school_id})
-        
-        default_policy = {
-            "mode": DEFAULT_MODE,
-            "past_attendance_days_allowed": 0
-        }
-        
-        if settings and "attendance_policy" in settings:
-             policy = settings["attendance_policy"]
-             # Merge with defaults to ensure all keys exist
-             return {**default_policy, **policy}
-        
-        return default_policy
+        return await SchoolSettings.get_section(school_id, "attendance_policy")
 
     @staticmethod
     async def set_attendance_policy(
@@ -40,14 +94,29 @@ class SchoolSettings:
         """
         Update or Create attendance policy.
         """
-        database = db.get_db()
-        await database[COLLECTION_NAME].update_one(
-            {"school_id": school_id},
-            {"$set": {
-                "attendance_policy": {
-                    "mode": mode,
-                    "past_attendance_days_allowed": past_attendance_days_allowed
-                }
-            }},
-            upsert=True
+        await SchoolSettings.set_section(
+            school_id,
+            "attendance_policy",
+            {
+                "mode": mode,
+                "past_attendance_days_allowed": past_attendance_days_allowed
+            },
+            replace=True
         )
+
+    @staticmethod
+    async def get_calendar_settings(school_id: str, fresh: bool = False) -> dict:
+        """
+        Fetch calendar settings for a school.
+        {
+            "weekly_offs": [int] (weekday numbers, Monday=0 ... Sunday=6; default [6])
+        }
+        """
+        return await SchoolSettings.get_section(school_id, "calendar", fresh)
+
+    @staticmethod
+    async def set_weekly_offs(school_id: str, weekly_offs: List[int]):
+        """
+        Update or Create the weekly off days (Monday=0 ... Sunday=6).
+        """
+        await SchoolSettings.set_section(school_id, "calendar", {"weekly_offs": sorted(set(weekly_offs))})
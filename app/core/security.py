@@ -1,16 +1,19 @@
 from datetime import datetime, timedelta, timezone
 from typing import Any, Union
 from jose import jwt
-from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.password_hasher import password_hasher
+from app.core.tokens import TokenScope
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+PLATFORM_TOKEN_SCOPE = TokenScope("platform", settings.SECRET_KEY, settings.ALGORITHM)
+ORG_TOKEN_SCOPE = TokenScope("org", settings.ORG_SECRET_KEY, settings.ALGORITHM)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+# bcrypt is offloaded to the shared process pool (see app/core/password_hasher.py)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify(plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    return await password_hasher.hash(password)
 
 def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None, secret_key: str = None, claims: dict = None) -> str:
     if expires_delta:
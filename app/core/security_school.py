@@ -1,11 +1,9 @@
-from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from typing import Optional, Union, Any
 from jose import jwt
 from app.core.config import settings
-
-# Specific pwd_context for School Users (Good practice to keep separate if we want different rules later)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.password_hasher import password_hasher
+from app.core.tokens import TokenScope, verify_token
 
 # Use a specific secret key for schools if defined, else fallback (BUT with a prefix to distinguish signatures if sharing secret)
 # Recommended: Define SCHOOL_SECRET_KEY in config. For now, we assume it's there or use a derived one.
@@ -14,11 +12,13 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 # 24 hours
 REFRESH_TOKEN_EXPIRE_DAYS = 7 # 7 Days
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+SCHOOL_TOKEN_SCOPE = TokenScope("school", SECRET_KEY, ALGORITHM, "SCHOOL_USER")
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify(plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    return await password_hasher.hash(password)
 
 def create_access_token(subject: Union[str, Any], extra_claims: dict = None, expires_delta: timedelta = None) -> str:
     if expires_delta:
@@ -46,13 +46,7 @@ def create_refresh_token(subject: Union[str, Any], expires_delta: timedelta = No
     return encoded_jwt
 
 def decode_access_token(token: str):
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        if payload.get("type") != "SCHOOL_USER":
-            return None
-        return payload
-    except jwt.JWTError:
-        return None
+    return verify_token(token, SCHOOL_TOKEN_SCOPE)
 
 def decode_refresh_token(token: str):
     try:
@@ -1,11 +1,9 @@
-from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from typing import Optional, Union, Any
 from jose import jwt
 from app.core.config import settings
-
-# Specific pwd_context for Student Users
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.password_hasher import password_hasher
+from app.core.tokens import TokenScope, verify_token
 
 # Use a specific secret key for students (Derived if not in settings)
 # Ideally settings.STUDENT_SECRET_KEY should exist
@@ -14,11 +12,17 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 # 24 hours
 REFRESH_TOKEN_EXPIRE_DAYS = 7 # 7 Days
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+STUDENT_TOKEN_SCOPE = TokenScope("student", SECRET_KEY, ALGORITHM, "STUDENT_USER")
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify(plain_password, hashed_password)
+
+async def get_password_hash(password: str) -> str:
+    return await password_hasher.hash(password)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def get_password_hashes(passwords: list) -> list:
+    # Bulk admissions: hashed concurrently on the process pool
+    return await password_hasher.hash_many(passwords)
 
 def create_access_token(subject: Union[str, Any], extra_claims: dict = None, expires_delta: timedelta = None) -> str:
     if expires_delta:
@@ -46,13 +50,7 @@ def create_refresh_token(subject: Union[str, Any], expires_delta: timedelta = No
     return encoded_jwt
 
 def decode_access_token(token: str):
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        if payload.get("type") != "STUDENT_USER":
-            return None
-        return payload
-    except jwt.JWTError:
-        return None
+    return verify_token(token, STUDENT_TOKEN_SCOPE)
 
 def decode_refresh_token(token: str):
     try:
@@ -1,11 +1,9 @@
-from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from typing import Optional, Union, Any
 from jose import jwt
 from app.core.config import settings
-
-# Specific pwd_context for Teacher Users
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.password_hasher import password_hasher
+from app.core.tokens import TokenScope, verify_token
 
 # Use a specific secret key for teachers
 TEACHER_SECRET_KEY = getattr(settings, "TEACHER_SECRET_KEY", settings.SECRET_KEY + "_teacher") 
@@ -13,11 +11,13 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.TEACHER_ACCESS_TOKEN_EXPIRE_MINUTES
 REFRESH_TOKEN_EXPIRE_DAYS = 7 # 7 Days
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+TEACHER_TOKEN_SCOPE = TokenScope("teacher", TEACHER_SECRET_KEY, ALGORITHM, "TEACHER_USER")
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify(plain_password, hashed_password)
 
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+async def get_password_hash(password: str) -> str:
+    return await password_hasher.hash(password)
 
 def create_access_token(subject: Union[str, Any], extra_claims: dict = None, expires_delta: timedelta = None) -> str:
     if expires_delta:
@@ -45,13 +45,7 @@ def create_refresh_token(subject: Union[str, Any], expires_delta: timedelta = No
     return encoded_jwt
 
 def decode_access_token(token: str):
-    try:
-        payload = jwt.decode(token, TEACHER_SECRET_KEY, algorithms=[ALGORITHM])
-        if payload.get("type") != "TEACHER_USER":
-            return None
-        return payload
-    except jwt.JWTError:
-        return None
+    return verify_token(token, TEACHER_TOKEN_SCOPE)
 
 def decode_refresh_token(token: str):
     try:
@@ -0,0 +1,113 @@
+from datetime import date
+from typing import Dict, FrozenSet, List, Tuple
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import db
+
+AssignmentKey = Tuple[str, str, str] # (class_id, section_id, subject_id)
+
+class TeacherAuthGraph:
+    """
+    Everything a teacher is authorized for in one school:
+    coordinated sections and active subject assignments (with substitute windows).
+    Permission checks against it are set / interval lookups.
+    """
+
+    def __init__(
+        self,
+        coordinated_sections: FrozenSet[str],
+        primary: FrozenSet[AssignmentKey],
+        co_teacher: FrozenSet[AssignmentKey],
+        substitute_windows: Dict[AssignmentKey, List[Tuple[date, date]]]
+    ):
+        self.coordinated_sections = coordinated_sections
+        self.primary = primary
+        self.co_teacher = co_teacher
+        self.substitute_windows = substitute_windows
+
+    def coordinates(self, section_id: str) -> bool:
+        return section_id in self.coordinated_sections
+
+    def can_mark(self, class_id: str, section_id: str, subject_id: str, on: date) -> bool:
+        key = (class_id, section_id, subject_id)
+        if key in self.primary:
+            return True
+        return any(start <= on <= end for start, end in self.substitute_windows.get(key, ()))
+
+def _to_date(value):
+    # substitute_period dates are stored as ISO strings; tolerate datetimes too
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    if hasattr(value, "date"):
+        return value.date()
+    return value
+
+_graphs = TTLCache(
+    "teacher_auth_graphs",
+    maxsize=settings.TEACHER_GRAPH_CACHE_SIZE,
+    ttl=settings.TEACHER_GRAPH_TTL_SECONDS
+)
+
+async def load_teacher_graph(teacher_id: str, school_id: str) -> TeacherAuthGraph:
+    """
+    One aggregation: active section_coordinators rows $unionWith active teacher_assignments.
+    """
+    database = db.get_db()
+    match = {"teacher_id": teacher_id, "school_id": school_id, "status": "active"}
+    pipeline = [
+        {"$match": match},
+        {"$project": {"_id": 0, "kind": "COORDINATOR", "section_id": 1}},
+        {"$unionWith": {
+            "coll": "teacher_assignments",
+            "pipeline": [
+                {"$match": match},
+                {"$project": {
+                    "_id": 0,
+                    "kind": {"$ifNull": ["$role_type", "PRIMARY"]},
+                    "class_id": 1,
+                    "section_id": 1,
+                    "subject_id": 1,
+                    "substitute_period": 1
+                }}
+            ]
+        }}
+    ]
+
+    coordinated = set()
+    primary = set()
+    co_teacher = set()
+    substitute_windows: Dict[AssignmentKey, List[Tuple[date, date]]] = {}
+
+    async for row in database["section_coordinators"].aggregate(pipeline):
+        kind = row["kind"]
+        if kind == "COORDINATOR":
+            coordinated.add(row["section_id"])
+            continue
+
+        key = (row.get("class_id"), row.get("section_id"), row.get("subject_id"))
+        if kind == "PRIMARY":
+            primary.add(key)
+        elif kind == "CO_TEACHER":
+            co_teacher.add(key)
+        elif kind == "SUBSTITUTE":
+            period = row.get("substitute_period") or {}
+            start, end = _to_date(period.get("from")), _to_date(period.get("to"))
+            if start and end:
+                substitute_windows.setdefault(key, []).append((start, end))
+
+    return TeacherAuthGraph(frozenset(coordinated), frozenset(primary), frozenset(co_teacher), substitute_windows)
+
+async def get_teacher_graph(teacher_id: str, school_id: str) -> TeacherAuthGraph:
+    key = (school_id, teacher_id)
+    graph = _graphs.get(key)
+    if graph is None:
+        graph = await load_teacher_graph(teacher_id, school_id)
+        _graphs.set(key, graph)
+    return graph
+
+def invalidate_teacher_graphs(school_id: str, *teacher_ids: str):
+    """
+    Call after coordinator or assignment changes. Other workers follow within TEACHER_GRAPH_TTL_SECONDS.
+    """
+    for teacher_id in teacher_ids:
+        _graphs.invalidate((school_id, teacher_id))
@@ -0,0 +1,102 @@
+import asyncio
+import time
+from typing import Optional
+from pymongo import ReturnDocument
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import db
+
+# Version stamp shared by all workers. Every org/school status write bumps it;
+# a worker that sees a newer version drops its cached tenants.
+VERSION_COLLECTION = "tenant_status_versions"
+VERSION_DOC_ID = "tenants"
+
+ORG_PROJECTION = {"_id": 1, "status": 1, "plan_id": 1}
+SCHOOL_PROJECTION = {"_id": 1, "org_id": 1, "status": 1}
+
+_tenants = TTLCache(
+    "tenant_status",
+    maxsize=settings.TENANT_STATUS_CACHE_SIZE,
+    ttl=settings.TENANT_STATUS_CACHE_TTL_SECONDS
+)
+
+class _SyncState:
+    version: Optional[int] = None
+    checked_at: float = 0.0
+    lock: Optional[asyncio.Lock] = None
+
+_sync = _SyncState()
+
+async def _sync_version():
+    """
+    Re-read the shared version at most once per TENANT_STATUS_SYNC_SECONDS.
+    This bounds how long another worker's status change can go unnoticed here.
+    """
+    if time.monotonic() - _sync.checked_at < settings.TENANT_STATUS_SYNC_SECONDS:
+        return
+    if _sync.lock is None:
+        _sync.lock = asyncio.Lock()
+
+    async with _sync.lock:
+        if time.monotonic() - _sync.checked_at < settings.TENANT_STATUS_SYNC_SECONDS:
+            return
+        doc = await db.get_db()[VERSION_COLLECTION].find_one({"_id": VERSION_DOC_ID})
+        version = doc.get("version", 0) if doc else 0
+        if version != _sync.version:
+            _tenants.clear()
+            _sync.version = version
+        _sync.checked_at = time.monotonic()
+
+async def get_org(org_id: str) -> Optional[dict]:
+    """
+    Cached {_id, status, plan_id} of an organization, or None if it does not exist.
+    """
+    await _sync_version()
+    key = ("org", org_id)
+    org = _tenants.get(key)
+    if org is None:
+        org = await db.get_db()["organizations"].find_one({"_id": org_id}, ORG_PROJECTION)
+        if org:
+            _tenants.set(key, org)
+    return org
+
+async def get_school(school_id: str) -> Optional[dict]:
+    """
+    Cached {_id, org_id, status} of a school, or None if it does not exist.
+    """
+    await _sync_version()
+    key = ("school", school_id)
+    school = _tenants.get(key)
+    if school is None:
+        school = await db.get_db()["schools"].find_one({"_id": school_id}, SCHOOL_PROJECTION)
+        if school:
+            _tenants.set(key, school)
+    return school
+
+async def is_org_active(org_id: str) -> bool:
+    org = await get_org(org_id)
+    return bool(org) and org.get("status") == "active"
+
+async def is_school_active(school_id: str) -> bool:
+    school = await get_school(school_id)
+    return bool(school) and school.get("status") == "active"
+
+async def bump_tenant_version(org_id: str = None, school_id: str = None):
+    """
+    Call after any write to an org/school status (or plan).
+    Drops the local entry now; other workers follow within TENANT_STATUS_SYNC_SECONDS.
+    """
+    if org_id:
+        _tenants.invalidate(("org", org_id))
+    if school_id:
+        _tenants.invalidate(("school", school_id))
+
+    result = await db.get_db()[VERSION_COLLECTION].find_one_and_update(
+        {"_id": VERSION_DOC_ID},
+        {"$inc": {"version": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    # Our own bump needs no resync
+    if result and _sync.version is not None and result["version"] == _sync.version + 1:
+        _sync.version = result["version"]
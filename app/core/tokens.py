@@ -0,0 +1,85 @@
+import time
+from typing import NamedTuple, Optional, TypedDict
+from fastapi import Request
+from jose import jwt, JWTError
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+class TokenScope(NamedTuple):
+    """
+    How to verify one family of tokens (platform, org, school, student, teacher).
+    token_type=None skips the "type" claim check.
+    """
+    name: str
+    secret_key: str
+    algorithm: str
+    token_type: Optional[str] = None
+
+class TokenClaims(TypedDict, total=False):
+    sub: str
+    type: str
+    exp: int
+    org_id: str
+    school_id: str
+    student_id: str
+    teacher_id: str
+    role: str
+    is_section_coordinator: bool
+
+# Recently verified tokens -> claims. Entries never outlive the token's own exp.
+_verified_tokens = TTLCache(
+    "verified_tokens",
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttl=settings.TOKEN_CACHE_TTL_SECONDS
+)
+
+def verify_token(token: str, scope: TokenScope) -> Optional[TokenClaims]:
+    """
+    Verify signature/exp once and reuse the decoded claims for repeated hits of the same token.
+    Returns None for invalid, expired or wrong-type tokens.
+    """
+    cache_key = (scope.secret_key, token)
+    claims = _verified_tokens.get(cache_key)
+
+    if claims is None:
+        try:
+            claims = jwt.decode(token, scope.secret_key, algorithms=[scope.algorithm])
+        except JWTError:
+            return None
+
+        ttl = settings.TOKEN_CACHE_TTL_SECONDS
+        if claims.get("exp"):
+            ttl = min(ttl, claims["exp"] - time.time())
+        _verified_tokens.set(cache_key, claims, ttl=ttl)
+
+    if scope.token_type and claims.get("type") != scope.token_type:
+        return None
+    return claims
+
+def bearer_token(request: Request) -> Optional[str]:
+    auth_header = request.headers.get("Authorization")
+    if auth_header and auth_header.startswith("Bearer "):
+        return auth_header.split(" ")[1]
+    return None
+
+def verify_request_token(request: Request, scope: TokenScope, token: str = None) -> Optional[TokenClaims]:
+    """
+    Request-scoped verification: middlewares and dependencies share one decode per scope.
+    Results (including failures) are kept on request.state.token_claims[scope.name].
+    """
+    token = token or bearer_token(request)
+    if not token:
+        return None
+
+    verified = getattr(request.state, "token_claims", None)
+    if verified is None:
+        verified = {}
+        request.state.token_claims = verified
+
+    entry = verified.get(scope.name)
+    if entry is not None and entry[0] == token:
+        return entry[1]
+
+    claims = verify_token(token, scope)
+    verified[scope.name] = (token, claims)
+    return claims
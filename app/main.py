@@ -8,11 +8,11 @@ from app.utils.response import APIResponse
 
 from app.core.config import settings
 from app.core.database import db
-from app.middlewares.audit import AuditMiddleware
-from app.middlewares.auth import AuthMiddleware
-from app.middlewares.org_context import OrgContextMiddleware
-from app.middlewares.school_context import SchoolContextMiddleware
-from app.middlewares.school_user_context import SchoolUserContextMiddleware # New
+from app.core.password_hasher import password_hasher
+from app.core.audit_sink import audit_sink
+from app.core.roll_number import roll_number_leases
+from app.core.jobs.runner import job_runner
+from app.middlewares.pipeline import RequestPipelineMiddleware
 from app.modules.auth.service import AuthService
 
 # Routers
@@ -37,6 +37,8 @@ from app.modules.teachers.router import router as teachers_router # New
 from app.modules.teachers.teacher_auth.router import router as teacher_auth_router # New
 from app.modules.teachers.section_coordinators.router import router as section_coordinators_router # New
 from app.modules.salaries.router import router as salaries_router # New
+from app.modules.staff_attendance.router import router as staff_attendance_router
+from app.modules.jobs.router import school_router as jobs_router, platform_router as platform_jobs_router
 from app.modules.teachers.teacher_assignments.router import router as teacher_assignments_router # New
 from app.modules.holidays.router import router as holidays_router # New
 from app.modules.attendance.router import router as attendance_router # New
@@ -48,19 +50,45 @@ from app.modules.reports.attendance_reports.router import (
 )
 from app.modules.holidays.model import ensure_holiday_indexes
 from app.modules.attendance.model import ensure_attendance_indexes
+from app.modules.attendance.rollups import ensure_rollup_indexes
+from app.modules.audit.model import ensure_audit_indexes
+from app.modules.staff_attendance.model import ensure_staff_attendance_indexes
+from app.core.jobs.model import ensure_job_indexes
+from app.modules.academics.classes.model import ensure_class_indexes
+from app.modules.academics.sections.model import ensure_section_indexes
+from app.modules.academics.subjects.model import ensure_subject_indexes
+from app.modules.students.model import ensure_student_indexes
+from app.modules.teachers.model import ensure_teacher_indexes
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     db.connect()
+    await db.warm_up() # minPoolSize connections open before the first request
+    password_hasher.start()
+    audit_sink.start()
     # Init Super Admin
     await AuthService.init_super_admin()
     await ensure_holiday_indexes()
     await ensure_attendance_indexes()
+    await ensure_rollup_indexes()
+    await ensure_audit_indexes()
+    await ensure_staff_attendance_indexes()
+    await ensure_job_indexes()
+    await ensure_class_indexes()
+    await ensure_section_indexes()
+    await ensure_subject_indexes()
+    await ensure_student_indexes()
+    await ensure_teacher_indexes()
+    job_runner.start() # Handlers are registered by the router imports above
     
     yield
     
     # Shutdown
+    await job_runner.stop() # Running jobs go back to the queue for the next worker
+    await roll_number_leases.release_all() # Report leased-but-unissued roll numbers as unused
+    await audit_sink.stop() # Drain queued audit logs before the client closes
+    password_hasher.shutdown()
     db.close()
 
 app = FastAPI(
@@ -97,8 +125,6 @@ async def global_exception_handler(request: Request, exc: Exception):
         data=str(exc) if settings.PROJECT_NAME else None # Show error in dev
     )
 
-from app.middlewares.status_guard import StatusGuardMiddleware
-
 # Middleware
 app.add_middleware(
     CORSMiddleware,
@@ -108,12 +134,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.add_middleware(StatusGuardMiddleware) # Master Status Guard (Runs internal to Auth/Contexts)
-app.add_middleware(AuditMiddleware)
-app.add_middleware(AuthMiddleware) # Platform Auth
-app.add_middleware(OrgContextMiddleware) # Org Context Auth
-app.add_middleware(SchoolContextMiddleware) # School Context Auth
-app.add_middleware(SchoolUserContextMiddleware) # School User Context (New)
+# Auth / Context / Status Guard / Audit as one ASGI layer (checks per route group, see pipeline.py)
+app.add_middleware(RequestPipelineMiddleware)
 
 # --- Platform Routes Group ---
 platform_router = APIRouter()
@@ -124,6 +146,7 @@ platform_router.include_router(plans_router, prefix="/plans", tags=["Platform: P
 platform_router.include_router(sub_router, prefix="/subscriptions", tags=["Platform: Subscriptions"])
 platform_router.include_router(payment_router, prefix="/payments", tags=["Platform: Payments"])
 platform_router.include_router(audit_router, prefix="/audit", tags=["Platform: Audit"])
+platform_router.include_router(platform_jobs_router, tags=["Platform: Jobs"])
 
 # Mount Platform Routes
 app.include_router(platform_router, prefix="/platform")
@@ -153,11 +176,13 @@ school_app_router.include_router(students_router, tags=["School: Students"])
 school_app_router.include_router(teachers_router, tags=["School: Teachers"]) # New
 school_app_router.include_router(section_coordinators_router, tags=["School: Coordinators"]) # New
 school_app_router.include_router(salaries_router, tags=["School: Salaries"]) # New
+school_app_router.include_router(staff_attendance_router, tags=["School: Staff Attendance"])
 school_app_router.include_router(teacher_assignments_router, tags=["School: Class Teacher Assignments"]) # Admin Access
 school_app_router.include_router(holidays_router, tags=["School: Holidays"]) # New
 school_app_router.include_router(attendance_router, tags=["School: Attendance"]) # New
 school_app_router.include_router(attendance_corrections_admin_router, tags=["School: Attendance Corrections"]) # New
 school_app_router.include_router(attendance_reports_router, tags=["School: Attendance Reports"]) # New
+school_app_router.include_router(jobs_router, tags=["School: Jobs"])
 
 # Mount School Routes
 app.include_router(school_app_router, prefix="/school")
@@ -1,40 +1,34 @@
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
 import time
 import logging
+from app.core.audit_sink import audit_sink
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("audit")
 
-class AuditMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        
-        # Process request
-        response = await call_next(request)
-        
-        process_time = time.time() - start_time
-        
-        # Log details
-        log_data = {
-            "method": request.method,
-            "url": str(request.url),
-            "client": request.client.host if request.client else "unknown",
-            "status_code": response.status_code,
-            "process_time": process_time,
-            "timestamp": time.time(),
-            "user_id": getattr(request.state, "user_id", None) or getattr(request.state, "org_id", None) 
-        }
-        
-        # Async insert to DB
-        try:
-            from app.core.database import db
-            if db.client:
-                database = db.get_db()
-                await database["audit_logs"].insert_one(log_data)
-        except Exception as e:
-            logger.error(f"Failed to write audit log: {e}")
+async def write_audit_log(request: Request, status_code: int, start_time: float):
+    """
+    Queue one request for audit_logs. Called by the pipeline after the response is sent;
+    the actual insert happens in batches (see app/core/audit_sink.py).
+    """
+    path = request.url.path
+    if not audit_sink.should_record(path, status_code):
+        return
 
-        logger.info(f"AUDIT LOG: {log_data}")
-        
-        return response
+    process_time = time.time() - start_time
+
+    # Log details
+    log_data = {
+        "method": request.method,
+        "url": str(request.url),
+        "path": path,
+        "client": request.client.host if request.client else "unknown",
+        "status_code": status_code,
+        "process_time": process_time,
+        "timestamp": time.time(),
+        "user_id": getattr(request.state, "user_id", None) or getattr(request.state, "org_id", None)
+    }
+
+    audit_sink.submit(log_data)
+
+    logger.debug(f"AUDIT LOG: {log_data}")
@@ -1,35 +1,38 @@
-from fastapi import Request, HTTPException, status
+from typing import Optional
+from fastapi import Request, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
 from app.core.config import settings
-from jose import jwt, JWTError
+from app.core.security import PLATFORM_TOKEN_SCOPE
+from app.core.tokens import bearer_token, verify_request_token
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path.startswith("/platform"):
-            # Exclude login endpoint
-            if request.url.path.startswith("/platform/auth/login") or request.url.path.startswith("/platform/auth/token") or request.url.path.startswith("/platform/payments/webhook"):
-                 return await call_next(request)
-            
-            # Allow OpenAPI docs
-            if request.url.path.startswith(f"{settings.API_V1_STR}/openapi.json") or request.url.path.startswith("/docs") or request.url.path.startswith("/redoc"):
-                 return await call_next(request)
+async def platform_auth_check(request: Request) -> Optional[Response]:
+    """
+    Platform Auth (/platform group).
+    Returns an error response to short-circuit, or None to continue.
+    """
+    path = request.url.path
 
-            auth_header = request.headers.get("Authorization")
-            if not auth_header or not auth_header.startswith("Bearer "):
-                 return JSONResponse(
-                     status_code=status.HTTP_401_UNAUTHORIZED,
-                     content={"detail": "Missing or invalid authentication token"}
-                 )
-            
-            token = auth_header.split(" ")[1]
-            try:
-                jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            except JWTError:
-                 return JSONResponse(
-                     status_code=status.HTTP_401_UNAUTHORIZED,
-                     content={"detail": "Invalid token"}
-                 )
+    # Exclude login endpoint
+    if path.startswith("/platform/auth/login") or path.startswith("/platform/auth/token") or path.startswith("/platform/payments/webhook"):
+        return None
 
-        response = await call_next(request)
-        return response
+    # Allow OpenAPI docs
+    if path.startswith(f"{settings.API_V1_STR}/openapi.json") or path.startswith("/docs") or path.startswith("/redoc"):
+        return None
+
+    token = bearer_token(request)
+    if not token:
+        return JSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": "Missing or invalid authentication token"}
+        )
+
+    # Claims are kept on request.state for get_current_user
+    if not verify_request_token(request, PLATFORM_TOKEN_SCOPE, token):
+        return JSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": "Invalid token"}
+        )
+
+    return None
@@ -0,0 +1,69 @@
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from fastapi import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.middlewares.audit import write_audit_log
+from app.middlewares.auth import platform_auth_check
+from app.middlewares.org_context import org_context_check
+from app.middlewares.school_context import school_context_check
+from app.middlewares.school_user_context import school_user_context_check
+from app.middlewares.status_guard import status_guard_check
+from app.utils.dependent_details import identity_map_scope
+
+# A check either returns a response (reject / short-circuit) or None (continue)
+RequestCheck = Callable[[Request], Awaitable[Optional[Response]]]
+
+# Route group (first path segment) -> checks, run in order.
+# Groups not listed here (/, /public, docs) run no checks.
+ROUTE_GROUP_CHECKS: Dict[str, Tuple[RequestCheck, ...]] = {
+    "platform": (platform_auth_check,),
+    "org": (org_context_check, status_guard_check),
+    "school": (school_user_context_check, school_context_check, status_guard_check),
+    # Student / Teacher tokens are enforced by their get_current_* dependencies
+    "student": (),
+    "teacher": (),
+}
+
+def route_group(path: str) -> str:
+    return path.split("/", 2)[1] if path.startswith("/") else ""
+
+class RequestPipelineMiddleware:
+    """
+    Single pure-ASGI layer replacing the per-concern BaseHTTPMiddleware stack.
+    Looks up the route group once, runs only that group's checks, then calls the app
+    with the original send (streaming responses pass through untouched) and
+    writes the audit log once the response has been sent. The app runs inside a
+    request-scoped identity map for fetch_dependent_details.
+    """
+
+    def __init__(self, app: ASGIApp, route_checks: Dict[str, Tuple[RequestCheck, ...]] = None):
+        self.app = app
+        self.route_checks = ROUTE_GROUP_CHECKS if route_checks is None else route_checks
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.time()
+        request = Request(scope, receive)
+        status_code = 500
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            for check in self.route_checks.get(route_group(scope["path"]), ()):
+                response = await check(request)
+                if response is not None:
+                    await response(scope, receive, send_with_status)
+                    return
+
+            with identity_map_scope(): # Dependent documents are fetched once per request
+                await self.app(scope, receive, send_with_status)
+        finally:
+            await write_audit_log(request, status_code, start_time)
@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
 import uuid
+from app.core.database import db
+import pymongo
 
 class Class(BaseModel):
     id: str = Field(default_factory=lambda: f"cls_{uuid.uuid4().hex[:8]}", alias="_id")
@@ -21,3 +23,19 @@ class Class(BaseModel):
         populate_by_name=True,
         json_encoders={datetime: lambda v: v.isoformat()}
     )
+
+async def ensure_class_indexes():
+    """
+    Index for the class list: school + status filter, then the keyset sort (class_order, _id).
+    """
+    if db.client:
+        collection = db.get_db()["classes"]
+        await collection.create_index(
+            [
+                ("school_id", pymongo.ASCENDING),
+                ("status", pymongo.ASCENDING),
+                ("class_order", pymongo.ASCENDING),
+                ("_id", pymongo.ASCENDING)
+            ],
+            name="class_list_idx"
+        )
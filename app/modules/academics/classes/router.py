@@ -23,22 +23,22 @@ async def create_class(
 @router.get("")
 async def list_classes(
     status: str = "active",
-    page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Add estimated_total (cached count) to meta"),
     class_name: Optional[str] = None,
     current_user: dict = Depends(get_current_school_user)
 ):
     school_id = current_user["school_id"]
-    items, total = await ClassService.get_classes(school_id, status, page, limit, class_name)
+    page = await ClassService.get_classes(school_id, status, limit, cursor, class_name, with_total=include_total)
     
     meta = {
-        "total": total,
-        "page": page,
         "limit": limit,
-        "pages": (total + limit - 1) // limit if limit > 0 else 0
+        "next_cursor": page["next_cursor"],
+        "estimated_total": page["estimated_total"]
     }
     
-    return APIResponse.success([ClassResponse(**c) for c in items], "Classes retrieved", meta=meta)
+    return APIResponse.success(page["items"], "Classes retrieved", meta=meta)
 
 @router.get("/{class_id}")
 async def get_class(
@@ -3,9 +3,17 @@ from typing import Optional
 from fastapi import HTTPException
 from app.core.database import get_database
 from app.modules.academics.classes.model import Class
-from app.modules.academics.classes.schema import CreateClassRequest, UpdateClassRequest
+from app.modules.academics.classes.schema import CreateClassRequest, UpdateClassRequest, ClassResponse
+from app.utils.pagination import keyset_page
+from app.utils.projection import model_projection
 import pymongo
 
+# List order; _id breaks ties between classes with the same order
+SORT = [("class_order", 1), ("_id", 1)]
+
+# List rows are returned as stored, in ClassResponse shape (no per-row model)
+LIST_PROJECTION = model_projection(ClassResponse)
+
 class ClassService:
     @staticmethod
     async def create_class(org_id: str, school_id: str, user_id: str, data: CreateClassRequest):
@@ -35,20 +43,27 @@ class ClassService:
         return new_class
 
     @staticmethod
-    async def get_classes(school_id: str, status: str = "active", page: int = 1, limit: int = 10, class_name: Optional[str] = None):
+    async def get_classes(
+        school_id: str,
+        status: str = "active",
+        limit: int = 10,
+        cursor: Optional[str] = None,
+        class_name: Optional[str] = None,
+        with_total: bool = False
+    ) -> dict:
         db = await get_database()
         
         query = {"school_id": school_id, "status": status}
         if class_name:
             query["class_name"] = {"$regex": class_name, "$options": "i"}
             
-        skip = (page - 1) * limit
-        
-        cursor = db["classes"].find(query).sort("class_order", 1).skip(skip).limit(limit)
-        items = await cursor.to_list(length=limit)
-        total = await db["classes"].count_documents(query)
-        
-        return items, total
+        try:
+            return await keyset_page(
+                db["classes"], query, SORT, limit, cursor=cursor,
+                projection=LIST_PROJECTION, with_total=with_total
+            )
+        except ValueError as e:
+            raise HTTPException(400, str(e))
 
     @staticmethod
     async def get_class_by_id(school_id: str, class_id: str):
@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
 import uuid
+from app.core.database import db
+import pymongo
 
 class Section(BaseModel):
     id: str = Field(default_factory=lambda: f"sec_{uuid.uuid4().hex[:8]}", alias="_id")
@@ -22,3 +24,29 @@ class Section(BaseModel):
         populate_by_name=True,
         json_encoders={datetime: lambda v: v.isoformat()}
     )
+
+async def ensure_section_indexes():
+    """
+    Indexes for the section lists, school-wide and per class, ending in the keyset sort (section_name, _id).
+    """
+    if db.client:
+        collection = db.get_db()["sections"]
+        await collection.create_index(
+            [
+                ("school_id", pymongo.ASCENDING),
+                ("status", pymongo.ASCENDING),
+                ("section_name", pymongo.ASCENDING),
+                ("_id", pymongo.ASCENDING)
+            ],
+            name="section_list_idx"
+        )
+        await collection.create_index(
+            [
+                ("school_id", pymongo.ASCENDING),
+                ("class_id", pymongo.ASCENDING),
+                ("status", pymongo.ASCENDING),
+                ("section_name", pymongo.ASCENDING),
+                ("_id", pymongo.ASCENDING)
+            ],
+            name="class_section_list_idx"
+        )
@@ -11,23 +11,23 @@ router = APIRouter()
 @router.get("/all-sections")
 async def list_all_sections(
     status: str = "active",
-    page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Add estimated_total (cached count) to meta"),
     section_name: Optional[str] = None,
     class_id: Optional[str] = None, # Allow filtering by class_id here too if user wants
     current_user: dict = Depends(get_current_school_user)
 ):
     school_id = current_user["school_id"]
     # Provide class_id=None to fetch all (or specific if filtered)
-    items, total = await SectionService.get_sections(school_id, class_id, status, page, limit, section_name)
+    page = await SectionService.get_sections(school_id, class_id, status, limit, cursor, section_name, with_total=include_total)
     
     meta = {
-        "total": total,
-        "page": page,
         "limit": limit,
-        "pages": (total + limit - 1) // limit if limit > 0 else 0
+        "next_cursor": page["next_cursor"],
+        "estimated_total": page["estimated_total"]
     }
-    return APIResponse.success([SectionResponse(**s) for s in items], "All sections retrieved", meta=meta)
+    return APIResponse.success(page["items"], "All sections retrieved", meta=meta)
 
 @router.post("/{class_id}/sections")
 async def create_section(
@@ -46,21 +46,21 @@ async def create_section(
 async def list_sections(
     class_id: str,
     status: str = "active",
-    page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Add estimated_total (cached count) to meta"),
     section_name: Optional[str] = None,
     current_user: dict = Depends(get_current_school_user)
 ):
     school_id = current_user["school_id"]
-    items, total = await SectionService.get_sections(school_id, class_id, status, page, limit, section_name)
+    page = await SectionService.get_sections(school_id, class_id, status, limit, cursor, section_name, with_total=include_total)
     
     meta = {
-        "total": total,
-        "page": page,
         "limit": limit,
-        "pages": (total + limit - 1) // limit if limit > 0 else 0
+        "next_cursor": page["next_cursor"],
+        "estimated_total": page["estimated_total"]
     }
-    return APIResponse.success([SectionResponse(**s) for s in items], "Sections retrieved", meta=meta)
+    return APIResponse.success(page["items"], "Sections retrieved", meta=meta)
 
 @router.get("/{class_id}/sections/{section_id}")
 async def get_section(
@@ -3,9 +3,17 @@ from typing import Optional
 from fastapi import HTTPException
 from app.core.database import get_database
 from app.modules.academics.sections.model import Section
-from app.modules.academics.sections.schema import CreateSectionRequest, UpdateSectionRequest
+from app.modules.academics.sections.schema import CreateSectionRequest, UpdateSectionRequest, SectionResponse
+from app.utils.pagination import keyset_page
+from app.utils.projection import model_projection
 import pymongo
 
+# List order; _id breaks ties between same-named sections of different classes
+SORT = [("section_name", 1), ("_id", 1)]
+
+# List rows are returned as stored, in SectionResponse shape (no per-row model)
+LIST_PROJECTION = model_projection(SectionResponse)
+
 class SectionService:
     @staticmethod
     async def create_section(org_id: str, school_id: str, user_id: str, class_id: str, data: CreateSectionRequest):
@@ -45,10 +53,11 @@ class SectionService:
         school_id: str, 
         class_id: Optional[str] = None, 
         status: str = "active",
-        page: int = 1,
         limit: int = 10,
-        section_name: Optional[str] = None
-    ):
+        cursor: Optional[str] = None,
+        section_name: Optional[str] = None,
+        with_total: bool = False
+    ) -> dict:
         db = await get_database()
         
         query = {"school_id": school_id, "status": status}
@@ -57,13 +66,13 @@ class SectionService:
         if section_name:
             query["section_name"] = {"$regex": section_name, "$options": "i"}
             
-        skip = (page - 1) * limit
-            
-        cursor = db["sections"].find(query).sort("section_name", 1).skip(skip).limit(limit)
-        items = await cursor.to_list(length=limit)
-        total = await db["sections"].count_documents(query)
-        
-        return items, total
+        try:
+            return await keyset_page(
+                db["sections"], query, SORT, limit, cursor=cursor,
+                projection=LIST_PROJECTION, with_total=with_total
+            )
+        except ValueError as e:
+            raise HTTPException(400, str(e))
 
     @staticmethod
     async def get_section_by_id(school_id: str, section_id: str):
@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field, ConfigDict
 import uuid
+from app.core.database import db
+import pymongo
 
 class Subject(BaseModel):
     id: str = Field(default_factory=lambda: f"sub_{uuid.uuid4().hex[:8]}", alias="_id")
@@ -23,3 +25,29 @@ class Subject(BaseModel):
         populate_by_name=True,
         json_encoders={datetime: lambda v: v.isoformat()}
     )
+
+async def ensure_subject_indexes():
+    """
+    Indexes for the subject lists, school-wide and per class, ending in the keyset sort (subject_name, _id).
+    """
+    if db.client:
+        collection = db.get_db()["subjects"]
+        await collection.create_index(
+            [
+                ("school_id", pymongo.ASCENDING),
+                ("status", pymongo.ASCENDING),
+                ("subject_name", pymongo.ASCENDING),
+                ("_id", pymongo.ASCENDING)
+            ],
+            name="subject_list_idx"
+        )
+        await collection.create_index(
+            [
+                ("school_id", pymongo.ASCENDING),
+                ("class_id", pymongo.ASCENDING),
+                ("status", pymongo.ASCENDING),
+                ("subject_name", pymongo.ASCENDING),
+                ("_id", pymongo.ASCENDING)
+            ],
+            name="class_subject_list_idx"
+        )
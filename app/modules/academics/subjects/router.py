@@ -11,24 +11,24 @@ router = APIRouter()
 @router.get("/all-subjects")
 async def list_all_subjects(
     status: str = "active",
-    page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Add estimated_total (cached count) to meta"),
     subject_name: Optional[str] = None,
     subject_code: Optional[str] = None,
     current_user: dict = Depends(get_current_school_user)
 ):
     school_id = current_user["school_id"]
-    items, total = await SubjectService.get_subjects(
-        school_id, None, status, page, limit, subject_name, subject_code
+    page = await SubjectService.get_subjects(
+        school_id, None, status, limit, cursor, subject_name, subject_code, with_total=include_total
     )
     
     meta = {
-        "total": total,
-        "page": page,
         "limit": limit,
-        "pages": (total + limit - 1) // limit if limit > 0 else 0
+        "next_cursor": page["next_cursor"],
+        "estimated_total": page["estimated_total"]
     }
-    return APIResponse.success([SubjectResponse(**s) for s in items], "All subjects retrieved", meta=meta)
+    return APIResponse.success(page["items"], "All subjects retrieved", meta=meta)
 
 @router.post("/{class_id}/subjects")
 async def create_subject(
@@ -47,23 +47,23 @@ async def create_subject(
 async def list_subjects(
     class_id: str,
     status: str = "active",
-    page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Add estimated_total (cached count) to meta"),
     subject_name: Optional[str] = None, # Allow filtering within class too
     current_user: dict = Depends(get_current_school_user)
 ):
     school_id = current_user["school_id"]
-    items, total = await SubjectService.get_subjects(
-        school_id, class_id, status, page, limit, subject_name
+    page = await SubjectService.get_subjects(
+        school_id, class_id, status, limit, cursor, subject_name, with_total=include_total
     )
     
     meta = {
-        "total": total,
-        "page": page,
         "limit": limit,
-        "pages": (total + limit - 1) // limit if limit > 0 else 0
+        "next_cursor": page["next_cursor"],
+        "estimated_total": page["estimated_total"]
     }
-    return APIResponse.success([SubjectResponse(**s) for s in items], "Subjects retrieved", meta=meta)
+    return APIResponse.success(page["items"], "Subjects retrieved", meta=meta)
 
 @router.get("/{class_id}/subjects/{subject_id}")
 async def get_subject(
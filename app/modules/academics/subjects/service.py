@@ -3,9 +3,17 @@ from typing import Optional
 from fastapi import HTTPException
 from app.core.database import get_database
 from app.modules.academics.subjects.model import Subject
-from app.modules.academics.subjects.schema import CreateSubjectRequest, UpdateSubjectRequest
+from app.modules.academics.subjects.schema import CreateSubjectRequest, UpdateSubjectRequest, SubjectResponse
+from app.utils.pagination import keyset_page
+from app.utils.projection import model_projection
 import pymongo
 
+# List order; _id breaks ties between same-named subjects of different classes
+SORT = [("subject_name", 1), ("_id", 1)]
+
+# List rows are returned as stored, in SubjectResponse shape (no per-row model)
+LIST_PROJECTION = model_projection(SubjectResponse)
+
 class SubjectService:
     @staticmethod
     async def create_subject(org_id: str, school_id: str, user_id: str, class_id: str, data: CreateSubjectRequest):
@@ -49,12 +57,13 @@ class SubjectService:
         school_id: str, 
         class_id: Optional[str] = None, 
         status: str = "active",
-        page: int = 1,
         limit: int = 10,
+        cursor: Optional[str] = None,
         subject_name: Optional[str] = None,
         subject_code: Optional[str] = None,
-        is_optional: Optional[bool] = None
-    ):
+        is_optional: Optional[bool] = None,
+        with_total: bool = False
+    ) -> dict:
         db = await get_database()
         query = {"school_id": school_id, "status": status}
         if class_id:
@@ -66,13 +75,13 @@ class SubjectService:
         if is_optional is not None:
             query["is_optional"] = is_optional
             
-        skip = (page - 1) * limit
-            
-        cursor = db["subjects"].find(query).sort("subject_name", 1).skip(skip).limit(limit)
-        items = await cursor.to_list(length=limit)
-        total = await db["subjects"].count_documents(query)
-        
-        return items, total
+        try:
+            return await keyset_page(
+                db["subjects"], query, SORT, limit, cursor=cursor,
+                projection=LIST_PROJECTION, with_total=with_total
+            )
+        except ValueError as e:
+            raise HTTPException(400, str(e))
     
     @staticmethod
     async def get_subject_by_id(school_id: str, subject_id: str):
@@ -7,6 +7,8 @@ from app.modules.attendance.model import COLLECTION_NAME as ATTENDANCE_COLLECTIO
 from app.modules.attendance.attendance_corrections.model import AttendanceCorrectionModel, COLLECTION_NAME as CORRECTION_COLLECTION
 from app.modules.attendance.attendance_corrections.schema import CreateCorrectionRequest, ReviewDetails, CorrectionUser
 from app.core.permissions import is_section_coordinator 
+from pymongo import ReturnDocument
+from app.modules.attendance.rollups import apply_rollup_delta
 
 class AttendanceCorrectionService:
     
@@ -203,11 +205,20 @@ class AttendanceCorrectionService:
                 }
             }
             
-            res = await database[ATTENDANCE_COLLECTION].update_one(filter_query, update_query)
+            before = await database[ATTENDANCE_COLLECTION].find_one_and_update(
+                filter_query, update_query, return_document=ReturnDocument.BEFORE
+            )
             
-            if res.modified_count == 0:
+            if not before:
                  raise HTTPException(status_code=500, detail="Failed to apply correction to attendance record.")
             
+            # Rollups: only this student's status moves
+            after = {**before, "records": [
+                {**r, "status": correction["requested_status"]} if r.get("student_id") == correction["student_id"] else r
+                for r in before["records"]
+            ]}
+            await apply_rollup_delta(before, after)
+            
             # 2. Update Correction Status
             updates = {
                 "status": "ADMIN_APPROVED",
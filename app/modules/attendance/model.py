@@ -27,3 +27,13 @@ async def ensure_attendance_indexes():
             unique=True,
             name="unique_attendance_submission_idx"
         )
+
+        # Student portal reports: find one student's submissions without scanning the section
+        await collection.create_index(
+            [
+                ("school_id", pymongo.ASCENDING),
+                ("records.student_id", pymongo.ASCENDING),
+                ("date", pymongo.ASCENDING)
+            ],
+            name="student_attendance_student_idx"
+        )
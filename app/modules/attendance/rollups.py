@@ -0,0 +1,229 @@
+"""
+Materialized attendance rollups (collection: attendance_rollups).
+
+Two kinds of documents, both counting only APPROVED + locked submissions
+(the same rows the reports used to $unwind):
+
+  section_day    one per school / academic year / section / date
+  student_month  one per school / academic year / student / month / section
+                 (a student who moves mid-month has one per section)
+
+counts = {"total": n, "<record status>": n, ...}
+
+Writers call apply_rollup_delta(before, after) with the attendance document
+before and after their write; only the difference is $inc-ed.
+rebuild_attendance_rollups() recomputes everything from student_attendance.
+
+Rebuild command:
+    python -m app.modules.attendance.rollups [school_id]
+"""
+from collections import Counter
+from typing import Dict, Optional, Tuple
+import pymongo
+from pymongo import UpdateOne
+from app.core.database import db
+from app.core.jobs.queue import job_handler
+from app.core.jobs.runner import JobContext
+from app.core.report_cache import ALL, RECORDS, bump_attendance_versions, date_scope, section_scope
+from app.modules.attendance.model import COLLECTION_NAME as ATTENDANCE_COLLECTION
+
+ROLLUP_COLLECTION = "attendance_rollups"
+
+SECTION_DAY = "section_day"
+STUDENT_MONTH = "student_month"
+
+def section_day_id(school_id: str, academic_year: str, section_id: str, day: str) -> str:
+    return f"{SECTION_DAY}:{school_id}:{academic_year}:{section_id}:{day}"
+
+def student_month_id(school_id: str, academic_year: str, student_id: str, month: str, section_id: str) -> str:
+    return f"{STUDENT_MONTH}:{school_id}:{academic_year}:{student_id}:{month}:{section_id}"
+
+async def ensure_rollup_indexes():
+    if db.client:
+        collection = db.get_db()[ROLLUP_COLLECTION]
+        # Section scans: daily summary (by date), section month / trend (by section)
+        await collection.create_index(
+            [("kind", pymongo.ASCENDING), ("school_id", pymongo.ASCENDING),
+             ("academic_year", pymongo.ASCENDING), ("date", pymongo.ASCENDING)],
+            name="kind_school_year_date_idx"
+        )
+        await collection.create_index(
+            [("kind", pymongo.ASCENDING), ("school_id", pymongo.ASCENDING),
+             ("section_id", pymongo.ASCENDING), ("month", pymongo.ASCENDING)],
+            name="kind_school_section_month_idx"
+        )
+        # Student months: defaulters (by month), student reports (by student)
+        await collection.create_index(
+            [("kind", pymongo.ASCENDING), ("school_id", pymongo.ASCENDING),
+             ("month", pymongo.ASCENDING), ("section_id", pymongo.ASCENDING)],
+            name="kind_school_month_section_idx"
+        )
+        await collection.create_index(
+            [("kind", pymongo.ASCENDING), ("school_id", pymongo.ASCENDING),
+             ("student_id", pymongo.ASCENDING), ("month", pymongo.ASCENDING)],
+            name="kind_school_student_month_idx"
+        )
+
+def _counts(doc: Optional[dict]) -> Tuple[Counter, Dict[str, Counter]]:
+    """
+    Contribution of one attendance document: (section counts, per-student counts).
+    Only approved, locked submissions count.
+    """
+    section, students = Counter(), {}
+    if not doc or doc.get("status") != "APPROVED" or not doc.get("locked"):
+        return section, students
+
+    for record in doc.get("records", []):
+        status = record.get("status")
+        student_id = record.get("student_id")
+        if not status or not student_id:
+            continue
+        section["total"] += 1
+        section[status] += 1
+        per_student = students.setdefault(student_id, Counter())
+        per_student["total"] += 1
+        per_student[status] += 1
+    return section, students
+
+def _inc(after: Counter, before: Counter) -> dict:
+    return {
+        f"counts.{key}": after.get(key, 0) - before.get(key, 0)
+        for key in set(after) | set(before)
+        if after.get(key, 0) != before.get(key, 0)
+    }
+
+async def apply_rollup_delta(before: Optional[dict], after: Optional[dict]):
+    """
+    $inc the rollups by after - before. Either side may be None (insert / delete).
+    Both documents must describe the same school / section / date.
+    """
+    ref = after or before
+    if not ref:
+        return
+
+    section_before, students_before = _counts(before)
+    section_after, students_after = _counts(after)
+
+    school_id = ref["school_id"]
+    academic_year = ref["academic_year"]
+    day = ref["date"]
+    month = day[:7]
+    placement = {"class_id": ref.get("class_id"), "section_id": ref.get("section_id")}
+
+    ops = []
+    section_inc = _inc(section_after, section_before)
+    if section_inc:
+        ops.append(UpdateOne(
+            {"_id": section_day_id(school_id, academic_year, ref.get("section_id"), day)},
+            {
+                "$inc": section_inc,
+                "$setOnInsert": {
+                    "kind": SECTION_DAY, "school_id": school_id, "academic_year": academic_year,
+                    "date": day, "month": month, **placement
+                }
+            },
+            upsert=True
+        ))
+
+    for student_id in set(students_before) | set(students_after):
+        student_inc = _inc(students_after.get(student_id, Counter()), students_before.get(student_id, Counter()))
+        if not student_inc:
+            continue
+        ops.append(UpdateOne(
+            {"_id": student_month_id(school_id, academic_year, student_id, month, ref.get("section_id"))},
+            {
+                "$inc": student_inc,
+                "$setOnInsert": {
+                    "kind": STUDENT_MONTH, "school_id": school_id, "academic_year": academic_year,
+                    "student_id": student_id, "month": month, **placement
+                }
+            },
+            upsert=True
+        ))
+
+    if ops:
+        await db.get_db()[ROLLUP_COLLECTION].bulk_write(ops, ordered=False)
+        await bump_attendance_versions(school_id, RECORDS, section_scope(ref.get("section_id")), date_scope(day))
+
+def _rebuild_pipeline(match: dict, kind: str) -> list:
+    """
+    Server-side recompute of one rollup kind, written with $merge (replaces existing docs).
+    """
+    if kind == SECTION_DAY:
+        key = {"school_id": "$school_id", "academic_year": "$academic_year", "section_id": "$section_id", "date": "$date"}
+        doc_id = {"$concat": [SECTION_DAY, ":", "$_id.school_id", ":", "$_id.academic_year", ":", "$_id.section_id", ":", "$_id.date"]}
+        fields = {"date": "$_id.date", "month": {"$substrCP": ["$_id.date", 0, 7]}, "section_id": "$_id.section_id", "class_id": 1}
+    else:
+        key = {"school_id": "$school_id", "academic_year": "$academic_year", "student_id": "$records.student_id", "month": {"$substrCP": ["$date", 0, 7]}, "section_id": "$section_id"}
+        doc_id = {"$concat": [STUDENT_MONTH, ":", "$_id.school_id", ":", "$_id.academic_year", ":", "$_id.student_id", ":", "$_id.month", ":", "$_id.section_id"]}
+        fields = {"student_id": "$_id.student_id", "month": "$_id.month", "section_id": "$_id.section_id", "class_id": 1}
+
+    return [
+        {"$match": {**match, "status": "APPROVED", "locked": True}},
+        {"$unwind": "$records"},
+        {"$sort": {"date": 1}},
+        # Per status first, then fold the statuses into one counts document
+        {"$group": {
+            "_id": {**key, "status": "$records.status"},
+            "n": {"$sum": 1},
+            "class_id": {"$last": "$class_id"},
+            "section_id": {"$last": "$section_id"}
+        }},
+        {"$group": {
+            "_id": {k: f"$_id.{k}" for k in key},
+            "statuses": {"$push": {"k": "$_id.status", "v": "$n"}},
+            "total": {"$sum": "$n"},
+            "class_id": {"$last": "$class_id"},
+            "section_id": {"$last": "$section_id"}
+        }},
+        {"$project": {
+            "_id": doc_id,
+            "kind": {"$literal": kind},
+            "school_id": "$_id.school_id",
+            "academic_year": "$_id.academic_year",
+            **fields,
+            "counts": {"$mergeObjects": [{"$arrayToObject": "$statuses"}, {"total": "$total"}]}
+        }},
+        {"$merge": {"into": ROLLUP_COLLECTION, "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}}
+    ]
+
+async def rebuild_attendance_rollups(school_id: str = None) -> dict:
+    """
+    Recompute rollups from student_attendance (all schools, or one).
+    Run while attendance for that scope is quiet; concurrent writes may need another rebuild.
+    """
+    database = db.get_db()
+    match = {"school_id": school_id} if school_id else {}
+
+    deleted = await database[ROLLUP_COLLECTION].delete_many(match)
+    for kind in (SECTION_DAY, STUDENT_MONTH):
+        await database[ATTENDANCE_COLLECTION].aggregate(_rebuild_pipeline(match, kind)).to_list(length=None)
+
+    # Cached reports of the rebuilt schools are no longer valid
+    for rebuilt_school_id in ([school_id] if school_id else await database[ROLLUP_COLLECTION].distinct("school_id")):
+        await bump_attendance_versions(rebuilt_school_id, ALL)
+
+    return {
+        "school_id": school_id,
+        "deleted": deleted.deleted_count,
+        "section_day": await database[ROLLUP_COLLECTION].count_documents({**match, "kind": SECTION_DAY}),
+        "student_month": await database[ROLLUP_COLLECTION].count_documents({**match, "kind": STUDENT_MONTH})
+    }
+
+@job_handler("attendance_rollup_rebuild")
+async def run_rollup_rebuild(job: JobContext) -> dict:
+    # Safe to retry: the rebuild replaces the school's rollups wholesale
+    return await rebuild_attendance_rollups(school_id=job.payload["school_id"])
+
+if __name__ == "__main__":
+    import asyncio
+    import sys
+
+    async def _main():
+        db.connect()
+        try:
+            print(await rebuild_attendance_rollups(sys.argv[1] if len(sys.argv) > 1 else None))
+        finally:
+            db.close()
+
+    asyncio.run(_main())
@@ -6,6 +6,9 @@ from app.modules.attendance.schema import (
     SetPolicyRequest, PolicyResponse
 )
 from app.modules.attendance.service import AttendanceService
+from app.modules.attendance.rollups import run_rollup_rebuild # Registers the attendance_rollup_rebuild job handler
+from app.core.jobs.queue import enqueue
+from app.modules.jobs.schema import JobResponse
 
 router = APIRouter()
 
@@ -98,3 +101,32 @@ async def review_attendance(
         "data": result
     }
 
+
+@router.post("/attendance-rollups/rebuild", response_model=JobResponse, status_code=202)
+async def rebuild_rollups(
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    Rebuild this school's attendance rollups from student_attendance (School Admin Only).
+    - Only needed after manual data fixes; normal writes keep rollups current.
+    - Runs as a background job; poll /school/jobs/{job_id} for the result.
+    """
+    if current_user["role"] != "SCHOOL_ADMIN":
+         raise HTTPException(
+            status_code=403,
+            detail="Only School Admin can rebuild attendance rollups."
+        )
+
+    job = await enqueue(
+        kind="attendance_rollup_rebuild",
+        payload={"school_id": current_user["school_id"]},
+        school_id=current_user["school_id"],
+        org_id=current_user.get("org_id"),
+        created_by=current_user["_id"]
+    )
+
+    return {
+        "success": True,
+        "message": "Attendance rollup rebuild queued",
+        "data": job
+    }
@@ -1,6 +1,7 @@
 from datetime import datetime, date
 from uuid import uuid4
 from typing import Optional
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError
 from fastapi import HTTPException, status
 
@@ -8,6 +9,7 @@ from app.core.database import db
 from app.core.school_settings import SchoolSettings
 from app.core.permissions import is_section_coordinator, validate_teacher_assignment
 from app.modules.attendance.model import COLLECTION_NAME
+from app.modules.attendance.rollups import apply_rollup_delta
 from app.modules.attendance.schema import MarkAttendanceRequest, ReviewAttendanceRequest
 from app.modules.holidays.service import HolidayService
 from app.core.academic_year import get_current_academic_year
@@ -117,12 +119,17 @@ class AttendanceService:
                 "remarks": None
             }
             
-        result = await database[COLLECTION_NAME].update_one(query, update_doc, upsert=True)
+        # BEFORE image from the write itself, so the rollup delta matches exactly what was replaced
+        before = await database[COLLECTION_NAME].find_one_and_update(
+            query, update_doc, upsert=True, return_document=ReturnDocument.BEFORE
+        )
+        after = {**query, **update_doc["$set"]}
+        await apply_rollup_delta(before, after)
         
         # Return merged/updated doc
         doc = request.model_dump()
         doc.update({
-            "_id": str(existing["_id"]) if existing else str(result.upserted_id),
+            "_id": str(before["_id"]) if before else update_doc["$setOnInsert"]["_id"],
             "status": validation_result["status"],
             "locked": validation_result["locked"]
         })
@@ -169,10 +176,12 @@ class AttendanceService:
             }
         }
         
-        await database[COLLECTION_NAME].update_one(
+        before = await database[COLLECTION_NAME].find_one_and_update(
             {"_id": attendance_id},
-            {"$set": update_data}
+            {"$set": update_data},
+            return_document=ReturnDocument.BEFORE
         )
+        await apply_rollup_delta(before, {**before, **update_data} if before else None)
         
         record.update(update_data)
         record["_id"] = str(record["_id"])
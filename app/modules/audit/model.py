@@ -0,0 +1,32 @@
+from app.core.database import db
+import pymongo
+
+COLLECTION_NAME = "audit_logs"
+ARCHIVE_PREFIX = "audit_logs_archive_" # + YYYY_MM
+
+async def ensure_audit_indexes():
+    """
+    Indexes backing keyset pagination on (timestamp, _id) and its filters.
+    Every filter index ends in timestamp/_id so filtered pages are still index-ordered.
+    """
+    if db.client:
+        database = db.get_db()
+        collection = database[COLLECTION_NAME]
+
+        await collection.create_index(
+            [("timestamp", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+            name="timestamp_id_idx"
+        )
+        await collection.create_index(
+            [("user_id", pymongo.ASCENDING), ("timestamp", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+            name="user_timestamp_idx"
+        )
+        await collection.create_index(
+            [("status_code", pymongo.ASCENDING), ("timestamp", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+            name="status_timestamp_idx"
+        )
+        # Anchored prefix regex ("^/school") is an index range on path
+        await collection.create_index(
+            [("path", pymongo.ASCENDING), ("timestamp", pymongo.DESCENDING), ("_id", pymongo.DESCENDING)],
+            name="path_timestamp_idx"
+        )
@@ -1,36 +1,59 @@
+from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from app.core.dependencies import get_current_active_user
-from app.core.database import get_database
 from app.core.permissions import Role
+from app.modules.auth.model import AdminUser
 from app.utils.response import APIResponse
-from app.modules.audit.schema import AuditLogList, AuditLogResponse
+from app.modules.audit.service import AuditService
+from app.core.jobs.queue import enqueue
 
 router = APIRouter()
 
+def require_super_admin(current_user: AdminUser = Depends(get_current_active_user)) -> AdminUser:
+    # Strict Role Check
+    if current_user.role != Role.SUPER_ADMIN:
+        raise HTTPException(status_code=403, detail="Not authorized to view audit logs")
+    return current_user
+
 @router.get("/logs")
 async def get_audit_logs(
-    skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
-    current_user: dict = Depends(get_current_active_user)
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    user_id: Optional[str] = None,
+    status_code: Optional[int] = None,
+    path_prefix: Optional[str] = Query(None, description="e.g. /school/attendance"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    current_user: AdminUser = Depends(require_super_admin)
 ):
-    # Strict Role Check
-    if current_user.get("role") != Role.SUPER_ADMIN:
-        raise HTTPException(status_code=403, detail="Not authorized to view audit logs")
-    
-    db = await get_database()
-    cursor = db["audit_logs"].find().sort("timestamp", -1).skip(skip).limit(limit)
-    logs = await cursor.to_list(length=limit)
-    
-    # Convert ObjectIds to strings for Pydantic
-    for log in logs:
-        log["_id"] = str(log["_id"])
-        
-    total = await db["audit_logs"].count_documents({})
-    
-    return APIResponse.success(
-        {
-            "items": logs,
-            "total": total
-        },
-        "Audit logs retrieved successfully"
+    try:
+        page = await AuditService.list_logs(
+            limit=limit,
+            cursor=cursor,
+            user_id=user_id,
+            status_code=status_code,
+            path_prefix=path_prefix,
+            since=since,
+            until=until
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return APIResponse.success(page, "Audit logs retrieved successfully")
+
+@router.post("/archive")
+async def archive_audit_logs(
+    retention_days: Optional[int] = Query(None, ge=0),
+    current_user: AdminUser = Depends(require_super_admin)
+):
+    """
+    Move audit logs older than the retention window into monthly archive collections.
+    Runs as a background job; poll /platform/jobs/{job_id} for the result.
+    """
+    job = await enqueue(
+        kind="audit_archive",
+        payload={"retention_days": retention_days},
+        created_by=current_user.id
     )
+    return APIResponse.success(job, "Audit log archive queued", status_code=202)
@@ -6,6 +6,7 @@ class AuditLogResponse(BaseModel):
     id: str = Field(alias="_id")
     method: str
     url: str
+    path: Optional[str] = None
     client: str
     status_code: int
     process_time: float
@@ -16,4 +17,5 @@ class AuditLogResponse(BaseModel):
 
 class AuditLogList(BaseModel):
     items: list[AuditLogResponse]
-    total: int
+    next_cursor: Optional[str] = None
+    estimated_total: Optional[int] = None
@@ -0,0 +1,147 @@
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from pymongo.errors import CollectionInvalid
+from app.core.config import settings
+from app.core.database import db
+from app.core.jobs.queue import job_handler
+from app.core.jobs.runner import JobContext
+from app.modules.audit.model import COLLECTION_NAME, ARCHIVE_PREFIX
+from app.utils.pagination import encode_cursor, decode_cursor, keyset_after
+
+SORT_FIELDS = ["timestamp", "_id"]
+
+def _month_start(dt: datetime) -> datetime:
+    return dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+def _next_month(dt: datetime) -> datetime:
+    return (dt.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+class AuditService:
+
+    @staticmethod
+    async def list_logs(
+        limit: int,
+        cursor: Optional[str] = None,
+        user_id: Optional[str] = None,
+        status_code: Optional[int] = None,
+        path_prefix: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ) -> dict:
+        """
+        Newest-first keyset page on (timestamp, _id).
+        Raises ValueError for an invalid cursor.
+        """
+        query = {}
+        if user_id:
+            query["user_id"] = user_id
+        if status_code is not None:
+            query["status_code"] = status_code
+        if path_prefix:
+            query["path"] = {"$regex": f"^{re.escape(path_prefix)}"}
+        if since or until:
+            query["timestamp"] = {}
+            if since:
+                query["timestamp"]["$gte"] = since.timestamp()
+            if until:
+                query["timestamp"]["$lt"] = until.timestamp()
+
+        if cursor:
+            after = keyset_after(SORT_FIELDS, decode_cursor(cursor, len(SORT_FIELDS)))
+            query = {"$and": [query, after]} if query else after
+
+        database = db.get_db()
+        # One extra row tells us whether there is a next page
+        docs = await database[COLLECTION_NAME].find(query).sort(
+            [("timestamp", -1), ("_id", -1)]
+        ).limit(limit + 1).to_list(length=limit + 1)
+
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            last = docs[-1]
+            next_cursor = encode_cursor(last["timestamp"], last["_id"])
+
+        for doc in docs:
+            doc["_id"] = str(doc["_id"])
+
+        return {
+            "items": docs,
+            "next_cursor": next_cursor,
+            # Collection metadata, not a scan; ignores filters
+            "estimated_total": await database[COLLECTION_NAME].estimated_document_count()
+        }
+
+    @staticmethod
+    async def archive_old_logs(retention_days: Optional[int] = None) -> dict:
+        """
+        Rollover: move entries older than the retention window into compressed monthly
+        collections (audit_logs_archive_YYYY_MM), then drop archives past AUDIT_ARCHIVE_RETENTION_MONTHS.
+        Safe to re-run: copying is an idempotent $merge on _id before the delete.
+        """
+        retention_days = settings.AUDIT_RETENTION_DAYS if retention_days is None else retention_days
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+
+        database = db.get_db()
+        collection = database[COLLECTION_NAME]
+
+        oldest = await collection.find_one(
+            {"timestamp": {"$lt": cutoff.timestamp()}}, sort=[("timestamp", 1)], projection={"timestamp": 1}
+        )
+
+        archived = {}
+        if oldest:
+            month = _month_start(datetime.fromtimestamp(oldest["timestamp"], timezone.utc))
+            existing = set(await database.list_collection_names(filter={"name": {"$regex": f"^{ARCHIVE_PREFIX}"}}))
+
+            while month < cutoff:
+                window = {"$gte": month.timestamp(), "$lt": min(_next_month(month), cutoff).timestamp()}
+                archive_name = f"{ARCHIVE_PREFIX}{month:%Y_%m}"
+
+                if archive_name not in existing:
+                    try:
+                        await database.create_collection(
+                            archive_name,
+                            storageEngine={"wiredTiger": {"configString": f"block_compressor={settings.AUDIT_ARCHIVE_COMPRESSOR}"}}
+                        )
+                    except CollectionInvalid:
+                        pass # Created concurrently
+                    await database[archive_name].create_index([("timestamp", -1), ("_id", -1)], name="timestamp_id_idx")
+                    existing.add(archive_name)
+
+                # Server-side copy; nothing is streamed through the app
+                await collection.aggregate([
+                    {"$match": {"timestamp": window}},
+                    {"$merge": {"into": archive_name, "on": "_id", "whenMatched": "keepExisting", "whenNotMatched": "insert"}}
+                ]).to_list(length=None)
+
+                result = await collection.delete_many({"timestamp": window})
+                if result.deleted_count:
+                    archived[archive_name] = archived.get(archive_name, 0) + result.deleted_count
+
+                month = _next_month(month)
+
+        # Expire whole archive months
+        dropped = []
+        expire_before = _month_start(datetime.now(timezone.utc))
+        for _ in range(settings.AUDIT_ARCHIVE_RETENTION_MONTHS):
+            expire_before = _month_start(expire_before - timedelta(days=1))
+        for name in await database.list_collection_names(filter={"name": {"$regex": f"^{ARCHIVE_PREFIX}"}}):
+            try:
+                month = datetime.strptime(name[len(ARCHIVE_PREFIX):], "%Y_%m").replace(tzinfo=timezone.utc)
+            except ValueError:
+                continue
+            if month < expire_before:
+                await database.drop_collection(name)
+                dropped.append(name)
+
+        return {
+            "cutoff": cutoff,
+            "archived": archived,
+            "dropped_archives": dropped
+        }
+
+@job_handler("audit_archive")
+async def run_audit_archive(job: JobContext) -> dict:
+    return await AuditService.archive_old_logs(job.payload.get("retention_days"))
@@ -5,7 +5,7 @@ from app.modules.auth.model import AdminUser
 from app.modules.auth.schema import AdminUserCreate
 from app.core.security import verify_password, get_password_hash, create_access_token, create_refresh_token
 from app.core.config import settings
-from app.core.permissions import Role, ROLE_PERMISSIONS
+from app.core.permissions import Role, Permission, ROLE_PERMISSIONS
 
 class AuthService:
     @staticmethod
@@ -13,13 +13,23 @@ class AuthService:
         db = await get_database()
         user_data = await db["admin_users"].find_one({"email": email})
         if user_data:
-            return AdminUser(**user_data)
+            return AuthService._from_db(user_data)
         return None
 
+    @staticmethod
+    def _from_db(user_data: dict) -> AdminUser:
+        """
+        Wrap a stored admin user without re-validating it (documents were validated on write).
+        Runs on every uncached platform request. Only the enum fields are coerced.
+        """
+        user_data["role"] = Role(user_data.get("role", Role.ADMIN))
+        user_data["permissions"] = [Permission(p) for p in user_data.get("permissions", [])]
+        return AdminUser.model_construct(**user_data)
+
     @staticmethod
     async def create_user(user_in: AdminUserCreate) -> AdminUser:
         db = await get_database()
-        hashed_password = get_password_hash(user_in.password)
+        hashed_password = await get_password_hash(user_in.password)
         
         # Get default permissions for role
         permissions = ROLE_PERMISSIONS.get(user_in.role, [])
@@ -41,7 +51,7 @@ class AuthService:
         user = await AuthService.get_user_by_email(email)
         if not user:
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password(password, user.hashed_password):
             return None
         return user
 
@@ -0,0 +1,169 @@
+from datetime import date, timedelta
+from typing import Iterable, List, Tuple
+from app.core.academic_year import get_academic_year_for, get_academic_year_bounds
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import db
+from app.core.school_settings import SchoolSettings
+from app.modules.holidays.model import COLLECTION_NAME
+
+class SchoolCalendar:
+    """
+    Non-working days of one school for one academic year (April 1 - March 31).
+    Bit i of each bitmap is day (start + i):
+      holidays -> active holidays from school_holidays
+      offs     -> holidays | weekly offs
+    """
+
+    def __init__(self, school_id: str, academic_year: str, holiday_dates: Iterable[date], weekly_offs: Iterable[int]):
+        self.school_id = school_id
+        self.academic_year = academic_year
+        self.start, self.end = get_academic_year_bounds(academic_year)
+        self.days = (self.end - self.start).days + 1
+        self.weekly_offs = tuple(sorted(set(weekly_offs)))
+
+        holidays = 0
+        for day in holiday_dates:
+            if self.start <= day <= self.end:
+                holidays |= 1 << (day - self.start).days
+
+        weekly = 0
+        for weekday in self.weekly_offs:
+            # First matching weekday, then every 7th day
+            i = (weekday - self.start.weekday()) % 7
+            while i < self.days:
+                weekly |= 1 << i
+                i += 7
+
+        self.holidays = holidays
+        self.offs = holidays | weekly
+
+    def _index(self, day: date) -> int:
+        if not self.start <= day <= self.end:
+            raise ValueError(f"{day} is outside academic year {self.academic_year}")
+        return (day - self.start).days
+
+    def is_holiday(self, day: date) -> bool:
+        return bool(self.holidays >> self._index(day) & 1)
+
+    def is_weekly_off(self, day: date) -> bool:
+        return day.weekday() in self.weekly_offs
+
+    def is_working_day(self, day: date) -> bool:
+        return not self.offs >> self._index(day) & 1
+
+    def working_days_between(self, start: date, end: date) -> int:
+        """
+        Working days in [start, end], both inclusive and inside this academic year.
+        """
+        if end < start:
+            return 0
+        i, j = self._index(start), self._index(end)
+        span = j - i + 1
+        return span - (self.offs >> i & ((1 << span) - 1)).bit_count()
+
+    def working_dates_between(self, start: date, end: date) -> List[date]:
+        """
+        The working days in [start, end] themselves (same bounds as working_days_between).
+        """
+        if end < start:
+            return []
+        i, j = self._index(start), self._index(end)
+        return [self.start + timedelta(days=k) for k in range(i, j + 1) if not self.offs >> k & 1]
+
+# Per-school version stamp shared by all workers. Holiday and weekly off writes bump it;
+# cached calendars are keyed by the version they were built at.
+VERSION_COLLECTION = "holiday_calendar_versions"
+
+_calendars = TTLCache(
+    "holiday_calendars",
+    maxsize=settings.HOLIDAY_CALENDAR_CACHE_SIZE,
+    ttl=settings.HOLIDAY_CALENDAR_TTL_SECONDS
+)
+
+# school_id -> version, re-read from Mongo every HOLIDAY_CALENDAR_VERSION_SYNC_SECONDS
+_versions = TTLCache(
+    "holiday_calendar_versions",
+    maxsize=settings.HOLIDAY_CALENDAR_CACHE_SIZE,
+    ttl=settings.HOLIDAY_CALENDAR_VERSION_SYNC_SECONDS
+)
+
+async def _get_version(school_id: str) -> int:
+    version = _versions.get(school_id)
+    if version is None:
+        doc = await db.get_db()[VERSION_COLLECTION].find_one({"_id": school_id}, {"version": 1})
+        version = doc.get("version", 0) if doc else 0
+        _versions.set(school_id, version)
+    return version
+
+async def get_school_calendar(school_id: str, academic_year: str) -> SchoolCalendar:
+    """
+    Lazily built calendar; one indexed range scan on (school_id, date) per school/year.
+    """
+    version = await _get_version(school_id)
+    key = (school_id, academic_year, version)
+    calendar = _calendars.get(key)
+    if calendar is not None:
+        return calendar
+
+    start, end = get_academic_year_bounds(academic_year)
+    database = db.get_db()
+    cursor = database[COLLECTION_NAME].find(
+        {"school_id": school_id, "date": {"$gte": start.isoformat(), "$lte": end.isoformat()}, "status": "active"},
+        {"date": 1, "_id": 0}
+    )
+    holiday_dates = [date.fromisoformat(doc["date"]) async for doc in cursor]
+    # Fresh read: this worker's settings cache may predate the weekly off change that bumped the version
+    calendar_settings = await SchoolSettings.get_calendar_settings(school_id, fresh=version > 0)
+
+    calendar = SchoolCalendar(school_id, academic_year, holiday_dates, calendar_settings["weekly_offs"])
+    _calendars.set(key, calendar)
+    return calendar
+
+async def get_calendar_for_date(school_id: str, day: date) -> SchoolCalendar:
+    return await get_school_calendar(school_id, get_academic_year_for(day))
+
+async def invalidate_school_calendar(school_id: str):
+    """
+    Call after holidays or weekly offs change (after the write). Bumps the school's shared
+    version: this worker rebuilds at once, others within HOLIDAY_CALENDAR_VERSION_SYNC_SECONDS.
+    Calendars of the old version are unreachable and age out of the LRU.
+    """
+    await db.get_db()[VERSION_COLLECTION].update_one(
+        {"_id": school_id}, {"$inc": {"version": 1}}, upsert=True
+    )
+    _versions.invalidate(school_id)
+
+def _year_segments(start: date, end: date) -> Iterable[Tuple[str, date, date]]:
+    while start <= end:
+        academic_year = get_academic_year_for(start)
+        _, year_end = get_academic_year_bounds(academic_year)
+        segment_end = min(end, year_end)
+        yield academic_year, start, segment_end
+        start = segment_end + timedelta(days=1)
+
+async def working_days_between(school_id: str, start: date, end: date) -> int:
+    """
+    Working days in [start, end] (inclusive), across academic years if needed.
+    """
+    total = 0
+    for academic_year, segment_start, segment_end in _year_segments(start, end):
+        calendar = await get_school_calendar(school_id, academic_year)
+        total += calendar.working_days_between(segment_start, segment_end)
+    return total
+
+async def working_dates_between(school_id: str, start: date, end: date) -> List[date]:
+    """
+    Working dates in [start, end] (inclusive), across academic years if needed.
+    """
+    dates = []
+    for academic_year, segment_start, segment_end in _year_segments(start, end):
+        calendar = await get_school_calendar(school_id, academic_year)
+        dates.extend(calendar.working_dates_between(segment_start, segment_end))
+    return dates
+
+async def is_holiday(school_id: str, day: date) -> bool:
+    return (await get_calendar_for_date(school_id, day)).is_holiday(day)
+
+async def is_working_day(school_id: str, day: date) -> bool:
+    return (await get_calendar_for_date(school_id, day)).is_working_day(day)
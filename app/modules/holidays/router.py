@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, Query
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Optional
 from app.core.dependencies import get_current_school_user
-from app.modules.holidays.schema import CreateHolidayRequest, HolidayResponse, HolidayListResponse
+from app.modules.holidays.schema import (
+    CreateHolidayRequest, HolidayResponse, HolidayListResponse,
+    SetWeeklyOffsRequest, WorkingDaysResponse
+)
 from app.modules.holidays.service import HolidayService
 
 router = APIRouter()
@@ -37,6 +41,8 @@ async def create_holiday(
 @router.get("/holidays", response_model=HolidayListResponse)
 async def list_holidays(
     month: Optional[str] = Query(None, description="Filter by month (YYYY-MM)", regex=r"^\d{4}-\d{2}$"),
+    start_date: Optional[date] = Query(None, description="Filter from date (inclusive)"),
+    end_date: Optional[date] = Query(None, description="Filter to date (inclusive)"),
     current_user: dict = Depends(get_current_school_user)
 ):
     """
@@ -44,10 +50,47 @@ async def list_holidays(
     """
     data = await HolidayService.list_holidays(
         school_id=current_user["school_id"],
-        month=month
+        month=month,
+        start_date=start_date,
+        end_date=end_date
     )
     
     return {
         "success": True,
         "data": data
     }
+
+@router.put("/holidays/weekly-offs")
+async def set_weekly_offs(
+    request: SetWeeklyOffsRequest,
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    Set the school's weekly off days (School Admin Only).
+    """
+    if current_user["role"] != "SCHOOL_ADMIN":
+        raise HTTPException(status_code=403, detail="Only School Admin can configure weekly offs.")
+
+    await HolidayService.set_weekly_offs(current_user["school_id"], request.weekly_offs)
+
+    return {
+        "success": True,
+        "message": "Weekly offs updated successfully",
+        "data": {"weekly_offs": sorted(set(request.weekly_offs))}
+    }
+
+@router.get("/holidays/working-days", response_model=WorkingDaysResponse)
+async def get_working_days(
+    start_date: date,
+    end_date: date,
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    Count working days (excluding holidays and weekly offs) between two dates, inclusive.
+    """
+    data = await HolidayService.get_working_days(current_user["school_id"], start_date, end_date)
+
+    return {
+        "success": True,
+        "data": data
+    }
@@ -1,4 +1,5 @@
 from typing import List, Literal, Optional
+from datetime import date
 from pydantic import BaseModel, Field, field_validator
 import re
 
@@ -29,3 +30,21 @@ class HolidayResponse(BaseModel):
     success: bool
     message: str
     data: Optional[HolidayItem] = None
+
+class SetWeeklyOffsRequest(BaseModel):
+    weekly_offs: List[int] = Field(..., description="Weekdays off, Monday=0 ... Sunday=6", example=[6])
+
+    @field_validator('weekly_offs')
+    def validate_weekdays(cls, v):
+        if any(d < 0 or d > 6 for d in v):
+            raise ValueError("Weekdays must be between 0 (Monday) and 6 (Sunday)")
+        return v
+
+class WorkingDaysData(BaseModel):
+    start_date: date
+    end_date: date
+    working_days: int
+
+class WorkingDaysResponse(BaseModel):
+    success: bool
+    data: WorkingDaysData
@@ -1,10 +1,12 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Optional
 from pymongo.errors import DuplicateKeyError
 from fastapi import HTTPException, status
 from app.core.database import db
 from app.modules.holidays.model import COLLECTION_NAME
 from app.modules.holidays.schema import CreateHolidayRequest
+from app.modules.holidays.calendar import get_calendar_for_date, invalidate_school_calendar, working_days_between
+from app.core.school_settings import SchoolSettings
 
 class HolidayService:
     
@@ -13,6 +15,11 @@ class HolidayService:
         """
         Create a new holiday. Handles unique constraint on (school_id, date).
         """
+        try:
+            holiday_date = date.fromisoformat(request.date)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid date")
+
         holiday_doc = request.model_dump()
         holiday_doc.update({
             "org_id": org_id,
@@ -26,6 +33,7 @@ class HolidayService:
         try:
             result = await database[COLLECTION_NAME].insert_one(holiday_doc)
             holiday_doc["_id"] = str(result.inserted_id)
+            await invalidate_school_calendar(school_id)
             return holiday_doc
         except DuplicateKeyError:
             raise HTTPException(
@@ -34,18 +42,31 @@ class HolidayService:
             )
 
     @staticmethod
-    async def list_holidays(school_id: str, month: Optional[str] = None) -> List[dict]:
+    async def list_holidays(
+        school_id: str,
+        month: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[dict]:
         """
         List holidays for a school. 
-        Optional filter: month (Format: YYYY-MM)
+        Optional filters: month (Format: YYYY-MM) or start_date/end_date (inclusive)
         """
         database = db.get_db()
         query = {"school_id": school_id, "status": "active"}
         
+        # Dates are stored as "YYYY-MM-DD", so string ranges are date ranges
+        # and stay on the (school_id, date) index
+        date_range = {}
         if month:
-            # Simple string regex match since date is stored as "YYYY-MM-DD"
-            # ^2025-08.* matches 2025-08-15
-            query["date"] = {"$regex": f"^{month}"}
+            date_range["$gte"] = f"{month}-01"
+            date_range["$lte"] = f"{month}-31"
+        if start_date:
+            date_range["$gte"] = max(date_range.get("$gte", ""), start_date.isoformat())
+        if end_date:
+            date_range["$lte"] = min(date_range.get("$lte", "9999"), end_date.isoformat())
+        if date_range:
+            query["date"] = date_range
             
         cursor = database[COLLECTION_NAME].find(query).sort("date", 1)
         holidays = []
@@ -56,14 +77,26 @@ class HolidayService:
         return holidays
 
     @staticmethod
-    async def is_holiday(school_id: str, date: str) -> bool:
+    async def is_holiday(school_id: str, day: str) -> bool:
         """
-        Internal Utility: Check if a specific date is a holiday.
+        Internal Utility: Check if a specific date (YYYY-MM-DD) is a holiday.
+        Answered from the cached school calendar (see calendar.py).
         """
-        database = db.get_db()
-        holiday = await database[COLLECTION_NAME].find_one({
-            "school_id": school_id,
-            "date": date,
-            "status": "active"
-        })
-        return True if holiday else False
+        holiday_date = date.fromisoformat(day)
+        calendar = await get_calendar_for_date(school_id, holiday_date)
+        return calendar.is_holiday(holiday_date)
+
+    @staticmethod
+    async def set_weekly_offs(school_id: str, weekly_offs: List[int]):
+        await SchoolSettings.set_weekly_offs(school_id, weekly_offs)
+        await invalidate_school_calendar(school_id)
+
+    @staticmethod
+    async def get_working_days(school_id: str, start_date: date, end_date: date) -> dict:
+        if end_date < start_date:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="end_date must not be before start_date")
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "working_days": await working_days_between(school_id, start_date, end_date)
+        }
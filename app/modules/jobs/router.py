@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException
+from app.core.dependencies import get_current_school_user, check_permissions
+from app.core.permissions import Permission
+from app.core.jobs.queue import get_job, take_job_secret
+from app.modules.jobs.schema import JobResponse
+
+# /school/jobs/{job_id}: jobs queued for the caller's school
+school_router = APIRouter(prefix="/jobs")
+
+# /platform/jobs/{job_id}: platform jobs (audit archive, tenant purge, ...)
+platform_router = APIRouter(prefix="/jobs")
+
+def _job_response(job: dict) -> dict:
+    return {
+        "success": True,
+        "message": f"Job is {job['status']}",
+        "data": job
+    }
+
+@school_router.get("/{job_id}", response_model=JobResponse)
+async def get_school_job(
+    job_id: str,
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    Status, progress and result of a background job of this school.
+    - School Admins see every job of the school, other users only their own.
+    - One-time credentials (e.g. temporary passwords of a bulk admission) are returned
+      to the job's creator on the first read after they are produced, then deleted.
+    """
+    job = await get_job(job_id, school_id=current_user["school_id"])
+    is_creator = job is not None and job.get("created_by") == current_user["_id"]
+    if not job or (current_user.get("role") != "SCHOOL_ADMIN" and not is_creator):
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if is_creator:
+        job["credentials"] = await take_job_secret(job_id, current_user["_id"])
+    return _job_response(job)
+
+@platform_router.get("/{job_id}", response_model=JobResponse, dependencies=[Depends(check_permissions([Permission.MANAGE_ORGS]))])
+async def get_platform_job(job_id: str):
+    """
+    Status, progress and result of any background job.
+    """
+    job = await get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _job_response(job)
@@ -0,0 +1,28 @@
+from typing import Any, Optional
+from datetime import datetime
+from pydantic import BaseModel, Field
+
+class JobProgress(BaseModel):
+    done: int = 0
+    total: Optional[int] = None
+    stage: Optional[str] = None
+
+class JobData(BaseModel):
+    job_id: str = Field(validation_alias="_id")
+    kind: str
+    status: str # queued | running | completed | failed
+    attempts: int
+    max_attempts: int
+    progress: JobProgress
+    result: Optional[Any] = None
+    error: Optional[str] = None # Last error (also set while a retry is queued)
+    credentials: Optional[Any] = None # One-time secrets, only on the creator's first read (see take_job_secret)
+    created_at: datetime
+    run_at: Optional[datetime] = None # Next attempt, while queued
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+class JobResponse(BaseModel):
+    success: bool
+    message: str
+    data: JobData
@@ -2,6 +2,7 @@ from typing import Optional
 from datetime import datetime
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
 import uuid
+from app.utils.projection import model_projection
 
 class Organization(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), alias="_id")
@@ -20,3 +21,6 @@ class Organization(BaseModel):
         arbitrary_types_allowed=True,
         json_encoders={datetime: lambda v: v.isoformat()}
     )
+
+# Organization fields as stored; reads return these documents directly
+ORG_PROJECTION = model_projection(Organization)
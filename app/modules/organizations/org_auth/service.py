@@ -10,7 +10,7 @@ class OrgAuthService:
         db = await get_database()
         
         # Hash password
-        user_data["password"] = get_password_hash(user_data["password"])
+        user_data["password"] = await get_password_hash(user_data["password"])
         
         new_user = OrgUser(**user_data)
         await db["org_users"].insert_one(new_user.model_dump(by_alias=True))
@@ -24,7 +24,7 @@ class OrgAuthService:
         if not user_data:
             return None
             
-        if not verify_password(password, user_data["password"]):
+        if not await verify_password(password, user_data["password"]):
             return None
             
         # Update last login
@@ -33,4 +33,4 @@ class OrgAuthService:
             {"$set": {"last_login_at": datetime.utcnow()}}
         )
             
-        return OrgUser(**user_data)
+        return OrgUser.model_construct(**user_data) # Validated on write
@@ -0,0 +1,95 @@
+"""
+Tenant data purge after an organization is deleted (background job "tenant_purge").
+
+DELETE /org/{org_id} only removes the organization document. Its data is removed
+when a platform admin explicitly requests it (POST /org/{org_id}/purge), after a
+grace period of TENANT_PURGE_DELAY_HOURS during which the purge can be cancelled.
+School-scoped data goes first and the schools themselves last, so a retried job
+can still find the school ids. Billing records (subscriptions, payments) and audit
+logs are kept.
+"""
+import re
+from typing import List
+from app.core.database import db
+from app.core.jobs.queue import job_handler
+from app.core.jobs.runner import JobContext
+from app.modules.attendance.model import COLLECTION_NAME as ATTENDANCE_COLLECTION
+from app.modules.attendance.attendance_corrections.model import COLLECTION_NAME as CORRECTIONS_COLLECTION
+from app.modules.attendance.rollups import ROLLUP_COLLECTION
+from app.modules.holidays.model import COLLECTION_NAME as HOLIDAYS_COLLECTION
+from app.modules.staff_attendance.model import COLLECTION_NAME as STAFF_ATTENDANCE_COLLECTION
+from app.core.school_settings import COLLECTION_NAME as SCHOOL_SETTINGS_COLLECTION
+from app.core.report_cache import VERSION_COLLECTION as REPORT_VERSION_COLLECTION
+
+# Collections with a school_id field
+SCHOOL_COLLECTIONS = [
+    "school_users",
+    "students",
+    "student_users",
+    "teachers",
+    "teacher_users",
+    "classes",
+    "sections",
+    "subjects",
+    "teacher_assignments",
+    "section_coordinators",
+    "teacher_salaries",
+    "teacher_salary_structures",
+    ATTENDANCE_COLLECTION,
+    CORRECTIONS_COLLECTION,
+    ROLLUP_COLLECTION,
+    STAFF_ATTENDANCE_COLLECTION,
+    HOLIDAYS_COLLECTION,
+    SCHOOL_SETTINGS_COLLECTION
+]
+
+# Collections keyed by "<school_id><separator>..." in _id
+SCHOOL_KEYED_COLLECTIONS = [
+    ("sequences", "_"),
+    (REPORT_VERSION_COLLECTION, ":")
+]
+
+async def purge_organization_data(org_id: str, job: JobContext = None) -> dict:
+    database = db.get_db()
+    school_ids: List[str] = await database["schools"].distinct("_id", {"org_id": org_id})
+    deleted = {}
+
+    steps = len(SCHOOL_COLLECTIONS) + len(SCHOOL_KEYED_COLLECTIONS) + 2
+    done = 0
+
+    async def step(name: str, count: int):
+        nonlocal done
+        done += 1
+        if count:
+            deleted[name] = deleted.get(name, 0) + count
+        if job:
+            await job.progress(done, total=steps, stage=name)
+
+    if school_ids:
+        for name in SCHOOL_COLLECTIONS:
+            result = await database[name].delete_many({"school_id": {"$in": school_ids}})
+            await step(name, result.deleted_count)
+
+        for name, separator in SCHOOL_KEYED_COLLECTIONS:
+            count = 0
+            for school_id in school_ids:
+                result = await database[name].delete_many({"_id": {"$regex": f"^{re.escape(school_id + separator)}"}})
+                count += result.deleted_count
+            await step(name, count)
+    else:
+        done += len(SCHOOL_COLLECTIONS) + len(SCHOOL_KEYED_COLLECTIONS)
+
+    result = await database["org_users"].delete_many({"org_id": org_id})
+    await step("org_users", result.deleted_count)
+    result = await database["schools"].delete_many({"org_id": org_id})
+    await step("schools", result.deleted_count)
+
+    return {"org_id": org_id, "schools": len(school_ids), "deleted": deleted}
+
+@job_handler("tenant_purge")
+async def run_tenant_purge(job: JobContext) -> dict:
+    # Safe to retry: every step is a delete_many
+    return await purge_organization_data(job.payload["org_id"], job=job)
+
+def purge_idempotency_key(org_id: str) -> str:
+    return f"tenant_purge:{org_id}"
@@ -1,13 +1,18 @@
 from typing import List
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from app.modules.organizations.schema import OrgSignupRequest, OrgSignupResponse, OrgResponse, OrgUpdate
-from app.modules.organizations.model import Organization
+from app.modules.organizations.model import Organization, ORG_PROJECTION
 from app.modules.organizations.org_auth.service import OrgAuthService
 from app.utils.response import APIResponse
 from app.core.database import get_database
 from app.core.dependencies import check_permissions
 from app.core.permissions import Permission
-from datetime import datetime
+from app.core.principal_cache import invalidate_org_principals
+from app.core.tenant_status import bump_tenant_version
+from app.core.jobs.queue import enqueue, cancel_queued_job
+from app.core.config import settings
+from app.modules.organizations.purge import run_tenant_purge, purge_idempotency_key # Registers the tenant_purge job handler
+from datetime import datetime, timedelta
 
 router = APIRouter()
 
@@ -67,17 +72,17 @@ async def org_signup(org_in: OrgSignupRequest):
 @router.get("", response_model=List[OrgResponse], dependencies=[Depends(check_permissions([Permission.MANAGE_ORGS]))])
 async def list_organizations():
     db = await get_database()
-    cursor = db["organizations"].find()
+    cursor = db["organizations"].find({}, ORG_PROJECTION)
     orgs = await cursor.to_list(length=100)
-    return APIResponse.success([Organization(**org) for org in orgs], "Organizations retrieved successfully")
+    return APIResponse.success(orgs, "Organizations retrieved successfully")
 
 @router.get("/{org_id}", response_model=OrgResponse, dependencies=[Depends(check_permissions([Permission.MANAGE_ORGS]))])
 async def get_organization(org_id: str):
     db = await get_database()
-    org = await db["organizations"].find_one({"_id": org_id})
+    org = await db["organizations"].find_one({"_id": org_id}, ORG_PROJECTION)
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
-    return APIResponse.success(Organization(**org), "Organization retrieved successfully")
+    return APIResponse.success(org, "Organization retrieved successfully")
 
 @router.put("/{org_id}", response_model=OrgResponse, dependencies=[Depends(check_permissions([Permission.MANAGE_ORGS]))])
 async def update_organization(org_id: str, org_in: OrgUpdate):
@@ -97,14 +102,58 @@ async def update_organization(org_id: str, org_in: OrgUpdate):
                  raise HTTPException(status_code=400, detail="Email already registered")
         
         await db["organizations"].update_one({"_id": org_id}, {"$set": update_data})
+        await invalidate_org_principals(org_id)
+        await bump_tenant_version(org_id=org_id)
         
-    updated_org = await db["organizations"].find_one({"_id": org_id})
-    return APIResponse.success(Organization(**updated_org), "Organization updated successfully")
+    updated_org = await db["organizations"].find_one({"_id": org_id}, ORG_PROJECTION)
+    return APIResponse.success(updated_org, "Organization updated successfully")
 
 @router.delete("/{org_id}", dependencies=[Depends(check_permissions([Permission.MANAGE_ORGS]))])
 async def delete_organization(org_id: str):
+    """
+    Delete the organization document. Its schools, users and records are kept until
+    POST /{org_id}/purge is called.
+    """
     db = await get_database()
     result = await db["organizations"].delete_one({"_id": org_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Organization not found")
+    await invalidate_org_principals(org_id)
+    await bump_tenant_version(org_id=org_id)
     return APIResponse.success(None, "Organization deleted successfully")
+
+@router.post("/{org_id}/purge", dependencies=[Depends(check_permissions([Permission.MANAGE_ORGS]))])
+async def schedule_organization_purge(
+    org_id: str,
+    confirm: str = Query(..., description="Repeat the org_id to confirm")
+):
+    """
+    Schedule the irreversible removal of a deleted organization's data (schools, users,
+    students, teachers, attendance, salaries). Runs after TENANT_PURGE_DELAY_HOURS;
+    DELETE /{org_id}/purge cancels it until then. Billing records and audit logs are kept.
+    """
+    if confirm != org_id:
+        raise HTTPException(status_code=400, detail="confirm must equal the org_id")
+
+    db = await get_database()
+    if await db["organizations"].find_one({"_id": org_id}, {"_id": 1}):
+        raise HTTPException(status_code=409, detail="Delete the organization before purging its data")
+
+    job = await enqueue(
+        kind="tenant_purge",
+        payload={"org_id": org_id},
+        org_id=org_id,
+        idempotency_key=purge_idempotency_key(org_id),
+        run_at=datetime.utcnow() + timedelta(hours=settings.TENANT_PURGE_DELAY_HOURS)
+    )
+    return APIResponse.success(job, f"Tenant data purge scheduled for {job['run_at']:%Y-%m-%d %H:%M} UTC", 202)
+
+@router.delete("/{org_id}/purge", dependencies=[Depends(check_permissions([Permission.MANAGE_ORGS]))])
+async def cancel_organization_purge(org_id: str):
+    """
+    Cancel a scheduled purge that has not started yet.
+    """
+    job = await cancel_queued_job(purge_idempotency_key(org_id))
+    if not job:
+        raise HTTPException(status_code=404, detail="No pending purge for this organization")
+    return APIResponse.success(job, "Tenant data purge cancelled")
@@ -37,6 +37,7 @@ async def list_payments():
             # Subscription doesn't have a clear "name", sticking to status or None. 
             # Or assume user might iterate properly on frontend.
             # "name_field": "status" 
+            "fields": ["org_id", "plan_id", "status", "valid_till"]
         }
     }
     
@@ -1,7 +1,15 @@
 from fastapi import APIRouter, Depends
 from app.modules.auth.schema import AdminUserResponse
 from app.modules.auth.model import AdminUser
-from app.core.dependencies import get_current_active_user
+from app.core.dependencies import get_current_active_user, check_permissions
+from app.core.permissions import Permission
+from app.core.password_hasher import password_hasher
+from app.core.cache import CACHE_REGISTRY
+from app.core.database import db
+from app.core.audit_sink import audit_sink
+from app.core.roll_number import roll_number_leases
+from app.core.report_cache import report_cache_stats
+from app.core.jobs.runner import job_runner
 from app.utils.response import APIResponse
 
 router = APIRouter()
@@ -11,3 +19,18 @@ async def read_admin_profile(
     current_user: AdminUser = Depends(get_current_active_user)
 ):
     return APIResponse.success(current_user, "Profile retrieved successfully")
+
+@router.get("/metrics", dependencies=[Depends(check_permissions([Permission.VIEW_ANALYTICS]))])
+async def read_runtime_metrics():
+    """
+    Per-worker runtime metrics (pools, queues, caches).
+    """
+    return APIResponse.success({
+        "mongo_pool": db.pool_stats(),
+        "password_hasher": password_hasher.stats(),
+        "audit_sink": audit_sink.stats(),
+        "roll_number_leases": roll_number_leases.stats(),
+        "report_cache": report_cache_stats(),
+        "jobs": job_runner.stats(),
+        "caches": {name: cache.stats() for name, cache in CACHE_REGISTRY.items()}
+    }, "Metrics retrieved successfully")
@@ -0,0 +1,169 @@
+"""
+Monthly attendance register export (student x day grid), streamed.
+
+student_attendance is read with one cursor sorted by section, so only one section's
+grid is held in memory at a time. When the cursor moves to the next section, that
+section's students are looked up in one $in query and its rows are written out.
+"""
+import csv
+import io
+import json
+import zlib
+from calendar import monthrange
+from datetime import date
+from typing import AsyncIterator, Dict, Iterable, List, Optional
+from app.core.database import db
+from app.modules.attendance.model import COLLECTION_NAME as ATTENDANCE_COLLECTION
+
+FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson"
+}
+
+STATUS_CODES = {"present": "P", "absent": "A", "leave": "L"}
+
+# Rows buffered before yielding a chunk to the response
+ROWS_PER_CHUNK = 200
+
+STUDENT_PROJECTION = {
+    "academic.roll_no": 1,
+    "academic.admission_no": 1,
+    "personal.first_name": 1,
+    "personal.last_name": 1
+}
+
+def parse_month(month: str) -> List[str]:
+    """
+    Dates (YYYY-MM-DD) of a YYYY-MM month. Raises ValueError for malformed months.
+    """
+    first = date.fromisoformat(f"{month}-01")
+    return [str(first.replace(day=day)) for day in range(1, monthrange(first.year, first.month)[1] + 1)]
+
+def register_columns(days: List[str]) -> List[str]:
+    return (
+        ["class_id", "section_id", "roll_no", "admission_no", "student_id", "name"]
+        + [day[-2:] for day in days]
+        + ["present", "absent", "leave", "total"]
+    )
+
+async def _section_rows(school_id: str, days: List[str], class_id: str, section_id: str, grid: Dict[str, dict]) -> List[dict]:
+    """
+    Register rows for one section, ordered by roll number.
+    """
+    students = await db.get_db()["students"].find(
+        {"_id": {"$in": list(grid)}, "school_id": school_id}, STUDENT_PROJECTION
+    ).to_list(length=None)
+    students = {student["_id"]: student for student in students}
+
+    rows = []
+    for student_id, statuses in grid.items():
+        student = students.get(student_id, {})
+        academic = student.get("academic", {})
+        personal = student.get("personal", {})
+
+        row = {
+            "class_id": class_id,
+            "section_id": section_id,
+            "roll_no": academic.get("roll_no"),
+            "admission_no": academic.get("admission_no"),
+            "student_id": student_id,
+            "name": " ".join(filter(None, [personal.get("first_name"), personal.get("last_name")]))
+        }
+        totals = {"present": 0, "absent": 0, "leave": 0}
+        for day in days:
+            status = statuses.get(day)
+            row[day[-2:]] = STATUS_CODES.get(status, status or "")
+            if status in totals:
+                totals[status] += 1
+        row.update(totals)
+        row["total"] = sum(1 for day in days if day in statuses)
+        rows.append(row)
+
+    rows.sort(key=lambda r: (r["roll_no"] is None, r["roll_no"] or 0, r["student_id"]))
+    return rows
+
+async def iter_register_rows(
+    school_id: str,
+    academic_year: str,
+    month: str,
+    class_id: Optional[str] = None,
+    section_id: Optional[str] = None
+) -> AsyncIterator[dict]:
+    """
+    Approved register rows of a school (or one class / section), section by section.
+    Several submissions of a section on one day (subject mode): the first by subject_id wins.
+    """
+    days = parse_month(month)
+    query = {
+        "school_id": school_id,
+        "academic_year": academic_year,
+        "date": {"$gte": days[0], "$lte": days[-1]},
+        "status": "APPROVED",
+        "locked": True
+    }
+    if class_id: query["class_id"] = class_id
+    if section_id: query["section_id"] = section_id
+
+    cursor = db.get_db()[ATTENDANCE_COLLECTION].find(
+        query, {"class_id": 1, "section_id": 1, "date": 1, "records": 1}
+    ).sort([("class_id", 1), ("section_id", 1), ("subject_id", 1), ("date", 1)]) # unique_attendance_submission_idx order
+
+    current = None
+    grid: Dict[str, dict] = {}
+    async for doc in cursor:
+        section = (doc.get("class_id"), doc.get("section_id"))
+        if section != current:
+            if grid:
+                for row in await _section_rows(school_id, days, *current, grid):
+                    yield row
+            current, grid = section, {}
+
+        for record in doc.get("records", []):
+            grid.setdefault(record["student_id"], {}).setdefault(doc["date"], record.get("status"))
+
+    if grid:
+        for row in await _section_rows(school_id, days, *current, grid):
+            yield row
+
+def _encode_chunk(rows: List[dict], fmt: str, columns: List[str]) -> bytes:
+    buffer = io.StringIO()
+    if fmt == "csv":
+        csv.DictWriter(buffer, fieldnames=columns, lineterminator="\n").writerows(rows)
+    else:
+        for row in rows:
+            buffer.write(json.dumps(row, default=str))
+            buffer.write("\n")
+    return buffer.getvalue().encode("utf-8")
+
+async def stream_register(rows: AsyncIterator[dict], fmt: str, days: Iterable[str], compress: bool = False) -> AsyncIterator[bytes]:
+    """
+    Encode rows as CSV (with header) or NDJSON, optionally gzip-compressed, in chunks.
+    """
+    columns = register_columns(list(days))
+    compressor = zlib.compressobj(wbits=31) if compress else None # 31 = gzip container
+
+    def emit(data: bytes) -> bytes:
+        return compressor.compress(data) if compressor else data
+
+    if fmt == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerow(columns)
+        chunk = emit(buffer.getvalue().encode("utf-8"))
+        if chunk:
+            yield chunk
+
+    batch = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= ROWS_PER_CHUNK:
+            chunk = emit(_encode_chunk(batch, fmt, columns))
+            batch = []
+            if chunk:
+                yield chunk
+
+    if batch:
+        chunk = emit(_encode_chunk(batch, fmt, columns))
+        if chunk:
+            yield chunk
+    if compressor:
+        yield compressor.flush()
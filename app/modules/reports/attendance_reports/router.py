@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from datetime import date
 from typing import Optional
 
@@ -10,8 +11,11 @@ from app.modules.reports.attendance_reports.schema import (
     StudentMonthlySummary,
     SectionMonthlySummary,
     DefaulterStudent,
-    AttendanceTrendResponse
+    AttendanceTrendResponse,
+    BatchReportRequest
 )
+from app.modules.reports.attendance_reports.export import FORMATS, parse_month, iter_register_rows, stream_register
+from app.core.academic_year import get_current_academic_year
 from app.core.permissions import is_section_coordinator 
 
 # We might need two routers or one with smart dependency injection.
@@ -121,6 +125,63 @@ async def get_attendance_trend(
     return APIResponse.success(data=result)
 
 
+@router.post("/batch", summary="Several Reports in One Call")
+async def get_report_batch(
+    request: BatchReportRequest,
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    Dashboard reports (daily_summary, student_monthly, section_monthly, defaulters, trend)
+    answered by one aggregation. Results are returned in request order.
+    """
+    school_id = current_user.get("school_id")
+    result = await AttendanceReportService.get_batch(
+        school_id=school_id,
+        specs=[spec.model_dump() for spec in request.reports]
+    )
+    return APIResponse.success(data=result)
+
+
+@router.get("/register/export", summary="Monthly Attendance Register Export")
+async def export_monthly_register(
+    month: str, # YYYY-MM
+    class_id: Optional[str] = None,
+    section_id: Optional[str] = None,
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    gzip: bool = False,
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    Student x day register of the whole school (or one class / section), streamed.
+    Codes: P present, A absent, L leave. gzip=true returns a .gz file.
+    """
+    try:
+        days = parse_month(month)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="month must be YYYY-MM")
+
+    school_id = current_user.get("school_id")
+    rows = iter_register_rows(
+        school_id=school_id,
+        academic_year=get_current_academic_year(),
+        month=month,
+        class_id=class_id,
+        section_id=section_id
+    )
+
+    filename = "_".join(filter(None, ["attendance_register", month, class_id, section_id])) + f".{format}"
+    media_type = FORMATS[format]
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+
+    return StreamingResponse(
+        stream_register(rows, format, days, compress=gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
 # --- COORDINATOR SCOPED ROUTER ---
 # Assuming we mount this under /teacher/reports/attendance or similar?
 # Or we reuse the same paths but with `get_current_teacher_user` dependency and checks.
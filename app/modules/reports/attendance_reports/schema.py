@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from pydantic import BaseModel, Field, model_validator
+from typing import Any, List, Literal, Optional, Dict
+import datetime
 from datetime import date
 
 class DailySummaryResponse(BaseModel):
@@ -19,6 +20,7 @@ class StudentMonthlySummary(BaseModel):
     present_days: int
     absent_days: int
     percentage: float
+    calendar_working_days: Optional[int] = None # From the school calendar, up to today
     
 class SectionMonthlySummary(BaseModel):
     class_id: str
@@ -50,8 +52,38 @@ class StudentRangeSummary(BaseModel):
     present_days: int
     absent_days: int
     percentage: float
+    calendar_working_days: Optional[int] = None # From the school calendar, up to today
 
 class StudentAttendanceLog(BaseModel):
     date: date
     status: str
 
+
+
+# Batch (several dashboard reports in one request)
+BATCH_REQUIRED_FIELDS = {
+    "daily_summary": ("date",),
+    "student_monthly": ("student_id", "month"),
+    "section_monthly": ("class_id", "section_id", "month"),
+    "defaulters": ("month",),
+    "trend": ("class_id", "section_id")
+}
+
+class BatchReportSpec(BaseModel):
+    type: Literal["daily_summary", "student_monthly", "section_monthly", "defaulters", "trend"]
+    month: Optional[str] = None # YYYY-MM
+    class_id: Optional[str] = None
+    section_id: Optional[str] = None
+    student_id: Optional[str] = None
+    threshold: float = 75.0 # defaulters
+    date: Optional[datetime.date] = None # daily_summary
+
+    @model_validator(mode='after')
+    def validate_required_fields(self):
+        missing = [field for field in BATCH_REQUIRED_FIELDS[self.type] if getattr(self, field) is None]
+        if missing:
+            raise ValueError(f"{self.type} report requires: {', '.join(missing)}")
+        return self
+
+class BatchReportRequest(BaseModel):
+    reports: List[BatchReportSpec] = Field(..., min_length=1, max_length=20)
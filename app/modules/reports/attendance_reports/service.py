@@ -1,8 +1,11 @@
 from datetime import datetime, date, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from app.core.database import db
 from app.modules.attendance.model import COLLECTION_NAME as ATTENDANCE_COLLECTION
 from app.core.academic_year import get_current_academic_year
+from app.modules.holidays.calendar import working_days_between
+from app.core.report_cache import RECORDS, cached_report, date_scope, section_scope
+from app.modules.attendance.rollups import ROLLUP_COLLECTION, SECTION_DAY, STUDENT_MONTH
 from app.modules.reports.attendance_reports.schema import (
     DailySummaryResponse,
     StudentMonthlySummary,
@@ -14,131 +17,122 @@ from app.modules.reports.attendance_reports.schema import (
     StudentAttendanceLog
 )
 
+# (match on attendance_rollups, stages after the match)
+RollupQuery = Tuple[dict, List[dict]]
+
 class AttendanceReportService:
     
     @staticmethod
-    def _base_match_stage(school_id: str, academic_year: str, extra_filters: dict = None):
+    def _base_match(school_id: str, academic_year: str, kind: str, extra_filters: dict = None) -> dict:
         match = {
+            "kind": kind,
             "school_id": school_id,
-            "academic_year": academic_year,
-            "status": "APPROVED",
-            "locked": True
+            "academic_year": academic_year
         }
         if extra_filters:
             match.update(extra_filters)
-        return {"$match": match}
+        return match
 
     @staticmethod
-    async def get_daily_summary(
-        school_id: str, 
-        report_date: date, 
-        class_id: Optional[str] = None, 
-        section_id: Optional[str] = None
-    ) -> DailySummaryResponse:
-        database = db.get_db()
-        academic_year = get_current_academic_year() # Or determine from date? Usually current.
-        
-        # Determine Academic Year from date if needed, but for simplicity assuming current context or passed context.
-        # Actually, best to fetch academic year config or just use the one stored in record.
-        # But we query by date, so academic_year is redundant match but good for index usage.
-        
-        match_filter = {"date": str(report_date)}
-        if class_id: match_filter["class_id"] = class_id
-        if section_id: match_filter["section_id"] = section_id
-        
+    async def _run_rollup_queries(queries: Dict[str, RollupQuery]) -> Dict[str, List[dict]]:
+        """
+        Run named (match, stages) queries against the rollups in one round trip.
+        Several queries share one $facet behind an $or of their (indexed) matches.
+        """
+        collection = db.get_db()[ROLLUP_COLLECTION]
+        if len(queries) == 1:
+            (name, (match, stages)), = queries.items()
+            return {name: await collection.aggregate([{"$match": match}, *stages]).to_list(length=None)}
+
         pipeline = [
-            AttendanceReportService._base_match_stage(school_id, academic_year, match_filter),
-            # Unwind records to count individual statuses
-            {"$unwind": "$records"},
-            {"$group": {
-                "_id": None,
-                "total_students": {"$sum": 1},
-                "present": {"$sum": {"$cond": [{"$eq": ["$records.status", "present"]}, 1, 0]}},
-                "absent": {"$sum": {"$cond": [{"$eq": ["$records.status", "absent"]}, 1, 0]}},
-                "late": {"$sum": {"$cond": [{"$eq": ["$records.status", "late"]}, 1, 0]}},
-                "half_day": {"$sum": {"$cond": [{"$eq": ["$records.status", "half_day"]}, 1, 0]}},
-                "on_leave": {"$sum": {"$cond": [{"$eq": ["$records.status", "on_leave"]}, 1, 0]}}
-            }}
+            {"$match": {"$or": [match for match, _ in queries.values()]}},
+            {"$facet": {name: [{"$match": match}, *stages] for name, (match, stages) in queries.items()}}
         ]
+        result = await collection.aggregate(pipeline).to_list(length=1)
+        return result[0] if result else {name: [] for name in queries}
+
+    @staticmethod
+    async def _calendar_working_days(school_id: str, start_date: date, end_date: date) -> int:
+        # Working days so far: a range running into the future is cut at today
+        end_date = min(end_date, date.today())
+        if end_date < start_date:
+            return 0
+        return await working_days_between(school_id, start_date, end_date)
+
+    @staticmethod
+    def _sum_counts(rollups: List[dict]) -> dict:
+        totals = {}
+        for rollup in rollups:
+            for key, value in rollup.get("counts", {}).items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    @staticmethod
+    def _daily_summary_queries(school_id: str, academic_year: str, report_date: date, class_id: Optional[str], section_id: Optional[str]) -> Dict[str, RollupQuery]:
+        # One section_day rollup per section (see app/modules/attendance/rollups.py)
+        extra = {"date": str(report_date)}
+        if class_id: extra["class_id"] = class_id
+        if section_id: extra["section_id"] = section_id
+        return {"days": (AttendanceReportService._base_match(school_id, academic_year, SECTION_DAY, extra), [{"$project": {"counts": 1}}])}
+
+    @staticmethod
+    def _daily_summary_result(report_date: date, docs: Dict[str, List[dict]]) -> DailySummaryResponse:
+        data = AttendanceReportService._sum_counts(docs["days"])
         
-        result = await database[ATTENDANCE_COLLECTION].aggregate(pipeline).to_list(1)
-        
-        if not result:
-            return DailySummaryResponse(
-                date=report_date,
-                total_students=0,
-                present=0,
-                absent=0,
-                late=0,
-                half_day=0,
-                on_leave=0,
-                attendance_percentage=0.0
-            )
-            
-        data = result[0]
-        # Calculate Percentage (Present + Late + Half Day?) usually just Present.
-        # Let's count Present + Late as Present-ish?
+        total = data.get("total", 0)
         # Standard: Present / Total * 100
-        total = data["total_students"]
-        # Policy dependent logic? Assuming simple Present count for now.
-        effective_present = data["present"] + data["late"] # Late usually counts as present
+        # Late usually counts as present
+        effective_present = data.get("present", 0) + data.get("late", 0)
         
         percentage = round((effective_present / total * 100), 2) if total > 0 else 0.0
         
         return DailySummaryResponse(
             date=report_date,
             total_students=total,
-            present=data["present"],
-            absent=data["absent"],
-            late=data["late"],
-            half_day=data["half_day"],
-            on_leave=data["on_leave"],
+            present=data.get("present", 0),
+            absent=data.get("absent", 0),
+            late=data.get("late", 0),
+            half_day=data.get("half_day", 0),
+            on_leave=data.get("on_leave", 0),
             attendance_percentage=percentage
         )
 
     @staticmethod
-    async def get_student_monthly(
-        school_id: str,
-        student_id: str,
-        month: str # YYYY-MM
-    ) -> StudentMonthlySummary:
-        database = db.get_db()
-        academic_year = get_current_academic_year()
-        
-        # Filter by regex date or start/end
-        # "date": {"$regex": f"^{month}"} logic
-        
-        pipeline = [
-            AttendanceReportService._base_match_stage(school_id, academic_year, {
-                "date": {"$regex": f"^{month}"}
-            }),
-            {"$unwind": "$records"},
-            {"$match": {"records.student_id": student_id}},
-            {"$group": {
-                "_id": "$records.student_id",
-                "total_days": {"$sum": 1},
-                "present": {"$sum": {"$cond": [{"$in": ["$records.status", ["present", "late"]]}, 1, 0]}},
-                "absent": {"$sum": {"$cond": [{"$eq": ["$records.status", "absent"]}, 1, 0]}},
-                # On Leave treated as? Absent usually or separate. "Leave treated as absent unless policy says otherwise" -> user instruction.
-                # Assuming absent for percentage calculation denominator if working day.
-            }}
-        ]
-        
-        result = await database[ATTENDANCE_COLLECTION].aggregate(pipeline).to_list(1)
+    @cached_report("daily_summary", lambda p: [date_scope(p["report_date"])])
+    async def get_daily_summary(
+        school_id: str, 
+        report_date: date, 
+        class_id: Optional[str] = None, 
+        section_id: Optional[str] = None
+    ) -> DailySummaryResponse:
+        academic_year = get_current_academic_year() # Or determine from date? Usually current.
+        docs = await AttendanceReportService._run_rollup_queries(
+            AttendanceReportService._daily_summary_queries(school_id, academic_year, report_date, class_id, section_id)
+        )
+        return AttendanceReportService._daily_summary_result(report_date, docs)
+
+    @staticmethod
+    def _student_monthly_queries(school_id: str, academic_year: str, student_id: str, month: str) -> Dict[str, RollupQuery]:
+        # The student's student_month rollups (one per section attended that month)
+        extra = {"student_id": student_id, "month": month}
+        return {"student": (AttendanceReportService._base_match(school_id, academic_year, STUDENT_MONTH, extra), [{"$project": {"counts": 1}}])}
+
+    @staticmethod
+    async def _month_working_days(school_id: str, month: str) -> Optional[int]:
+        try:
+            month_start = date.fromisoformat(f"{month}-01")
+        except ValueError:
+            return None
+        month_end = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        return await AttendanceReportService._calendar_working_days(school_id, month_start, month_end)
+
+    @staticmethod
+    def _student_monthly_result(student_id: str, month: str, docs: Dict[str, List[dict]], calendar_working_days: Optional[int]) -> StudentMonthlySummary:
+        counts = AttendanceReportService._sum_counts(docs["student"])
         
-        if not result:
-             return StudentMonthlySummary(
-                student_id=student_id,
-                month=month,
-                total_working_days=0,
-                present_days=0,
-                absent_days=0,
-                percentage=0.0
-             )
-             
-        data = result[0]
-        total = data["total_days"]
-        present = data["present"]
+        total = counts.get("total", 0)
+        # On Leave treated as absent for the percentage denominator
+        present = counts.get("present", 0) + counts.get("late", 0)
         
         pct = round((present / total * 100), 2) if total > 0 else 0.0
         
@@ -147,139 +141,130 @@ class AttendanceReportService:
             month=month,
             total_working_days=total,
             present_days=present,
-            absent_days=data["absent"],
-            percentage=pct
+            absent_days=counts.get("absent", 0),
+            percentage=pct,
+            calendar_working_days=calendar_working_days
         )
+
     @staticmethod
-    async def get_section_monthly(
+    @cached_report("student_monthly", lambda p: [RECORDS])
+    async def get_student_monthly(
         school_id: str,
-        class_id: str,
-        section_id: str,
-        month: str
-    ) -> SectionMonthlySummary:
-        database = db.get_db()
+        student_id: str,
+        month: str # YYYY-MM
+    ) -> StudentMonthlySummary:
         academic_year = get_current_academic_year()
+        docs = await AttendanceReportService._run_rollup_queries(
+            AttendanceReportService._student_monthly_queries(school_id, academic_year, student_id, month)
+        )
+        calendar_working_days = await AttendanceReportService._month_working_days(school_id, month)
+        return AttendanceReportService._student_monthly_result(student_id, month, docs, calendar_working_days)
+
+    @staticmethod
+    def _section_monthly_queries(school_id: str, academic_year: str, class_id: str, section_id: str, month: str) -> Dict[str, RollupQuery]:
+        extra = {"class_id": class_id, "section_id": section_id, "month": month}
+        # Days of the section (<= 31 docs) + students with records in it (one rollup each, index count)
+        return {
+            "days": (AttendanceReportService._base_match(school_id, academic_year, SECTION_DAY, extra), [{"$project": {"counts": 1}}]),
+            "students": (AttendanceReportService._base_match(school_id, academic_year, STUDENT_MONTH, extra), [{"$count": "n"}])
+        }
+
+    @staticmethod
+    def _section_monthly_result(class_id: str, section_id: str, month: str, docs: Dict[str, List[dict]]) -> SectionMonthlySummary:
+        data = AttendanceReportService._sum_counts(docs["days"])
+        total_students = docs["students"][0]["n"] if docs["students"] else 0
         
-        pipeline = [
-            AttendanceReportService._base_match_stage(school_id, academic_year, {
-                "class_id": class_id,
-                "section_id": section_id,
-                "date": {"$regex": f"^{month}"}
-            }),
-            {"$unwind": "$records"},
-            {"$group": {
-                "_id": None,
-                "total_student_days": {"$sum": 1},
-                "total_present": {"$sum": {"$cond": [{"$in": ["$records.status", ["present", "late"]]}, 1, 0]}},
-                "unique_students": {"$addToSet": "$records.student_id"}
-            }},
-            {"$project": {
-                "total_students": {"$size": "$unique_students"},
-                "avg_percentage": {
-                    "$cond": [
-                        {"$eq": ["$total_student_days", 0]},
-                        0,
-                        {"$multiply": [{"$divide": ["$total_present", "$total_student_days"]}, 100]}
-                    ]
-                }
-            }}
-        ]
-        
-        result = await database[ATTENDANCE_COLLECTION].aggregate(pipeline).to_list(1)
+        total_student_days = data.get("total", 0)
+        total_present = data.get("present", 0) + data.get("late", 0)
+        avg_percentage = (total_present / total_student_days * 100) if total_student_days else 0.0
         
-        if not result:
-            return SectionMonthlySummary(
-                class_id=class_id,
-                section_id=section_id,
-                month=month,
-                total_students=0,
-                avg_percentage=0.0
-            )
-            
-        data = result[0]
         return SectionMonthlySummary(
             class_id=class_id,
             section_id=section_id,
             month=month,
-            total_students=data["total_students"],
-            avg_percentage=round(data["avg_percentage"], 2)
+            total_students=total_students,
+            avg_percentage=round(avg_percentage, 2)
         )
 
     @staticmethod
-    async def get_defaulters(
+    @cached_report("section_monthly", lambda p: [section_scope(p["section_id"])])
+    async def get_section_monthly(
         school_id: str,
-        month: str,
-        threshold: float,
-        class_id: Optional[str] = None,
-        section_id: Optional[str] = None
-    ) -> List[DefaulterStudent]:
-        database = db.get_db()
+        class_id: str,
+        section_id: str,
+        month: str
+    ) -> SectionMonthlySummary:
         academic_year = get_current_academic_year()
+        docs = await AttendanceReportService._run_rollup_queries(
+            AttendanceReportService._section_monthly_queries(school_id, academic_year, class_id, section_id, month)
+        )
+        return AttendanceReportService._section_monthly_result(class_id, section_id, month, docs)
+
+    @staticmethod
+    def _defaulters_queries(school_id: str, academic_year: str, month: str, threshold: float, class_id: Optional[str], section_id: Optional[str]) -> Dict[str, RollupQuery]:
+        extra = {"month": month}
+        if class_id: extra["class_id"] = class_id
+        if section_id: extra["section_id"] = section_id
         
-        match_filter = {"date": {"$regex": f"^{month}"}}
-        if class_id: match_filter["class_id"] = class_id
-        if section_id: match_filter["section_id"] = section_id
-        
-        pipeline = [
-            AttendanceReportService._base_match_stage(school_id, academic_year, match_filter),
-            {"$unwind": "$records"},
+        # student_month rollups instead of every record of the month; a student who
+        # moved sections has one per section, so fold them per student first
+        stages = [
             {"$group": {
-                "_id": "$records.student_id",
-                "total_days": {"$sum": 1},
-                "present": {"$sum": {"$cond": [{"$in": ["$records.status", ["present", "late"]]}, 1, 0]}},
-                "absent": {"$sum": {"$cond": [{"$eq": ["$records.status", "absent"]}, 1, 0]}}
+                "_id": "$student_id",
+                "total": {"$sum": {"$ifNull": ["$counts.total", 0]}},
+                "present": {"$sum": {"$add": [{"$ifNull": ["$counts.present", 0]}, {"$ifNull": ["$counts.late", 0]}]}},
+                "absent": {"$sum": {"$ifNull": ["$counts.absent", 0]}}
             }},
             # Calculate Percentage
             {"$addFields": {
                 "percentage": {
                     "$cond": [
-                        {"$eq": ["$total_days", 0]},
+                        {"$eq": ["$total", 0]},
                         0,
-                        {"$multiply": [{"$divide": ["$present", "$total_days"]}, 100]}
+                        {"$multiply": [{"$divide": ["$present", "$total"]}, 100]}
                     ]
                 }
             }},
             # Filter Defaulters
             {"$match": {"percentage": {"$lt": threshold}}},
+            {"$limit": 1000},
             {"$project": {
+                "_id": 0,
                 "student_id": "$_id",
                 "attendance_percentage": {"$round": ["$percentage", 2]},
                 "days_absent": "$absent"
             }}
         ]
-        
-        results = await database[ATTENDANCE_COLLECTION].aggregate(pipeline).to_list(length=1000)
-        
+        return {"students": (AttendanceReportService._base_match(school_id, academic_year, STUDENT_MONTH, extra), stages)}
+
+    @staticmethod
+    def _defaulters_result(docs: Dict[str, List[dict]]) -> List[DefaulterStudent]:
         # Optional: Enrich with student names if needed (not strict requirement but nice)
-        return [DefaulterStudent(**r) for r in results]
+        return [DefaulterStudent(**r) for r in docs["students"]]
 
     @staticmethod
-    async def get_attendance_trend(
+    @cached_report("defaulters", lambda p: [section_scope(p["section_id"])] if p["section_id"] else [RECORDS])
+    async def get_defaulters(
         school_id: str,
-        class_id: str,
-        section_id: str,
-        months_back: int = 6
-    ) -> AttendanceTrendResponse:
-        database = db.get_db()
+        month: str,
+        threshold: float,
+        class_id: Optional[str] = None,
+        section_id: Optional[str] = None
+    ) -> List[DefaulterStudent]:
         academic_year = get_current_academic_year()
-        
-        # Calculate date range? Or just group by substring of month
-        # Trend over last 6 months.
-        # We can just match all dates in academic year and group by month.
-        
-        pipeline = [
-            AttendanceReportService._base_match_stage(school_id, academic_year, {
-                "class_id": class_id,
-                "section_id": section_id
-            }),
-            {"$addFields": {
-                "month_str": {"$substr": ["$date", 0, 7]} # YYYY-MM
-            }},
-            {"$unwind": "$records"},
+        docs = await AttendanceReportService._run_rollup_queries(
+            AttendanceReportService._defaulters_queries(school_id, academic_year, month, threshold, class_id, section_id)
+        )
+        return AttendanceReportService._defaulters_result(docs)
+
+    @staticmethod
+    def _attendance_trend_queries(school_id: str, academic_year: str, class_id: str, section_id: str) -> Dict[str, RollupQuery]:
+        # Section days of the academic year, grouped by month
+        stages = [
             {"$group": {
-                "_id": "$month_str",
-                "total_records": {"$sum": 1},
-                "present": {"$sum": {"$cond": [{"$in": ["$records.status", ["present", "late"]]}, 1, 0]}}
+                "_id": "$month",
+                "total_records": {"$sum": {"$ifNull": ["$counts.total", 0]}},
+                "present": {"$sum": {"$add": [{"$ifNull": ["$counts.present", 0]}, {"$ifNull": ["$counts.late", 0]}]}}
             }},
             {"$addFields": {
                 "avg_percentage": {
@@ -296,16 +281,119 @@ class AttendanceReportService:
                 "average_percentage": {"$round": ["$avg_percentage", 2]}
             }}
         ]
-        
-        results = await database[ATTENDANCE_COLLECTION].aggregate(pipeline).to_list(None)
-        
+        extra = {"class_id": class_id, "section_id": section_id}
+        return {"months": (AttendanceReportService._base_match(school_id, academic_year, SECTION_DAY, extra), stages)}
+
+    @staticmethod
+    def _attendance_trend_result(class_id: str, section_id: str, docs: Dict[str, List[dict]]) -> AttendanceTrendResponse:
         return AttendanceTrendResponse(
             class_id=class_id,
             section_id=section_id,
-            trend=[TrendDataPoint(**r) for r in results]
+            trend=[TrendDataPoint(**r) for r in docs["months"]]
         )
 
     @staticmethod
+    @cached_report("attendance_trend", lambda p: [section_scope(p["section_id"])])
+    async def get_attendance_trend(
+        school_id: str,
+        class_id: str,
+        section_id: str,
+        months_back: int = 6
+    ) -> AttendanceTrendResponse:
+        academic_year = get_current_academic_year()
+        docs = await AttendanceReportService._run_rollup_queries(
+            AttendanceReportService._attendance_trend_queries(school_id, academic_year, class_id, section_id)
+        )
+        return AttendanceReportService._attendance_trend_result(class_id, section_id, docs)
+
+    @staticmethod
+    async def get_batch(school_id: str, specs: List[dict]) -> List[Any]:
+        """
+        Several dashboard reports in one $facet over the rollups (one DB round trip).
+        specs: {"type": <BATCH_REPORT_TYPES>, ...params of that report}; results keep spec order.
+        """
+        academic_year = get_current_academic_year()
+        
+        queries = {}
+        for index, spec in enumerate(specs):
+            for name, query in AttendanceReportService._batch_queries(school_id, academic_year, spec).items():
+                queries[f"{index}_{name}"] = query
+        
+        docs = await AttendanceReportService._run_rollup_queries(queries)
+        
+        results = []
+        for index, spec in enumerate(specs):
+            prefix = f"{index}_"
+            spec_docs = {key[len(prefix):]: value for key, value in docs.items() if key.startswith(prefix)}
+            results.append(await AttendanceReportService._batch_result(school_id, spec, spec_docs))
+        return results
+
+    @staticmethod
+    def _batch_queries(school_id: str, academic_year: str, spec: dict) -> Dict[str, RollupQuery]:
+        report_type = spec["type"]
+        if report_type == "daily_summary":
+            return AttendanceReportService._daily_summary_queries(school_id, academic_year, spec["date"], spec.get("class_id"), spec.get("section_id"))
+        if report_type == "student_monthly":
+            return AttendanceReportService._student_monthly_queries(school_id, academic_year, spec["student_id"], spec["month"])
+        if report_type == "section_monthly":
+            return AttendanceReportService._section_monthly_queries(school_id, academic_year, spec["class_id"], spec["section_id"], spec["month"])
+        if report_type == "defaulters":
+            return AttendanceReportService._defaulters_queries(school_id, academic_year, spec["month"], spec["threshold"], spec.get("class_id"), spec.get("section_id"))
+        if report_type == "trend":
+            return AttendanceReportService._attendance_trend_queries(school_id, academic_year, spec["class_id"], spec["section_id"])
+        raise ValueError(f"Unknown report type: {report_type}")
+
+    @staticmethod
+    async def _batch_result(school_id: str, spec: dict, docs: Dict[str, List[dict]]) -> Any:
+        report_type = spec["type"]
+        if report_type == "daily_summary":
+            return AttendanceReportService._daily_summary_result(spec["date"], docs)
+        if report_type == "student_monthly":
+            calendar_working_days = await AttendanceReportService._month_working_days(school_id, spec["month"])
+            return AttendanceReportService._student_monthly_result(spec["student_id"], spec["month"], docs, calendar_working_days)
+        if report_type == "section_monthly":
+            return AttendanceReportService._section_monthly_result(spec["class_id"], spec["section_id"], spec["month"], docs)
+        if report_type == "defaulters":
+            return AttendanceReportService._defaulters_result(docs)
+        return AttendanceReportService._attendance_trend_result(spec["class_id"], spec["section_id"], docs)
+
+    @staticmethod
+    def _student_records_pipeline(
+        school_id: str,
+        academic_year: str,
+        student_id: str,
+        start_date: date,
+        end_date: date
+    ) -> List[dict]:
+        """
+        Submissions containing this student in [start_date, end_date], reduced to
+        {date, status} for that student only. The first stage is covered by
+        student_attendance_student_idx, so only the student's own section documents
+        are read, and records are filtered in place rather than unwound.
+        """
+        return [
+            {"$match": {
+                "school_id": school_id,
+                "records.student_id": student_id,
+                "date": {"$gte": str(start_date), "$lte": str(end_date)},
+                "academic_year": academic_year,
+                "status": "APPROVED",
+                "locked": True
+            }},
+            {"$project": {
+                "_id": 0,
+                "date": 1,
+                "status": {"$arrayElemAt": [{"$filter": {
+                    "input": "$records",
+                    "as": "record",
+                    "cond": {"$eq": ["$$record.student_id", student_id]}
+                }}, 0]}
+            }},
+            {"$project": {"date": 1, "status": "$status.status"}}
+        ]
+
+    @staticmethod
+    @cached_report("student_range_summary", lambda p: [RECORDS])
     async def get_student_range_summary(
         school_id: str,
         student_id: str,
@@ -315,21 +403,19 @@ class AttendanceReportService:
         database = db.get_db()
         academic_year = get_current_academic_year()
         
-        pipeline = [
-            AttendanceReportService._base_match_stage(school_id, academic_year, {
-                "date": {"$gte": str(start_date), "$lte": str(end_date)}
-            }),
-            {"$unwind": "$records"},
-            {"$match": {"records.student_id": student_id}},
+        pipeline = AttendanceReportService._student_records_pipeline(
+            school_id, academic_year, student_id, start_date, end_date
+        ) + [
             {"$group": {
-                "_id": "$records.student_id",
+                "_id": None,
                 "total_days": {"$sum": 1},
-                "present": {"$sum": {"$cond": [{"$in": ["$records.status", ["present", "late"]]}, 1, 0]}},
-                "absent": {"$sum": {"$cond": [{"$eq": ["$records.status", "absent"]}, 1, 0]}}
+                "present": {"$sum": {"$cond": [{"$in": ["$status", ["present", "late"]]}, 1, 0]}},
+                "absent": {"$sum": {"$cond": [{"$eq": ["$status", "absent"]}, 1, 0]}}
             }}
         ]
         
         result = await database[ATTENDANCE_COLLECTION].aggregate(pipeline).to_list(1)
+        calendar_working_days = await AttendanceReportService._calendar_working_days(school_id, start_date, end_date)
         
         if not result:
             return StudentRangeSummary(
@@ -339,7 +425,8 @@ class AttendanceReportService:
                 total_working_days=0,
                 present_days=0,
                 absent_days=0,
-                percentage=0.0
+                percentage=0.0,
+                calendar_working_days=calendar_working_days
             )
             
         data = result[0]
@@ -354,10 +441,12 @@ class AttendanceReportService:
             total_working_days=total,
             present_days=present,
             absent_days=data["absent"],
-            percentage=pct
+            percentage=pct,
+            calendar_working_days=calendar_working_days
         )
 
     @staticmethod
+    @cached_report("student_history", lambda p: [RECORDS])
     async def get_student_history(
         school_id: str,
         student_id: str,
@@ -367,17 +456,10 @@ class AttendanceReportService:
         database = db.get_db()
         academic_year = get_current_academic_year()
         
-        pipeline = [
-            AttendanceReportService._base_match_stage(school_id, academic_year, {
-                "date": {"$gte": str(start_date), "$lte": str(end_date)}
-            }),
-            {"$unwind": "$records"},
-            {"$match": {"records.student_id": student_id}},
-            {"$sort": {"date": -1}}, # Latest first
-            {"$project": {
-                "date": "$date",
-                "status": "$records.status"
-            }}
+        pipeline = AttendanceReportService._student_records_pipeline(
+            school_id, academic_year, student_id, start_date, end_date
+        ) + [
+            {"$sort": {"date": -1}} # Latest first
         ]
         
         results = await database[ATTENDANCE_COLLECTION].aggregate(pipeline).to_list(None)
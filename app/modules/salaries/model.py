@@ -37,6 +37,7 @@ class SalaryCalculation(BaseModel):
     allowances_total: float
     gross: float
     deductions_total: float
+    loss_of_pay: float = 0.0 # Absent days x gross / working days
     net_payable: float
 
 class PaymentInfo(BaseModel):
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, Query
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, Query
 from app.core.dependencies import get_current_school_user
 from app.modules.salaries.schema import (
     SalaryStructureRequest, SalaryStructureResponse, 
     GenerateSalaryRequest, MarkPaidRequest, 
     SalaryListResponse, GenericResponse
 )
+from app.modules.jobs.schema import JobResponse
 from app.modules.salaries.service import SalaryService
 
 router = APIRouter()
@@ -25,23 +27,28 @@ async def set_salary_structure(
         school_id=current_user["school_id"]
     )
 
-@router.post("/salaries/generate", response_model=GenericResponse)
+@router.post("/salaries/generate", response_model=JobResponse, status_code=202)
 async def generate_salaries(
     request: GenerateSalaryRequest,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     current_user: dict = Depends(get_current_school_user)
 ):
     """
     Generate Monthly Salaries for all active teachers.
+    Runs as a background job; poll /school/jobs/{job_id} for progress and the result.
+    Repeating a request with the same Idempotency-Key returns the original job.
     """
-    result = await SalaryService.generate_monthly_salaries(
+    job = await SalaryService.start_salary_generation(
         request=request,
         org_id=current_user["org_id"],
-        school_id=current_user["school_id"]
+        school_id=current_user["school_id"],
+        created_by=current_user["_id"],
+        idempotency_key=idempotency_key
     )
-    # Mapping loose dict to GenericResponse if needed, or return direct
     return {
-        "success": result["success"],
-        "message": result["message"]
+        "success": True,
+        "message": f"Salary generation for {request.month} queued",
+        "data": job
     }
 
 @router.get("/salaries", response_model=SalaryListResponse)
@@ -1,7 +1,13 @@
-from datetime import datetime
+from datetime import date, datetime, timedelta
+from typing import Optional
 from uuid import uuid4
 from fastapi import HTTPException
+from pymongo import UpdateOne
 from app.core.database import get_database
+from app.core.jobs.queue import enqueue, job_handler
+from app.core.jobs.runner import JobContext
+from app.modules.holidays.calendar import working_dates_between
+from app.modules.staff_attendance.service import StaffAttendanceService
 from app.modules.salaries.model import (
     TeacherSalaryStructure, TeacherSalary, 
     AttendanceSummary, SalaryCalculation, PaymentInfo
@@ -69,96 +75,158 @@ class SalaryService:
         return struct
 
     @staticmethod
-    async def generate_monthly_salaries(
+    async def start_salary_generation(
         request: GenerateSalaryRequest,
         org_id: str,
-        school_id: str
-    ):
+        school_id: str,
+        created_by: str = None,
+        idempotency_key: str = None
+    ) -> dict:
+        """
+        Validate the request and queue generation as a background job.
+        Returns the job document; poll GET /school/jobs/{job_id} for progress.
+        """
+        try:
+            date.fromisoformat(f"{request.month}-01")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Month must be in YYYY-MM format")
+        
+        return await enqueue(
+            kind="salary_generation",
+            payload={"month": request.month, "org_id": org_id, "school_id": school_id},
+            school_id=school_id,
+            org_id=org_id,
+            created_by=created_by,
+            idempotency_key=f"salary_generation:{school_id}:{idempotency_key}" if idempotency_key else None
+        )
+
+    @staticmethod
+    async def generate_monthly_salaries(
+        month: str,
+        org_id: str,
+        school_id: str,
+        job: Optional[JobContext] = None
+    ) -> dict:
+        """
+        Create missing salary records of a month for all active teachers.
+        Teachers, existing salaries, active structures and staff attendance are
+        read in four queries; records are written with one unordered bulk_write. Upserts on the
+        deterministic salary _id make a re-run (or a concurrent run) harmless.
+        """
         db = await get_database()
         
+        # Working days of the month from the school calendar (holidays + weekly offs)
+        month_start = date.fromisoformat(f"{month}-01")
+        month_end = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        working_dates = await working_dates_between(school_id, month_start, month_end)
+        month_working_days = len(working_dates)
+        
         # 1. Get All Active Teachers in School
-        teachers_cursor = db["teachers"].find({"school_id": school_id, "status": "active"})
-        teachers = await teachers_cursor.to_list(length=1000)
+        teachers = await db["teachers"].find(
+            {"school_id": school_id, "status": "active"}, {"_id": 1}
+        ).to_list(length=None)
+        teacher_ids = [teacher["_id"] for teacher in teachers]
+        if job:
+            await job.progress(0, total=len(teacher_ids), stage="loading")
+        
+        # 2. Prefetch existing salaries of the month and active structures
+        existing = set(await db["teacher_salaries"].distinct(
+            "teacher_id", {"school_id": school_id, "month": month}
+        ))
+        structures = {}
+        async for struct in db["teacher_salary_structures"].find({
+            "school_id": school_id,
+            "teacher_id": {"$in": [t_id for t_id in teacher_ids if t_id not in existing]},
+            "status": "active"
+        }):
+            structures[struct["teacher_id"]] = struct
+        
+        # Staff attendance of the month for all teachers at once (one aggregation)
+        marked_days, staff_counts = await StaffAttendanceService.get_counts(school_id, working_dates)
+        source = "ATTENDANCE_MODULE" if marked_days else "SYSTEM_DEFAULT"
         
-        generated_count = 0
         errors = []
+        operations = []
         
-        for teacher in teachers:
-            t_id = teacher["_id"]
-            
-            # 2. Check for existing Salary for this month
-            existing = await db["teacher_salaries"].find_one({
-                "teacher_id": t_id,
-                "month": request.month
-            })
-            if existing:
+        for t_id in teacher_ids:
+            if t_id in existing:
                 # Skip if already exists (or maybe update if not locked? But user said 'Generate' usually implies creation)
                 # Let's skip to avoid overwriting logic unless explicit recalculate.
                 continue
                 
             # 3. Get Active Structure
-            struct = await db["teacher_salary_structures"].find_one({
-                "teacher_id": t_id,
-                "status": "active"
-            })
+            struct = structures.get(t_id)
             
             if not struct:
                 errors.append(f"No active structure for teacher {t_id}")
                 continue
             
-            # 4. Calculation Logic (Assumption: 26 Working Days, Full Attendance)
-            # Default Values
-            working_days = 26
-            present = 26
-            absent = 0
-            paid_leaves = 0
-            
-            # TODO: Future Attendance Integration here
+            # 4. Attendance on calendar working days (full attendance if the month has no staff attendance)
+            working_days = month_working_days
+            counts = staff_counts.get(t_id, {})
+            absent = counts.get("absent", 0)
+            paid_leaves = counts.get("paid_leaves", 0)
+            present = working_days - absent - paid_leaves
             
             # Calculate Amounts
-            # Simple Logic: (Basic / Working Days) * Present ??? 
-            # OR Fixed Monthly if full attendance?
-            # User instructions imply: "Set attendance_summary as: present = working_days... Calculate salary"
-            # We will assume full salary for now as per "Attendance assumed FULL by default"
-            
+            # Paid leaves are paid; each absent day deducts gross / working days (loss of pay)
             basic_amt = struct["basic"]
             allowances_total = sum(struct["allowances"].values())
             gross = basic_amt + allowances_total
             deductions_total = sum(struct["deductions"].values())
-            net = gross - deductions_total
+            loss_of_pay = round(gross / working_days * absent, 2) if working_days else 0.0
+            net = round(gross - deductions_total - loss_of_pay, 2)
             
             # 5. Create Salary Record
-            sal_id = f"salary_{request.month.replace('-', '')}_{t_id}"
+            sal_id = f"salary_{month.replace('-', '')}_{t_id}"
             
             salary_doc = TeacherSalary(
                 _id=sal_id,
                 org_id=org_id,
                 school_id=school_id,
                 teacher_id=t_id,
-                month=request.month,
+                month=month,
                 attendance_summary=AttendanceSummary(
                     working_days=working_days,
                     present=present,
                     absent=absent,
                     paid_leaves=paid_leaves,
-                    source="SYSTEM_DEFAULT"
+                    source=source
                 ),
                 calculation=SalaryCalculation(
                     basic=basic_amt,
                     allowances_total=allowances_total,
                     gross=gross,
                     deductions_total=deductions_total,
+                    loss_of_pay=loss_of_pay,
                     net_payable=net
                 ),
                 payment=PaymentInfo(status="pending")
             )
             
-            await db["teacher_salaries"].insert_one(salary_doc.model_dump(by_alias=True))
-            generated_count += 1
+            operations.append(UpdateOne(
+                {"_id": sal_id},
+                {"$setOnInsert": salary_doc.model_dump(by_alias=True)},
+                upsert=True
+            ))
+        
+        if job:
+            await job.progress(len(teacher_ids) - len(operations), stage="writing")
+        
+        generated_count = 0
+        if operations:
+            result = await db["teacher_salaries"].bulk_write(operations, ordered=False)
+            generated_count = result.upserted_count
+        
+        if job:
+            await job.progress(len(teacher_ids), stage="done")
             
         return {
-            "success": True, 
-            "message": f"Generated salaries for {generated_count} teachers",
+            "month": month,
+            "teachers": len(teacher_ids),
+            "generated": generated_count,
+            "attendance_source": source,
+            "skipped_existing": len(existing & set(teacher_ids)),
             "errors": errors
         }
 
@@ -221,3 +289,13 @@ class SalaryService:
         
         results = await db["teacher_salaries"].aggregate(pipeline).to_list(length=1000)
         return results
+
+@job_handler("salary_generation")
+async def run_salary_generation(job: JobContext) -> dict:
+    # Safe to retry: salary records are upserted on their deterministic _id
+    return await SalaryService.generate_monthly_salaries(
+        month=job.payload["month"],
+        org_id=job.payload["org_id"],
+        school_id=job.payload["school_id"],
+        job=job
+    )
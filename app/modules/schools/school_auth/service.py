@@ -6,6 +6,7 @@ from app.modules.schools.school_auth.schema import LoginRequest, TokenResponse,
 from app.core.security_school import verify_password, create_access_token, get_password_hash, create_refresh_token, decode_refresh_token
 
 from app.core.guards import validate_login_status
+from app.core.principal_cache import invalidate_principals
 
 class SchoolAuthService:
     @staticmethod
@@ -18,7 +19,7 @@ class SchoolAuthService:
             raise HTTPException(status_code=401, detail="Invalid email or password")
             
         # 2. Verify Password
-        if not verify_password(login_data.password, user["password"]):
+        if not await verify_password(login_data.password, user["password"]):
             raise HTTPException(status_code=401, detail="Invalid email or password")
             
         # 3. Validate Status Hierarchy (Fail Fast)
@@ -120,13 +121,14 @@ class SchoolAuthService:
         if not user:
             raise HTTPException(404, "User not found")
             
-        if not verify_password(payload.old_password, user["password"]):
+        if not await verify_password(payload.old_password, user["password"]):
              raise HTTPException(400, "Incorrect old password")
              
-        hashed_new_pass = get_password_hash(payload.new_password)
+        hashed_new_pass = await get_password_hash(payload.new_password)
         
         await db["school_users"].update_one(
             {"_id": user_id},
             {"$set": {"password": hashed_new_pass, "updated_at": datetime.utcnow()}}
         )
+        invalidate_principals(user_id)
         return True
@@ -17,7 +17,7 @@ class SchoolUserService:
         # 1. Generate Credentials
         email = f"admin@{school_code.lower()}.schoolapp.com"
         plain_password = SchoolUserService.generate_strong_password()
-        hashed_password = get_password_hash(plain_password)
+        hashed_password = await get_password_hash(plain_password)
         
         # 2. Create User Object
         # Note: We store plain_password temporarily in the object to return it ONCE
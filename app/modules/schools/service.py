@@ -2,6 +2,8 @@ from datetime import datetime
 from app.core.database import get_database
 from app.modules.schools.model import School, SchoolAddress, SchoolContact, SchoolSettings, SchoolBranding
 from app.core.security_school import create_access_token
+from app.core.principal_cache import invalidate_principals
+from app.core.tenant_status import bump_tenant_version
 from app.modules.schools.school_users.service import SchoolUserService
 from app.modules.schools.schema import CreateSchoolRequest, UpdateSchoolRequest, SchoolCreationResponse, CreateSchoolAdminResponse
 
@@ -164,6 +166,9 @@ class SchoolService:
             {"_id": school_id},
             {"$set": {"status": status, "updated_at": datetime.utcnow()}}
         )
+        # Cached school/student/teacher principals carry the old school status
+        invalidate_principals(school_id)
+        await bump_tenant_version(school_id=school_id)
         return True
 
     @staticmethod
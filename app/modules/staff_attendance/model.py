@@ -0,0 +1,19 @@
+from app.core.database import db
+import pymongo
+
+COLLECTION_NAME = "staff_attendance"
+
+async def ensure_staff_attendance_indexes():
+    """
+    One staff attendance document per school per day.
+    """
+    if db.client:
+        database = db.get_db()
+        collection = database[COLLECTION_NAME]
+        
+        # Unique Index: school_id + date
+        await collection.create_index(
+            [("school_id", pymongo.ASCENDING), ("date", pymongo.ASCENDING)],
+            unique=True,
+            name="unique_school_staff_date_idx"
+        )
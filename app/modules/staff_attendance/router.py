@@ -0,0 +1,68 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.core.dependencies import get_current_school_user
+from app.modules.staff_attendance.schema import (
+    MarkStaffAttendanceRequest, StaffAttendanceResponse, StaffMonthlySummaryResponse
+)
+from app.modules.staff_attendance.service import StaffAttendanceService
+
+router = APIRouter()
+
+@router.post("/staff-attendance/mark", response_model=StaffAttendanceResponse)
+async def mark_staff_attendance(
+    request: MarkStaffAttendanceRequest,
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    Mark Teacher Attendance for a working day (School Admin Only).
+    - Re-marking a day replaces its records.
+    """
+    if current_user["role"] != "SCHOOL_ADMIN":
+         raise HTTPException(
+            status_code=403, 
+            detail="Only School Admin can mark staff attendance."
+        )
+    
+    result = await StaffAttendanceService.mark_attendance(
+        request=request,
+        org_id=current_user["org_id"],
+        school_id=current_user["school_id"],
+        marked_by=current_user["_id"]
+    )
+    
+    return {
+        "success": True,
+        "message": "Staff attendance marked successfully",
+        "data": result
+    }
+
+@router.get("/staff-attendance", response_model=StaffAttendanceResponse)
+async def get_staff_attendance(
+    date: str = Query(..., description="YYYY-MM-DD"),
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    Staff attendance of one day.
+    """
+    result = await StaffAttendanceService.get_day(current_user["school_id"], date)
+    if not result:
+        raise HTTPException(status_code=404, detail="No staff attendance marked for this date")
+    
+    return {
+        "success": True,
+        "message": "Staff attendance retrieved successfully",
+        "data": result
+    }
+
+@router.get("/staff-attendance/summary", response_model=StaffMonthlySummaryResponse)
+async def get_staff_attendance_summary(
+    month: str = Query(..., description="YYYY-MM"),
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    Per-teacher present / absent / paid leave counts of a month (working days so far).
+    """
+    data = await StaffAttendanceService.get_monthly_summary(current_user["school_id"], month)
+    return {
+        "success": True,
+        "data": data
+    }
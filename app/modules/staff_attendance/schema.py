@@ -0,0 +1,46 @@
+from typing import Dict, List, Literal, Optional
+from pydantic import BaseModel, Field, field_validator
+import re
+
+# --- Shared ---
+class StaffAttendanceRecordItem(BaseModel):
+    teacher_id: str
+    status: Literal["present", "absent", "half_day", "leave"] # leave = paid leave
+
+# --- Requests ---
+class MarkStaffAttendanceRequest(BaseModel):
+    date: str = Field(..., description="YYYY-MM-DD")
+    records: List[StaffAttendanceRecordItem] = Field(..., min_length=1)
+    
+    @field_validator('date')
+    def validate_date(cls, v):
+        if not re.match(r"^\d{4}-\d{2}-\d{2}$", v):
+            raise ValueError("Date must be in YYYY-MM-DD format")
+        return v
+
+# --- Responses ---
+class StaffAttendanceDay(BaseModel):
+    date: str
+    records: List[StaffAttendanceRecordItem]
+    marked_by: Optional[str] = None
+
+class StaffAttendanceResponse(BaseModel):
+    success: bool
+    message: str
+    data: Optional[StaffAttendanceDay] = None
+
+class StaffMonthlyCounts(BaseModel):
+    teacher_id: str
+    present: float
+    absent: float
+    paid_leaves: float
+
+class StaffMonthlySummaryData(BaseModel):
+    month: str
+    working_days: int
+    marked_days: int
+    teachers: List[StaffMonthlyCounts]
+
+class StaffMonthlySummaryResponse(BaseModel):
+    success: bool
+    data: StaffMonthlySummaryData
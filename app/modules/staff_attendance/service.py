@@ -0,0 +1,122 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, Optional, Tuple
+from fastapi import HTTPException
+from app.core.database import get_database
+from app.modules.holidays.calendar import is_working_day, working_dates_between
+from app.modules.staff_attendance.model import COLLECTION_NAME
+from app.modules.staff_attendance.schema import MarkStaffAttendanceRequest
+
+class StaffAttendanceService:
+
+    @staticmethod
+    async def mark_attendance(
+        request: MarkStaffAttendanceRequest,
+        org_id: str,
+        school_id: str,
+        marked_by: str
+    ) -> dict:
+        """
+        Record (or replace) the staff attendance of one working day.
+        """
+        db = await get_database()
+        
+        # 1. Validate Date
+        try:
+            day = date.fromisoformat(request.date)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid date")
+        if day > date.today():
+            raise HTTPException(status_code=400, detail="Cannot mark staff attendance for a future date")
+        if not await is_working_day(school_id, day):
+            raise HTTPException(status_code=400, detail="Cannot mark staff attendance on a holiday or weekly off")
+        
+        # 2. Validate Teachers (one query for the whole list)
+        records = {r.teacher_id: r.model_dump() for r in request.records}
+        found = await db["teachers"].distinct("_id", {
+            "_id": {"$in": list(records)},
+            "school_id": school_id,
+            "status": "active"
+        })
+        unknown = sorted(set(records) - set(found))
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown or inactive teachers: {', '.join(unknown)}")
+        
+        # 3. Upsert Day
+        now = datetime.utcnow()
+        await db[COLLECTION_NAME].update_one(
+            {"school_id": school_id, "date": request.date},
+            {
+                "$set": {"records": list(records.values()), "marked_by": marked_by, "updated_at": now},
+                "$setOnInsert": {"org_id": org_id, "created_at": now}
+            },
+            upsert=True
+        )
+        
+        return {"date": request.date, "records": list(records.values()), "marked_by": marked_by}
+
+    @staticmethod
+    async def get_day(school_id: str, day: str) -> Optional[dict]:
+        db = await get_database()
+        return await db[COLLECTION_NAME].find_one(
+            {"school_id": school_id, "date": day},
+            {"_id": 0, "date": 1, "records": 1, "marked_by": 1}
+        )
+
+    @staticmethod
+    async def get_counts(school_id: str, working_dates: Iterable[date]) -> Tuple[int, Dict[str, dict]]:
+        """
+        (marked days, per-teacher {present, absent, paid_leaves}) over the given
+        working dates, for all teachers of the school in one aggregation.
+        A half day counts 0.5 present + 0.5 absent; working days without a record
+        for a teacher count as present, so unlisted teachers have full attendance.
+        """
+        db = await get_database()
+        working_dates = [str(d) for d in working_dates]
+        
+        pipeline = [
+            {"$match": {"school_id": school_id, "date": {"$in": working_dates}}},
+            {"$facet": {
+                "marked_days": [{"$count": "n"}],
+                "teachers": [
+                    {"$unwind": "$records"},
+                    {"$group": {
+                        "_id": "$records.teacher_id",
+                        "absent": {"$sum": {"$switch": {"branches": [
+                            {"case": {"$eq": ["$records.status", "absent"]}, "then": 1},
+                            {"case": {"$eq": ["$records.status", "half_day"]}, "then": 0.5}
+                        ], "default": 0}}},
+                        "paid_leaves": {"$sum": {"$cond": [{"$eq": ["$records.status", "leave"]}, 1, 0]}}
+                    }}
+                ]
+            }}
+        ]
+        result = (await db[COLLECTION_NAME].aggregate(pipeline).to_list(length=1))[0]
+        marked_days = result["marked_days"][0]["n"] if result["marked_days"] else 0
+        
+        total = len(working_dates)
+        return marked_days, {
+            row["_id"]: {
+                "present": total - row["absent"] - row["paid_leaves"],
+                "absent": row["absent"],
+                "paid_leaves": row["paid_leaves"]
+            }
+            for row in result["teachers"]
+        }
+
+    @staticmethod
+    async def get_monthly_summary(school_id: str, month: str) -> dict:
+        try:
+            month_start = date.fromisoformat(f"{month}-01")
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Month must be in YYYY-MM format")
+        month_end = (month_start.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+        
+        working_dates = await working_dates_between(school_id, month_start, min(month_end, date.today()))
+        marked_days, counts = await StaffAttendanceService.get_counts(school_id, working_dates)
+        
+        return {
+            "month": month,
+            "working_days": len(working_dates),
+            "marked_days": marked_days,
+            "teachers": [{"teacher_id": t_id, **c} for t_id, c in sorted(counts.items())]
+        }
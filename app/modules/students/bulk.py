@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+from typing import List, Tuple
+
+# Flat CSV column -> nested StudentAdmissionRequest path
+CSV_COLUMNS = {
+    "class_id": ("academic", "class_id"),
+    "section_id": ("academic", "section_id"),
+    "admission_no": ("academic", "admission_no"),
+    "first_name": ("personal", "first_name"),
+    "last_name": ("personal", "last_name"),
+    "gender": ("personal", "gender"),
+    "dob": ("personal", "dob"),
+    "father_name": ("parent", "father_name"),
+    "mother_name": ("parent", "mother_name"),
+    "mobile": ("parent", "mobile"),
+    "email": ("parent", "email"),
+}
+
+class BulkParseError(ValueError):
+    pass
+
+def _nest(flat: dict) -> dict:
+    row = {"academic": {}, "personal": {}, "parent": {}}
+    for column, value in flat.items():
+        path = CSV_COLUMNS.get((column or "").strip())
+        if path and value not in (None, ""):
+            row[path[0]][path[1]] = value.strip() if isinstance(value, str) else value
+    return row
+
+def parse_csv(content: bytes) -> List[Tuple[int, object]]:
+    """
+    Header row with CSV_COLUMNS names. Returns (line_no, nested row dict).
+    """
+    reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig")))
+    missing = {"class_id", "section_id", "admission_no"} - set(reader.fieldnames or [])
+    if missing:
+        raise BulkParseError(f"CSV header is missing columns: {', '.join(sorted(missing))}")
+    # Line 1 is the header
+    return [(i + 2, _nest(record)) for i, record in enumerate(reader)]
+
+def parse_ndjson(content: bytes) -> List[Tuple[int, object]]:
+    """
+    One JSON object per line, either nested like StudentAdmissionRequest or flat like the CSV.
+    Lines that are not valid JSON are returned as an error string for that row.
+    """
+    rows = []
+    for i, line in enumerate(content.decode("utf-8-sig").splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            rows.append((i, f"Invalid JSON: {e.msg}"))
+            continue
+        if not isinstance(record, dict):
+            rows.append((i, "Each line must be a JSON object"))
+        elif "academic" in record:
+            rows.append((i, record))
+        else:
+            rows.append((i, _nest(record)))
+    return rows
+
+def parse_admission_file(content: bytes, filename: str = None, content_type: str = None) -> List[Tuple[int, object]]:
+    name = (filename or "").lower()
+    ctype = (content_type or "").lower()
+    if name.endswith(".csv") or "csv" in ctype:
+        return parse_csv(content)
+    if name.endswith((".ndjson", ".jsonl")) or "ndjson" in ctype or "jsonl" in ctype:
+        return parse_ndjson(content)
+    raise BulkParseError("Unsupported file type. Upload .csv or .ndjson")
@@ -1,6 +1,8 @@
 from typing import Optional, Union
 from datetime import datetime, date
 from pydantic import BaseModel, Field, EmailStr
+from app.core.database import db
+import pymongo
 
 class AcademicInfo(BaseModel):
     class_id: str
@@ -35,3 +37,21 @@ class Student(BaseModel):
 
     class Config:
         populate_by_name = True
+
+async def ensure_student_indexes():
+    """
+    Index for the student list. Class / section filters use its prefix; pages seek on (roll_no, _id).
+    """
+    if db.client:
+        collection = db.get_db()["students"]
+        await collection.create_index(
+            [
+                ("school_id", pymongo.ASCENDING),
+                ("status", pymongo.ASCENDING),
+                ("academic.class_id", pymongo.ASCENDING),
+                ("academic.section_id", pymongo.ASCENDING),
+                ("academic.roll_no", pymongo.ASCENDING),
+                ("_id", pymongo.ASCENDING)
+            ],
+            name="student_list_idx"
+        )
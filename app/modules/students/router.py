@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Optional
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, UploadFile
+from app.core.academic_year import get_current_academic_year
+from app.core.roll_number import get_unused_roll_numbers
+from app.core.config import settings
 from app.core.dependencies import get_current_school_user
+from app.modules.students.bulk import BulkParseError, parse_admission_file
 from app.modules.students.schema import StudentAdmissionRequest, StudentAdmissionResponse
+from app.modules.jobs.schema import JobResponse
 from app.modules.students.service import StudentService
+from app.utils.response import APIResponse
 
 router = APIRouter(prefix="/students")
 
@@ -39,3 +46,105 @@ async def admit_student(
         "message": "Student admitted successfully",
         "data": result
     }
+
+@router.post("/bulk", response_model=JobResponse, status_code=202)
+async def admit_students_bulk(
+    file: UploadFile = File(..., description="CSV (header row) or NDJSON (one admission per line)"),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    Admit many students from a CSV or NDJSON file, as a background job.
+    The job result (GET /school/jobs/{job_id}) has one entry per row
+    (BulkAdmissionResponseData); failed rows do not block the rest.
+    Temporary passwords are not part of the result: they come back once, as "credentials"
+    (BulkAdmissionCredential), on the uploader's first read of the finished job.
+    Repeating a request with the same Idempotency-Key returns the original job; without
+    the header every upload is a new admission.
+    Only accessible by SCHOOL_ADMIN.
+    """
+    if current_user.get("role") != "SCHOOL_ADMIN":
+         raise HTTPException(status_code=403, detail="Only School Admins can admit students")
+
+    content = await file.read()
+    try:
+        rows = parse_admission_file(content, file.filename, file.content_type)
+    except (BulkParseError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if not rows:
+        raise HTTPException(status_code=400, detail="File contains no rows")
+    if len(rows) > settings.BULK_ADMISSION_MAX_ROWS:
+        raise HTTPException(status_code=400, detail=f"Too many rows (max {settings.BULK_ADMISSION_MAX_ROWS} per upload)")
+
+    job = await StudentService.start_bulk_admission(
+        rows=rows,
+        org_id=current_user.get("org_id"),
+        school_id=current_user["school_id"],
+        created_by=current_user["_id"],
+        idempotency_key=idempotency_key
+    )
+
+    return {
+        "success": True,
+        "message": f"Admission of {len(rows)} rows queued",
+        "data": job
+    }
+
+@router.get("")
+async def list_students(
+    class_id: Optional[str] = None,
+    section_id: Optional[str] = None,
+    academic_year: Optional[str] = None,
+    status: str = "active",
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Add estimated_total (cached count) to meta"),
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    List students of the school by class, section and roll number.
+    """
+    page = await StudentService.list_students(
+        school_id=current_user["school_id"],
+        class_id=class_id,
+        section_id=section_id,
+        academic_year=academic_year,
+        status=status,
+        limit=limit,
+        cursor=cursor,
+        with_total=include_total
+    )
+
+    meta = {
+        "limit": limit,
+        "next_cursor": page["next_cursor"],
+        "estimated_total": page["estimated_total"]
+    }
+    return APIResponse.success(page["items"], "Students retrieved", meta=meta)
+
+@router.get("/roll-numbers/unused")
+async def get_unused_roll_numbers_report(
+    class_id: str,
+    section_id: str,
+    academic_year: Optional[str] = Query(None, description="Defaults to the current academic year"),
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    Roll numbers reserved for a section but never assigned (failed admissions, returned leases).
+    """
+    if current_user.get("role") != "SCHOOL_ADMIN":
+         raise HTTPException(status_code=403, detail="Only School Admins can view roll number reports")
+
+    data = await get_unused_roll_numbers(
+        school_id=current_user["school_id"],
+        class_id=class_id,
+        section_id=section_id,
+        academic_year=academic_year or get_current_academic_year()
+    )
+
+    return {
+        "success": True,
+        "message": "Unused roll numbers retrieved successfully",
+        "data": data
+    }
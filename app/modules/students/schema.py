@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import date
 from pydantic import BaseModel, EmailStr, Field
 
@@ -45,3 +45,36 @@ class StudentAdmissionResponse(BaseModel):
     success: bool
     message: str
     data: StudentAdmissionResponseData
+
+
+# Bulk Admission
+class BulkAdmissionLogin(BaseModel):
+    username: str
+
+class BulkAdmissionRowResult(BaseModel):
+    row: int
+    status: Literal["admitted", "failed"]
+    student_id: Optional[str] = None
+    academic: Optional[AcademicResponse] = None
+    student_login: Optional[BulkAdmissionLogin] = None # Passwords: see BulkAdmissionCredential
+    error: Optional[str] = None
+
+class BulkAdmissionCredential(BaseModel):
+    """
+    Entry of the job's one-time "credentials" (first read of the job by its creator only).
+    """
+    row: int
+    student_id: str
+    username: str
+    temporary_password: str
+
+class BulkAdmissionResponseData(BaseModel):
+    total: int
+    admitted: int
+    failed: int
+    results: List[BulkAdmissionRowResult]
+
+class BulkAdmissionResponse(BaseModel):
+    success: bool
+    message: str
+    data: BulkAdmissionResponseData
@@ -1,13 +1,31 @@
+import random
+import string
 from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import uuid4
 from fastapi import HTTPException
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError
 from app.core.database import get_database
 from app.core.academic_year import get_current_academic_year
-from app.core.roll_number import generate_next_roll_number
-from app.core.security_student import get_password_hash
+from app.core.roll_number import generate_next_roll_number, reserve_roll_numbers, release_roll_numbers
+from app.core.security_student import get_password_hash, get_password_hashes
+from app.core.jobs.queue import enqueue, job_handler
+from app.core.jobs.runner import JobContext
 from app.modules.students.schema import StudentAdmissionRequest
 from app.modules.students.model import Student, AcademicInfo, PersonalInfo, ParentInfo
 from app.modules.students.student_users.model import StudentUser, StudentSecurity
+from app.utils.pagination import keyset_page
+
+# List order: by section, then roll number; _id breaks ties
+LIST_SORT = [("academic.class_id", 1), ("academic.section_id", 1), ("academic.roll_no", 1), ("_id", 1)]
+
+def _generate_temp_password() -> str:
+    return ''.join(random.choices(string.ascii_letters + string.digits + "!@#$", k=8))
+
+def _validation_message(e: ValidationError) -> str:
+    error = e.errors()[0]
+    return f"{error['msg']} in {'.'.join(str(part) for part in error['loc'])}"
 
 class StudentService:
     @staticmethod
@@ -47,9 +65,46 @@ class StudentService:
             academic_year=academic_year
         )
         
-        student_id = f"stu_{uuid4().hex[:12]}"
+        # 5. Auto-create Student User (Auth Data)
+        # Generate Temporary Password
+        temp_password_raw = _generate_temp_password()
+        hashed_password = await get_password_hash(temp_password_raw)
         
-        # 5. Prepare Student Document (Business Data)
+        # 6. Prepare Student (Business Data) + Student User documents
+        # Username is the Admission No per prompt example
+        student_doc, student_user_doc = StudentService._build_documents(
+            request, org_id, school_id, created_by, roll_no, academic_year, hashed_password
+        )
+        student_id = student_doc["_id"]
+        
+        # 7. Atomic Write
+        await db["students"].insert_one(student_doc)
+        await db["student_users"].insert_one(student_user_doc)
+        
+        return {
+            "student_id": student_id,
+            "academic": {
+                "roll_no": roll_no,
+                "academic_year": academic_year
+            },
+            "student_login": {
+                "username": request.academic.admission_no,
+                "temporary_password": temp_password_raw
+            }
+        }
+
+    @staticmethod
+    def _build_documents(
+        request: StudentAdmissionRequest,
+        org_id: str,
+        school_id: str,
+        created_by: str,
+        roll_no: int,
+        academic_year: str,
+        hashed_password: str
+    ) -> Tuple[dict, dict]:
+        now = datetime.utcnow()
+        student_id = f"stu_{uuid4().hex[:12]}"
         student_doc = Student(
             _id=student_id,
             org_id=org_id,
@@ -74,43 +129,247 @@ class StudentService:
                 email=request.parent.email
             ),
             created_by=created_by,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         )
-        
-        # 6. Auto-create Student User (Auth Data)
-        # Generate Temporary Password
-        import random
-        import string
-        temp_password_raw = ''.join(random.choices(string.ascii_letters + string.digits + "!@#$", k=8))
-        hashed_password = get_password_hash(temp_password_raw)
-        
-        student_user_id = f"stu_user_{uuid4().hex[:12]}"
-        
         student_user_doc = StudentUser(
-            _id=student_user_id,
+            _id=f"stu_user_{uuid4().hex[:12]}",
             org_id=org_id,
             school_id=school_id,
             student_id=student_id,
-            username=request.academic.admission_no, # Using Admission No as Username per prompt example
+            username=request.academic.admission_no,
             password=hashed_password,
             security=StudentSecurity(force_password_change=True),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         )
-        
-        # 7. Atomic Write
-        await db["students"].insert_one(student_doc.model_dump(by_alias=True))
-        await db["student_users"].insert_one(student_user_doc.model_dump(by_alias=True))
-        
-        return {
-            "student_id": student_id,
-            "academic": {
-                "roll_no": roll_no,
-                "academic_year": academic_year
-            },
-            "student_login": {
-                "username": request.academic.admission_no,
-                "temporary_password": temp_password_raw
+        return student_doc.model_dump(by_alias=True), student_user_doc.model_dump(by_alias=True)
+
+    @staticmethod
+    async def admit_students_bulk(
+        rows: List[Tuple[int, object]],
+        org_id: str,
+        school_id: str,
+        created_by: str,
+        job: Optional[JobContext] = None
+    ) -> dict:
+        """
+        Admit many students at once. rows are (row_no, nested admission dict or parse error).
+        Every row gets a result; a bad row never blocks the others.
+        Round trips are per batch, not per student:
+          sections + existing admission numbers prefetched with $in,
+          one roll-number block ($inc N) per section,
+          passwords hashed concurrently, students / users written with insert_many.
+        """
+        db = await get_database()
+        results = {}
+
+        def fail(row_no: int, error: str):
+            results[row_no] = {"row": row_no, "status": "failed", "error": error}
+
+        # 1. Schema validation
+        requests = []
+        for row_no, row in rows:
+            if isinstance(row, str):
+                fail(row_no, row)
+                continue
+            try:
+                requests.append((row_no, StudentAdmissionRequest(**row)))
+            except ValidationError as e:
+                fail(row_no, _validation_message(e))
+
+        # 2. Prefetch sections and existing admission numbers
+        section_ids = list({r.academic.section_id for _, r in requests})
+        sections = {
+            doc["_id"]: doc
+            async for doc in db["sections"].find(
+                {"_id": {"$in": section_ids}, "school_id": school_id}, {"class_id": 1}
+            )
+        }
+        admission_nos = list({r.academic.admission_no for _, r in requests})
+        taken = set(await db["students"].distinct(
+            "academic.admission_no",
+            {"school_id": school_id, "academic.admission_no": {"$in": admission_nos}}
+        ))
+
+        accepted = []
+        for row_no, request in requests:
+            section = sections.get(request.academic.section_id)
+            if not section:
+                fail(row_no, "Invalid section or does not belong to school")
+            elif section.get("class_id") != request.academic.class_id:
+                fail(row_no, "Section does not belong to the specified class")
+            elif request.academic.admission_no in taken:
+                fail(row_no, "Admission number already exists")
+            else:
+                # Later duplicates within the same file fail too
+                taken.add(request.academic.admission_no)
+                accepted.append((row_no, request))
+
+        if not accepted:
+            return StudentService._bulk_summary(rows, results)
+
+        # 3. One contiguous roll-number block per section, assigned in file order
+        academic_year = get_current_academic_year()
+        per_section = {}
+        for row_no, request in accepted:
+            per_section.setdefault((request.academic.class_id, request.academic.section_id), []).append(row_no)
+
+        roll_numbers = {}
+        for (class_id, section_id), row_nos in per_section.items():
+            first, _ = await reserve_roll_numbers(school_id, class_id, section_id, academic_year, len(row_nos))
+            for offset, row_no in enumerate(row_nos):
+                roll_numbers[row_no] = first + offset
+
+        # 4. Passwords
+        if job:
+            await job.progress(0, total=len(rows), stage="hashing passwords")
+        temp_passwords = [_generate_temp_password() for _ in accepted]
+        hashed_passwords = await get_password_hashes(temp_passwords)
+
+        student_docs, user_docs = [], []
+        for (row_no, request), hashed in zip(accepted, hashed_passwords):
+            student_doc, user_doc = StudentService._build_documents(
+                request, org_id, school_id, created_by, roll_numbers[row_no], academic_year, hashed
+            )
+            student_docs.append(student_doc)
+            user_docs.append(user_doc)
+
+        # 5. Writes (unordered: one failing document does not stop the batch)
+        if job:
+            await job.progress(0, total=len(rows), stage="writing")
+        failed_indexes = {}
+        try:
+            await db["students"].insert_many(student_docs, ordered=False)
+        except BulkWriteError as e:
+            for error in e.details.get("writeErrors", []):
+                failed_indexes[error["index"]] = error.get("errmsg", "Write failed")
+
+        users_to_write = [(i, doc) for i, doc in enumerate(user_docs) if i not in failed_indexes]
+        if users_to_write:
+            try:
+                await db["student_users"].insert_many([doc for _, doc in users_to_write], ordered=False)
+            except BulkWriteError as e:
+                orphaned = []
+                for error in e.details.get("writeErrors", []):
+                    i = users_to_write[error["index"]][0]
+                    failed_indexes[i] = error.get("errmsg", "Write failed")
+                    orphaned.append(student_docs[i]["_id"])
+                # Keep students and logins paired
+                await db["students"].delete_many({"_id": {"$in": orphaned}})
+
+        for i, ((row_no, request), temp_password) in enumerate(zip(accepted, temp_passwords)):
+            if i in failed_indexes:
+                fail(row_no, failed_indexes[i])
+                # Reserved but never assigned
+                await release_roll_numbers(
+                    school_id, request.academic.class_id, request.academic.section_id,
+                    academic_year, roll_numbers[row_no], roll_numbers[row_no]
+                )
+                continue
+            results[row_no] = {
+                "row": row_no,
+                "status": "admitted",
+                "student_id": student_docs[i]["_id"],
+                "academic": {
+                    "roll_no": roll_numbers[row_no],
+                    "academic_year": academic_year
+                },
+                "student_login": {
+                    "username": request.academic.admission_no,
+                    "temporary_password": temp_password
+                }
             }
+
+        if job:
+            # Passwords stay out of the stored result; the job's creator gets them once
+            credentials = []
+            for row_no, _ in rows:
+                login = results[row_no].get("student_login")
+                if login:
+                    credentials.append({"row": row_no, "student_id": results[row_no]["student_id"], **login})
+                    results[row_no]["student_login"] = {"username": login["username"]}
+            if credentials:
+                await job.store_secret(credentials)
+            await job.progress(len(rows), total=len(rows), stage="done")
+        return StudentService._bulk_summary(rows, results)
+
+    @staticmethod
+    async def list_students(
+        school_id: str,
+        class_id: Optional[str] = None,
+        section_id: Optional[str] = None,
+        academic_year: Optional[str] = None,
+        status: str = "active",
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        with_total: bool = False
+    ) -> dict:
+        """
+        Keyset page of students, ordered by class, section and roll number.
+        """
+        db = await get_database()
+
+        query = {"school_id": school_id, "status": status}
+        if class_id:
+            query["academic.class_id"] = class_id
+        if section_id:
+            query["academic.section_id"] = section_id
+        if academic_year:
+            query["academic.academic_year"] = academic_year
+
+        try:
+            return await keyset_page(
+                db["students"], query, LIST_SORT, limit, cursor=cursor, with_total=with_total
+            )
+        except ValueError as e:
+            raise HTTPException(400, str(e))
+
+    @staticmethod
+    async def start_bulk_admission(
+        rows: List[Tuple[int, object]],
+        org_id: str,
+        school_id: str,
+        created_by: str,
+        idempotency_key: Optional[str] = None
+    ) -> dict:
+        """
+        Queue admit_students_bulk as a background job. Returns the job document.
+        Only an explicit idempotency_key deduplicates; the same file may be uploaded again.
+        """
+        return await enqueue(
+            kind="bulk_admission",
+            payload={
+                "rows": [list(row) for row in rows],
+                "org_id": org_id,
+                "school_id": school_id,
+                "created_by": created_by
+            },
+            school_id=school_id,
+            org_id=org_id,
+            created_by=created_by,
+            idempotency_key=f"bulk_admission:{school_id}:{idempotency_key}" if idempotency_key else None
+        )
+
+    @staticmethod
+    def _bulk_summary(rows: List[Tuple[int, object]], results: dict) -> dict:
+        ordered = [results[row_no] for row_no, _ in rows]
+        admitted = sum(1 for r in ordered if r["status"] == "admitted")
+        return {
+            "total": len(ordered),
+            "admitted": admitted,
+            "failed": len(ordered) - admitted,
+            "results": ordered
         }
+
+@job_handler("bulk_admission", max_attempts=1)
+async def run_bulk_admission(job: JobContext) -> dict:
+    # Never retried: a second run would report already admitted rows as duplicates
+    # and lose their temporary passwords
+    return await StudentService.admit_students_bulk(
+        rows=[tuple(row) for row in job.payload["rows"]],
+        org_id=job.payload["org_id"],
+        school_id=job.payload["school_id"],
+        created_by=job.payload["created_by"],
+        job=job
+    )
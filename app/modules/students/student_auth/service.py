@@ -6,6 +6,7 @@ from app.modules.students.student_auth.schema import StudentLoginRequest, Change
 from app.modules.students.student_users.model import StudentUser
 
 from app.core.guards import validate_login_status
+from app.core.principal_cache import invalidate_principals
 
 class StudentAuthService:
     @staticmethod
@@ -18,7 +19,7 @@ class StudentAuthService:
             raise HTTPException(status_code=400, detail="Invalid username or password")
             
         # 2. Verify Password
-        if not verify_password(request.password, user["password"]):
+        if not await verify_password(request.password, user["password"]):
             raise HTTPException(status_code=400, detail="Invalid username or password")
             
         # 3. Validate Status Hierarchy (Fail Fast)
@@ -72,7 +73,7 @@ class StudentAuthService:
              raise HTTPException(status_code=404, detail="User not found")
              
         # Verify Old Password
-        if not verify_password(request.old_password, user["password"]):
+        if not await verify_password(request.old_password, user["password"]):
              raise HTTPException(status_code=400, detail="Incorrect old password")
              
         # New Password Validation (Simple check, can be expanded)
@@ -80,7 +81,7 @@ class StudentAuthService:
              raise HTTPException(status_code=400, detail="Password must be at least 8 characters")
              
         # Update Hash
-        hashed_password = get_password_hash(request.new_password)
+        hashed_password = await get_password_hash(request.new_password)
         
         await db["student_users"].update_one(
             {"_id": user_id},
@@ -91,5 +92,6 @@ class StudentAuthService:
                 "updated_at": datetime.utcnow()
             }}
         )
+        invalidate_principals(user_id)
         
         return True
@@ -6,6 +6,7 @@ from app.modules.subscriptions.schema import SubscriptionAssignRequest, Subscrip
 from app.modules.subscriptions.model import Subscription
 from app.utils.response import APIResponse
 from app.core.database import get_database
+from app.core.tenant_status import bump_tenant_version
 
 router = APIRouter()
 
@@ -45,6 +46,7 @@ async def assign_subscription(sub_in: SubscriptionAssignRequest):
         {"_id": sub_in.org_id},
         {"$set": {"plan_id": sub_in.plan_id}}
     )
+    await bump_tenant_version(org_id=sub_in.org_id)
     
     return APIResponse.success({
         "subscription_id": new_sub.id,
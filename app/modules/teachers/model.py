@@ -1,6 +1,8 @@
 from datetime import datetime, date
 from typing import Optional, Union
 from pydantic import BaseModel, Field, EmailStr
+from app.core.database import db
+import pymongo
 
 class PersonalInfo(BaseModel):
     first_name: str
@@ -34,3 +36,20 @@ class Teacher(BaseModel):
 
     class Config:
         populate_by_name = True
+
+async def ensure_teacher_indexes():
+    """
+    Index for the teacher list, ordered by name.
+    """
+    if db.client:
+        collection = db.get_db()["teachers"]
+        await collection.create_index(
+            [
+                ("school_id", pymongo.ASCENDING),
+                ("status", pymongo.ASCENDING),
+                ("personal.first_name", pymongo.ASCENDING),
+                ("personal.last_name", pymongo.ASCENDING),
+                ("_id", pymongo.ASCENDING)
+            ],
+            name="teacher_list_idx"
+        )
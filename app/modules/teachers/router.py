@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
+from fastapi import APIRouter, Depends, Query
 from app.core.dependencies import get_current_school_user
 from app.modules.teachers.schema import CreateTeacherRequest, CreateTeacherResponse
 from app.modules.teachers.service import TeacherService
+from app.utils.response import APIResponse
 
 router = APIRouter()
 
@@ -27,3 +29,29 @@ async def create_teacher(
         "success": True,
         "data": result
     }
+
+@router.get("/teachers")
+async def list_teachers(
+    status: str = "active",
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_total: bool = Query(False, description="Add estimated_total (cached count) to meta"),
+    current_user: dict = Depends(get_current_school_user)
+):
+    """
+    List teachers of the school, by name.
+    """
+    page = await TeacherService.list_teachers(
+        school_id=current_user["school_id"],
+        status=status,
+        limit=limit,
+        cursor=cursor,
+        with_total=include_total
+    )
+
+    meta = {
+        "limit": limit,
+        "next_cursor": page["next_cursor"],
+        "estimated_total": page["estimated_total"]
+    }
+    return APIResponse.success(page["items"], "Teachers retrieved", meta=meta)
@@ -2,6 +2,7 @@ from datetime import datetime
 from uuid import uuid4
 from fastapi import HTTPException
 from app.core.database import get_database
+from app.core.teacher_graph import invalidate_teacher_graphs
 from app.modules.teachers.section_coordinators.model import SectionCoordinator
 
 class SectionCoordinatorService:
@@ -47,6 +48,9 @@ class SectionCoordinatorService:
         # 4. Rule: One section can have ONLY ONE coordinator
         # Remove existing coordinator for THIS section (if any)
         # We perform a logical delete (set status=inactive)
+        replaced = await db["section_coordinators"].distinct(
+            "teacher_id", {"section_id": section_id, "status": "active"}
+        )
         await db["section_coordinators"].update_many(
             {"section_id": section_id, "status": "active"},
             {"$set": {"status": "inactive", "removed_at": datetime.utcnow()}}
@@ -67,6 +71,7 @@ class SectionCoordinatorService:
         )
         
         await db["section_coordinators"].insert_one(coord_doc.model_dump(by_alias=True))
+        invalidate_teacher_graphs(school_id, teacher_id, *replaced)
         
         return {
             "success": True,
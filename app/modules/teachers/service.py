@@ -1,6 +1,7 @@
 import random
 import string
 from datetime import datetime
+from typing import Optional
 from uuid import uuid4
 from fastapi import HTTPException
 from app.core.database import get_database
@@ -8,6 +9,10 @@ from app.core.security_teacher import get_password_hash
 from app.modules.teachers.schema import CreateTeacherRequest
 from app.modules.teachers.model import Teacher, PersonalInfo, ContactInfo, ProfessionalInfo
 from app.modules.teachers.teacher_auth.model import TeacherUser, TeacherSecurity
+from app.utils.pagination import keyset_page
+
+# List order: by name; _id breaks ties
+LIST_SORT = [("personal.first_name", 1), ("personal.last_name", 1), ("_id", 1)]
 
 class TeacherService:
     @staticmethod
@@ -39,7 +44,7 @@ class TeacherService:
             
         # 4. Generate Temporary Password
         temp_password_raw = ''.join(random.choices(string.ascii_letters + string.digits + "!@#$", k=8))
-        hashed_password = get_password_hash(temp_password_raw)
+        hashed_password = await get_password_hash(temp_password_raw)
         
         # 5. Prepare Teacher Document
         # Handle Date conversions
@@ -105,3 +110,24 @@ class TeacherService:
                 "temporary_password": temp_password_raw
             }
         }
+
+    @staticmethod
+    async def list_teachers(
+        school_id: str,
+        status: str = "active",
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        with_total: bool = False
+    ) -> dict:
+        """
+        Keyset page of teachers, ordered by name.
+        """
+        db = await get_database()
+        query = {"school_id": school_id, "status": status}
+
+        try:
+            return await keyset_page(
+                db["teachers"], query, LIST_SORT, limit, cursor=cursor, with_total=with_total
+            )
+        except ValueError as e:
+            raise HTTPException(400, str(e))
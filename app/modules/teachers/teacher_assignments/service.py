@@ -3,6 +3,7 @@ from typing import Literal
 from uuid import uuid4
 from fastapi import HTTPException
 from app.core.database import get_database
+from app.core.teacher_graph import invalidate_teacher_graphs
 from app.modules.teachers.teacher_assignments.model import TeacherAssignment
 from app.modules.teachers.teacher_assignments.schema import CreateAssignmentRequest
 
@@ -95,6 +96,7 @@ class TeacherAssignmentService:
         )
         
         await db["teacher_assignments"].insert_one(assignment.model_dump(by_alias=True))
+        invalidate_teacher_graphs(school_id, request.teacher_id)
         
         # Fetch Class and Section details for response
         class_doc = await db["classes"].find_one({"_id": request.class_id})
@@ -122,13 +124,16 @@ class TeacherAssignmentService:
         school_id: str
     ):
         db = await get_database()
-        result = await db["teacher_assignments"].update_one(
+        assignment = await db["teacher_assignments"].find_one_and_update(
             {"_id": assignment_id, "school_id": school_id, "status": "active"},
-            {"$set": {"status": "inactive"}}
+            {"$set": {"status": "inactive"}},
+            projection={"teacher_id": 1}
         )
         
-        if result.modified_count == 0:
+        if not assignment:
              raise HTTPException(status_code=404, detail="Assignment not found or already inactive")
+        
+        invalidate_teacher_graphs(school_id, assignment["teacher_id"])
              
         return {"success": True, "message": "Teacher unassigned successfully"}
 
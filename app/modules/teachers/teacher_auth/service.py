@@ -5,6 +5,7 @@ from app.core.security_teacher import verify_password, get_password_hash, create
 from app.modules.teachers.teacher_auth.schema import TeacherLoginRequest, ChangePasswordRequest
 
 from app.core.guards import validate_login_status
+from app.core.principal_cache import invalidate_principals
 
 class TeacherAuthService:
     @staticmethod
@@ -17,7 +18,7 @@ class TeacherAuthService:
             raise HTTPException(status_code=400, detail="Invalid username or password")
             
         # 2. Verify Password
-        if not verify_password(request.password, user["password"]):
+        if not await verify_password(request.password, user["password"]):
             raise HTTPException(status_code=400, detail="Invalid username or password")
             
         # 3. Validate Status Hierarchy (Fail Fast)
@@ -80,7 +81,7 @@ class TeacherAuthService:
              raise HTTPException(status_code=404, detail="User not found")
              
         # Verify Old Password
-        if not verify_password(request.old_password, user["password"]):
+        if not await verify_password(request.old_password, user["password"]):
              raise HTTPException(status_code=400, detail="Incorrect old password")
              
         # Minimum Length Check
@@ -88,7 +89,7 @@ class TeacherAuthService:
              raise HTTPException(status_code=400, detail="Password must be at least 8 characters")
              
         # Update Hash
-        hashed_password = get_password_hash(request.new_password)
+        hashed_password = await get_password_hash(request.new_password)
         
         await db["teacher_users"].update_one(
             {"_id": user_id},
@@ -99,5 +100,6 @@ class TeacherAuthService:
                 "updated_at": datetime.utcnow()
             }}
         )
+        invalidate_principals(user_id)
         
         return True
@@ -1,13 +1,70 @@
-from typing import List, Dict, Union, Any
+import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 from app.core.database import get_database
 
+class IdentityMap:
+    """
+    Dependent documents already loaded during one request, by (collection, _id),
+    together with the fields that were projected. Misses are remembered too.
+    """
+
+    def __init__(self):
+        self._docs: Dict[Tuple[str, Any], Tuple[Optional[dict], FrozenSet[str]]] = {}
+        self.hits = 0
+        self.fetched = 0
+
+    def get(self, collection: str, doc_id: Any, fields: FrozenSet[str]) -> Tuple[bool, Optional[dict]]:
+        """
+        (True, doc or None) when doc_id was loaded with at least `fields`, else (False, None).
+        """
+        entry = self._docs.get((collection, doc_id))
+        if entry is None or not fields <= entry[1]:
+            return False, None
+        self.hits += 1
+        return True, entry[0]
+
+    def loaded_fields(self, collection: str, doc_id: Any) -> FrozenSet[str]:
+        entry = self._docs.get((collection, doc_id))
+        return entry[1] if entry else frozenset()
+
+    def put(self, collection: str, doc_id: Any, doc: Optional[dict], fields: FrozenSet[str]):
+        self.fetched += 1
+        self._docs[(collection, doc_id)] = (doc, fields)
+
+_current_map: ContextVar[Optional[IdentityMap]] = ContextVar("dependent_details_identity_map", default=None)
+
+@contextmanager
+def identity_map_scope():
+    """
+    Share one IdentityMap between all enrichments inside the block (one per request,
+    opened by RequestPipelineMiddleware).
+    """
+    token = _current_map.set(IdentityMap())
+    try:
+        yield _current_map.get()
+    finally:
+        _current_map.reset(token)
+
+def _projected_fields(config: Dict[str, Any]) -> Set[str]:
+    fields = set(config.get("fields", ()))
+    if config.get("name_field"):
+        fields.add(config["name_field"])
+    return fields
+
+async def _fetch(db, collection: str, ids: Iterable[Any], fields: FrozenSet[str]) -> Dict[Any, dict]:
+    projection = {field: 1 for field in fields} or {"_id": 1}
+    cursor = db[collection].find({"_id": {"$in": list(ids)}}, projection)
+    return {doc["_id"]: doc async for doc in cursor}
+
 async def fetch_dependent_details(
-    data: Union[List[Dict[str, Any]], Dict[str, Any]], 
-    dependency_map: Dict[str, Dict[str, str]]
+    data: Union[List[Dict[str, Any]], Dict[str, Any]],
+    dependency_map: Dict[str, Dict[str, Any]]
 ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
     """
     Enriches data with details from dependent collections.
-    
+
     Args:
         data: A dictionary or a list of dictionaries containing foreign keys.
         dependency_map: A mapping of foreign_key field names to configuration.
@@ -19,12 +76,17 @@ async def fetch_dependent_details(
                 },
                 "plan_id": {
                     "collection": "plans",
-                    "name_field": "name"
+                    "name_field": "name",
+                    "fields": ["price", "billing_cycle"] # Optional, added to _details
                 }
             }
-            
+
     Returns:
         The enriched data with _{key}_details and _{key}_name fields.
+        _details holds only _id, name_field and the configured fields.
+
+    One projected $in query per collection, all issued concurrently. Inside a request,
+    ids already loaded (with the needed fields) are not fetched again.
     """
     if not data:
         return data
@@ -36,61 +98,61 @@ async def fetch_dependent_details(
     else:
         items = data
 
-    db = await get_database()
-    
-    # Pre-fetch all necessary IDs to minimize DB calls
-    lookup_keys = {} # { "org_id": { "organizations": ["id1", "id2"] } } - actually simplify to { "field_key": set(ids) }
-    
-    # 1. Collect IDs
+    identity_map = _current_map.get()
+
+    # 1. Collect ids and fields per collection (several keys may share one)
+    wanted: Dict[str, Tuple[Set[Any], Set[str]]] = {}
     for key, config in dependency_map.items():
-        ids_to_fetch = set()
-        for item in items:
-            val = item.get(key)
-            if val:
-                ids_to_fetch.add(val)
-        
-        if ids_to_fetch:
-            lookup_keys[key] = ids_to_fetch
-
-    # 2. Fetch Data
-    # fetched_data = { "org_id": { "id1": {doc}, "id2": {doc} } }
-    fetched_map = {} 
-    
-    for key, ids in lookup_keys.items():
-        collection_name = dependency_map[key]["collection"]
-        fetched_map[key] = {}
-        
-        # Determine strict list of IDs to query
-        id_list = list(ids)
-        if not id_list:
-            continue
-            
-        cursor = db[collection_name].find({"_id": {"$in": id_list}})
-        async for doc in cursor:
-            # Convert datetime objects to string if needed or handle by serializer
-            # The user output example has { "$date": ... } which suggests raw MongoDB dump or specific serialization.
-            # We will keep it as python objects for FastAPI to serialize, OR we can conform to the example strictly if asked.
-            # The example output format `_org_id_details` containing `$date` suggests we might return raw dicts
-            # usually FastAPI handles datetime -> ISO string. I will stick to returning dicts.
-            fetched_map[key][doc["_id"]] = doc
+        ids, fields = wanted.setdefault(config["collection"], (set(), set()))
+        fields.update(_projected_fields(config))
+        ids.update(item.get(key) for item in items if item.get(key))
+
+    # 2. Resolve from the identity map, fetch the rest concurrently
+    resolved: Dict[str, Dict[Any, Optional[dict]]] = {}
+    to_fetch: Dict[str, Tuple[Set[Any], FrozenSet[str]]] = {}
+    for collection, (ids, fields) in wanted.items():
+        fields = frozenset(fields)
+        resolved[collection] = {}
+        missing = set()
+        for doc_id in ids:
+            found, doc = identity_map.get(collection, doc_id, fields) if identity_map else (False, None)
+            if found:
+                resolved[collection][doc_id] = doc
+            else:
+                missing.add(doc_id)
+        if missing:
+            if identity_map:
+                # Widen to what was loaded before so the cached entry keeps serving earlier callers
+                for doc_id in missing:
+                    fields |= identity_map.loaded_fields(collection, doc_id)
+            to_fetch[collection] = (missing, fields)
+
+    if to_fetch:
+        db = await get_database()
+        results = await asyncio.gather(*(
+            _fetch(db, collection, ids, fields) for collection, (ids, fields) in to_fetch.items()
+        ))
+        for (collection, (ids, fields)), docs in zip(to_fetch.items(), results):
+            for doc_id in ids:
+                doc = docs.get(doc_id)
+                resolved[collection][doc_id] = doc
+                if identity_map:
+                    identity_map.put(collection, doc_id, doc, fields)
 
     # 3. Enrich Items
     for item in items:
         for key, config in dependency_map.items():
             val = item.get(key)
-            if val and key in fetched_map and val in fetched_map[key]:
-                detail_doc = fetched_map[key][val]
-                
-                # Add _details
-                item[f"_{key}_details"] = detail_doc
-                
-                # Add _name
-                name_field = config.get("name_field")
-                if name_field and name_field in detail_doc:
-                     item[f"_{key}_name"] = detail_doc[name_field]
-                else:
-                    # Fallback or None? User example implies it should exist.
-                    item[f"_{key}_name"] = None
+            detail_doc = resolved[config["collection"]].get(val) if val else None
+            if detail_doc is None:
+                continue
+
+            # Add _details
+            item[f"_{key}_details"] = detail_doc
+
+            # Add _name
+            name_field = config.get("name_field")
+            item[f"_{key}_name"] = detail_doc.get(name_field) if name_field else None
 
     if is_single:
         return items[0]
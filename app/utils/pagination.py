@@ -1,5 +1,11 @@
-from typing import Generic, TypeVar, List
+import base64
+import json
+from datetime import datetime
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+from bson import ObjectId
 from pydantic import BaseModel
+from app.core.cache import TTLCache
+from app.core.config import settings
 
 T = TypeVar("T")
 
@@ -9,3 +15,136 @@ class PaginatedResponse(BaseModel, Generic[T]):
     page: int
     limit: int
     pages: int
+
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    estimated_total: Optional[int] = None
+
+# --- Keyset Cursors ---
+# A cursor is the sort key of the last item on a page, encoded as opaque url-safe base64 JSON.
+# Cursors come from clients, so decoding accepts only plain scalars, {"$oid": str} and
+# {"$date": str}; anything else (e.g. {"$ne": null}) would end up in the query as an operator.
+
+_SCALARS = (str, int, float, bool, type(None))
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return {"$oid": str(value)}
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    return value
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, _SCALARS):
+        return value
+    if isinstance(value, dict) and len(value) == 1:
+        if isinstance(value.get("$oid"), str) and ObjectId.is_valid(value["$oid"]):
+            return ObjectId(value["$oid"])
+        if isinstance(value.get("$date"), str):
+            return datetime.fromisoformat(value["$date"])
+    raise ValueError("Invalid cursor")
+
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """
+    Raises ValueError for tampered or malformed cursors.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return [_decode_value(v) for v in values]
+
+def keyset_after(fields: List[str], values: list, descending: bool = True) -> dict:
+    """
+    Filter for rows strictly after (values) in the order of (fields), e.g. for
+    fields=["timestamp", "_id"] descending:
+      {"$or": [{"timestamp": {"$lt": t}}, {"timestamp": t, "_id": {"$lt": id}}]}
+    """
+    op = "$lt" if descending else "$gt"
+    clauses = []
+    for i, field in enumerate(fields):
+        clause = {fields[j]: values[j] for j in range(i)}
+        clause[field] = {op: values[i]}
+        clauses.append(clause)
+    return {"$or": clauses}
+
+# --- Keyset Pages ---
+
+# (collection, filter) -> count_documents, for the optional totals of list endpoints
+_counts = TTLCache(
+    "list_counts",
+    maxsize=settings.LIST_COUNT_CACHE_SIZE,
+    ttl=settings.LIST_COUNT_CACHE_TTL_SECONDS
+)
+
+def _query_key(query: dict) -> str:
+    return json.dumps(query, sort_keys=True, default=str)
+
+async def count_total(collection, query: dict) -> int:
+    """
+    Matching documents, cached for LIST_COUNT_CACHE_TTL_SECONDS (so possibly a little stale).
+    An empty filter uses collection metadata instead of counting.
+    """
+    if not query:
+        return await collection.estimated_document_count()
+
+    key = (collection.name, _query_key(query))
+    total = _counts.get(key)
+    if total is None:
+        total = await collection.count_documents(query)
+        _counts.set(key, total)
+    return total
+
+def _sort_value(doc: dict, field: str) -> Any:
+    value = doc
+    for part in field.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+async def keyset_page(
+    collection,
+    query: dict,
+    sort: List[Tuple[str, int]],
+    limit: int,
+    cursor: Optional[str] = None,
+    projection: Optional[dict] = None,
+    with_total: bool = False
+) -> dict:
+    """
+    One page of `collection` in `sort` order, continuing after `cursor` (next_cursor of
+    the previous page). The last sort field must be unique (normally _id) and all
+    fields must sort in the same direction and be present on every document.
+    Returns {"items", "next_cursor", "estimated_total"}; the total is only counted
+    when with_total is set. Raises ValueError for an invalid cursor.
+    """
+    fields = [field for field, _ in sort]
+    descending = sort[0][1] < 0
+    if any((direction < 0) != descending for _, direction in sort):
+        raise ValueError("Keyset pagination needs a single sort direction")
+
+    page_query = query
+    if cursor:
+        after = keyset_after(fields, decode_cursor(cursor, len(fields)), descending=descending)
+        page_query = {"$and": [query, after]} if query else after
+
+    # One extra row tells us whether there is a next page
+    docs = await collection.find(page_query, projection).sort(sort).limit(limit + 1).to_list(length=limit + 1)
+
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(*(_sort_value(docs[-1], field) for field in fields))
+
+    return {
+        "items": docs,
+        "next_cursor": next_cursor,
+        "estimated_total": await count_total(collection, query) if with_total else None
+    }
@@ -0,0 +1,9 @@
+from typing import Type
+from pydantic import BaseModel
+
+def model_projection(model: Type[BaseModel]) -> dict:
+    """
+    Mongo projection selecting the stored names (aliases, e.g. _id) of a model's fields.
+    Lets read paths return the raw documents in the model's shape without building the model.
+    """
+    return {(field.alias or name): 1 for name, field in model.model_fields.items()}
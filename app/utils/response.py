@@ -1,7 +1,69 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from enum import Enum
 from typing import Any, Optional
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi import status
 from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from bson import ObjectId
+from bson.decimal128 import Decimal128
+from app.core.config import settings
+
+try:
+    import orjson
+except ImportError: # Optional: falls back to stdlib json, still one pass
+    orjson = None
+
+def _default(obj: Any) -> Any:
+    """
+    Types the encoder does not handle itself, converted as jsonable_encoder would.
+    Returned values are encoded recursively.
+    """
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(by_alias=True)
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, datetime.timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, (ObjectId, uuid.UUID)):
+        return str(obj)
+    if isinstance(obj, Decimal128):
+        obj = obj.to_decimal()
+    if isinstance(obj, Decimal):
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode()
+    # Anything rarer (urls, paths, dataclasses without orjson, ...)
+    return jsonable_encoder(obj)
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize straight to UTF-8 bytes in one pass (datetimes, pydantic models and Mongo types included).
+    """
+    if orjson is not None:
+        # datetime, date, UUID and Enum are native; OPT_NON_STR_KEYS matches json's int / None keys
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+def _envelope(content: dict, status_code: int):
+    if settings.FAST_JSON_RESPONSES:
+        return FastJSONResponse(status_code=status_code, content=content)
+    return JSONResponse(status_code=status_code, content=jsonable_encoder(content))
 
 class APIResponse:
     @staticmethod
@@ -14,15 +76,12 @@ class APIResponse:
         response_content = {
             "success": True,
             "message": message,
-            "data": jsonable_encoder(data)
+            "data": data
         }
         if meta:
             response_content["meta"] = meta
             
-        return JSONResponse(
-            status_code=status_code,
-            content=response_content
-        )
+        return _envelope(response_content, status_code)
 
     @staticmethod
     def error(
@@ -30,12 +89,9 @@ class APIResponse:
         status_code: int = status.HTTP_400_BAD_REQUEST,
         data: Optional[Any] = None
     ):
-        return JSONResponse(
-            status_code=status_code,
-            content={
-                "success": False,
-                "message": message,
-                "data": jsonable_encoder(data),
-                "error": True
-            }
-        )
+        return _envelope({
+            "success": False,
+            "message": message,
+            "data": data,
+            "error": True
+        }, status_code)
@@ -0,0 +1,117 @@
+"""
+Before/after throughput of the request middleware stack.
+
+  before: the six BaseHTTPMiddleware layers (each check in its own layer, as main.py used to stack them)
+  after:  RequestPipelineMiddleware (one ASGI layer, checks chosen by route group)
+
+Routes: "/" (hello world) and "/school/ping" with a valid school token (the typical /school path).
+No MongoDB is needed: audit writes are skipped while db.client is unset.
+
+Usage: SECRET_KEY=bench python -m benchmarks.middleware_throughput [requests] [concurrency]
+"""
+import asyncio
+import os
+import sys
+import time
+
+os.environ.setdefault("SECRET_KEY", "bench")
+
+import httpx
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.security_school import create_access_token
+from app.middlewares.pipeline import ROUTE_GROUP_CHECKS, RequestPipelineMiddleware, route_group
+from app.middlewares.audit import write_audit_log
+from app.middlewares.auth import platform_auth_check
+from app.middlewares.org_context import org_context_check
+from app.middlewares.school_context import school_context_check
+from app.middlewares.school_user_context import school_user_context_check
+from app.middlewares.status_guard import status_guard_check
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/")
+    async def root():
+        return {"message": "SaaS Platform API is running"}
+
+    @app.get("/school/ping")
+    async def school_ping():
+        return {"success": True, "message": "pong", "data": None}
+
+    return app
+
+def legacy_layer(check):
+    """One BaseHTTPMiddleware per check; the check only fires for the groups it served before."""
+    groups = {group for group, checks in ROUTE_GROUP_CHECKS.items() if check in checks}
+
+    class Layer(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            if route_group(request.url.path) in groups:
+                response = await check(request)
+                if response is not None:
+                    return response
+            return await call_next(request)
+
+    return Layer
+
+class LegacyAudit(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        start_time = time.time()
+        response = await call_next(request)
+        await write_audit_log(request, response.status_code, start_time)
+        return response
+
+def before_app() -> FastAPI:
+    app = build_app()
+    # Same add order as the old main.py (last added = outermost)
+    app.add_middleware(legacy_layer(status_guard_check))
+    app.add_middleware(LegacyAudit)
+    app.add_middleware(legacy_layer(platform_auth_check))
+    app.add_middleware(legacy_layer(org_context_check))
+    app.add_middleware(legacy_layer(school_context_check))
+    app.add_middleware(legacy_layer(school_user_context_check))
+    return app
+
+def after_app() -> FastAPI:
+    app = build_app()
+    app.add_middleware(RequestPipelineMiddleware)
+    return app
+
+async def run(app: FastAPI, path: str, headers: dict, total: int, concurrency: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up (token cache, route compilation)
+        for _ in range(50):
+            await client.get(path, headers=headers)
+
+        per_worker = total // concurrency
+
+        async def worker():
+            for _ in range(per_worker):
+                response = await client.get(path, headers=headers)
+                assert response.status_code == 200, response.text
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return per_worker * concurrency / elapsed
+
+async def main(total: int, concurrency: int):
+    token = create_access_token("bench-user", {"school_id": "bench-school", "role": "SCHOOL_ADMIN"})
+    cases = [
+        ("hello world  GET /", "/", {}),
+        ("school route GET /school/ping", "/school/ping", {"Authorization": f"Bearer {token}"}),
+    ]
+
+    print(f"{total} requests, concurrency {concurrency}")
+    for label, path, headers in cases:
+        before = await run(before_app(), path, headers, total, concurrency)
+        after = await run(after_app(), path, headers, total, concurrency)
+        print(f"{label:32} before {before:9.0f} req/s   after {after:9.0f} req/s   x{after / before:.2f}")
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    asyncio.run(main(total, concurrency))
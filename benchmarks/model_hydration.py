@@ -0,0 +1,176 @@
+"""
+Validated vs unvalidated read paths (pydantic hydration) for the hottest read endpoints.
+
+  validated:   Model(**doc) per document (the previous read paths), then the envelope
+  unvalidated: what the endpoints do now - model_construct, or the projected raw
+               documents in the model's shape - then the same envelope
+
+Documents are built in memory in their stored form; no MongoDB is needed. Each case
+checks that both paths serialize to the same JSON before timing.
+
+Usage: SECRET_KEY=bench python -m benchmarks.model_hydration [iterations] [--profile CASE]
+"""
+import cProfile
+import json
+import os
+import pstats
+import sys
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from app.core.permissions import Permission, Role
+from app.modules.auth.model import AdminUser
+from app.modules.auth.service import AuthService
+from app.modules.organizations.model import Organization, ORG_PROJECTION
+from app.modules.organizations.org_auth.model import OrgUser
+from app.modules.academics.classes.schema import ClassResponse
+from app.modules.academics.classes.service import LIST_PROJECTION as CLASS_PROJECTION
+from app.modules.academics.sections.schema import SectionResponse
+from app.modules.academics.sections.service import LIST_PROJECTION as SECTION_PROJECTION
+from app.modules.academics.subjects.schema import SubjectResponse
+from app.modules.academics.subjects.service import LIST_PROJECTION as SUBJECT_PROJECTION
+from app.utils.response import dumps
+
+NOW = datetime(2025, 6, 1, 9, 0)
+
+def admin_doc() -> dict:
+    return {
+        "_id": str(uuid4()), "name": "Platform Admin", "email": "admin@example.com",
+        "hashed_password": "$2b$12$" + "x" * 53, "role": Role.ADMIN.value,
+        "permissions": [Permission.MANAGE_ORGS.value, Permission.VIEW_ANALYTICS.value],
+        "is_active": True, "created_at": NOW, "updated_at": NOW
+    }
+
+def org_doc(n: int) -> dict:
+    return {
+        "_id": str(uuid4()), "org_name": f"Org {n}", "owner_name": f"Owner {n}",
+        "owner_user_id": str(uuid4()), "email": f"org{n}@example.com", "mobile": "9999999999",
+        "plan_id": None, "trial_days": 14, "status": "active", "created_at": NOW - timedelta(days=n)
+    }
+
+def org_user_doc() -> dict:
+    return {
+        "_id": str(uuid4()), "org_id": str(uuid4()), "name": "Owner", "email": "owner@example.com",
+        "password": "$2b$12$" + "x" * 53, "mobile": "9999999999", "role": "ORG_OWNER",
+        "permissions": ["MANAGE_SCHOOLS", "VIEW_BILLING"], "status": "active",
+        "last_login_at": NOW, "created_at": NOW, "updated_at": NOW
+    }
+
+def stored(extra: dict, n: int) -> dict:
+    # Full stored document: tenant / audit fields the list responses leave out
+    return {"org_id": "org_1", "school_id": "sch_1", "created_by": "su_1", "updated_at": NOW, "created_at": NOW - timedelta(hours=n), **extra}
+
+def class_docs(count: int) -> list:
+    return [stored({"_id": f"cls_{n:08x}", "class_name": f"Class {n}", "class_order": n, "status": "active"}, n) for n in range(count)]
+
+def section_docs(count: int) -> list:
+    return [stored({"_id": f"sec_{n:08x}", "class_id": f"cls_{n // 4:08x}", "section_name": "ABCD"[n % 4], "capacity": 40, "status": "active"}, n) for n in range(count)]
+
+def subject_docs(count: int) -> list:
+    return [stored({
+        "_id": f"sub_{n:08x}", "class_id": f"cls_{n // 8:08x}", "subject_name": f"Subject {n}",
+        "subject_code": f"S{n:03d}", "is_optional": n % 5 == 0, "status": "active"
+    }, n) for n in range(count)]
+
+def project(docs: list, projection: dict) -> list:
+    # Stands in for the server-side projection of the new read paths
+    return [{key: doc[key] for key in projection if key in doc} for doc in docs]
+
+def envelope(data) -> bytes:
+    return dumps({"success": True, "message": "ok", "data": data})
+
+def build_cases() -> dict:
+    admin = admin_doc()
+    orgs = [org_doc(n) for n in range(100)]
+    org_user = org_user_doc()
+    classes, sections, subjects = class_docs(100), section_docs(100), subject_docs(100)
+    sections_page = sections[:10]
+
+    return {
+        "platform principal (every /platform request)": (
+            lambda: AdminUser(**admin),
+            lambda: AuthService._from_db(dict(admin))
+        ),
+        "GET /platform/admin/profile": (
+            lambda: envelope(AdminUser(**admin)),
+            lambda: envelope(AuthService._from_db(dict(admin)))
+        ),
+        "GET /public/org (100)": (
+            lambda: envelope([Organization(**org) for org in orgs]),
+            lambda: envelope(project(orgs, ORG_PROJECTION))
+        ),
+        "GET /public/org/{id}": (
+            lambda: envelope(Organization(**orgs[0])),
+            lambda: envelope(project(orgs[:1], ORG_PROJECTION)[0])
+        ),
+        "PUT /public/org/{id}": (
+            lambda: envelope(Organization(**orgs[1])),
+            lambda: envelope(project(orgs[1:2], ORG_PROJECTION)[0])
+        ),
+        "POST /org/auth/login (user)": (
+            lambda: OrgUser(**org_user),
+            lambda: OrgUser.model_construct(**org_user)
+        ),
+        "GET /school/classes (100)": (
+            lambda: envelope([ClassResponse(**doc) for doc in classes]),
+            lambda: envelope(project(classes, CLASS_PROJECTION))
+        ),
+        "GET /school/classes/all-sections (100)": (
+            lambda: envelope([SectionResponse(**doc) for doc in sections]),
+            lambda: envelope(project(sections, SECTION_PROJECTION))
+        ),
+        "GET /school/classes/{id}/sections (10)": (
+            lambda: envelope([SectionResponse(**doc) for doc in sections_page]),
+            lambda: envelope(project(sections_page, SECTION_PROJECTION))
+        ),
+        "GET /school/classes/all-subjects (100)": (
+            lambda: envelope([SubjectResponse(**doc) for doc in subjects]),
+            lambda: envelope(project(subjects, SUBJECT_PROJECTION))
+        ),
+    }
+
+def per_call(func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations
+
+def check_same_output(name: str, validated, unvalidated):
+    old, new = validated(), unvalidated()
+    if isinstance(old, bytes):
+        assert json.loads(old) == json.loads(new), f"{name}: responses differ"
+    else:
+        assert old.model_dump() == new.model_dump(), f"{name}: models differ"
+
+def main(iterations: int, profile: str = None):
+    cases = build_cases()
+
+    if profile:
+        name = next((case for case in cases if profile.lower() in case.lower()), None)
+        if name is None:
+            sys.exit(f"no case matching '{profile}'")
+        for label, func in zip(("validated", "unvalidated"), cases[name]):
+            print(f"\n== {name}: {label} ==")
+            profiler = cProfile.Profile()
+            profiler.runcall(per_call, func, iterations)
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(12)
+        return
+
+    print(f"{'case':<42} {'validated':>12} {'unvalidated':>12} {'speedup':>8}   ({iterations} iterations)")
+    for name, (validated, unvalidated) in cases.items():
+        check_same_output(name, validated, unvalidated)
+        t_validated = per_call(validated, iterations)
+        t_unvalidated = per_call(unvalidated, iterations)
+        print(f"{name:<42} {t_validated * 1e6:10.1f}us {t_unvalidated * 1e6:10.1f}us {t_validated / t_unvalidated:7.1f}x")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    profile = None
+    if "--profile" in args:
+        index = args.index("--profile")
+        profile = args[index + 1]
+        del args[index:index + 2]
+    main(int(args[0]) if args else 2000, profile)
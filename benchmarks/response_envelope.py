@@ -0,0 +1,84 @@
+"""
+APIResponse envelope cost on list / report sized payloads.
+
+  before: jsonable_encoder over the payload, then JSONResponse (stdlib json) again
+  after:  FastJSONResponse, one pass to bytes (orjson when installed, else stdlib json)
+
+Rows look like the list endpoints' items: strings, ints, a nested dict, naive
+datetimes, and (half of them) a pydantic response model. Both paths must produce
+the same JSON document; the script checks that before timing.
+
+Usage: SECRET_KEY=bench python -m benchmarks.response_envelope [rows ...] [--repeat N]
+"""
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.modules.academics.classes.schema import ClassResponse
+from app.utils import response as api_response
+
+def build_rows(count: int) -> list:
+    start = datetime(2025, 4, 1, 8, 30)
+    rows = []
+    for n in range(count):
+        row = {
+            "_id": f"cls_{n:08x}",
+            "class_name": f"Class {n % 12 + 1}",
+            "class_order": n % 12 + 1,
+            "status": "active",
+            "created_at": start + timedelta(minutes=n)
+        }
+        if n % 2:
+            rows.append(ClassResponse(**row))
+        else:
+            row["stats"] = {"present": n % 40, "absent": n % 7, "percentage": round((n % 40) / 47 * 100, 2)}
+            rows.append(row)
+    return rows
+
+def before(rows: list) -> bytes:
+    content = {"success": True, "message": "Classes retrieved", "data": jsonable_encoder(rows)}
+    return JSONResponse(content=content).body
+
+def after(rows: list) -> bytes:
+    return api_response.FastJSONResponse(
+        content={"success": True, "message": "Classes retrieved", "data": rows}
+    ).body
+
+def timed(func, rows: list, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main(sizes: list, repeat: int):
+    encoder = "orjson" if api_response.orjson is not None else "stdlib json"
+    print(f"fast path encoder: {encoder}, best of {repeat}")
+    for size in sizes:
+        rows = build_rows(size)
+        old, new = before(rows), after(rows)
+        assert json.loads(old) == json.loads(new), "fast path produced a different document"
+
+        t_before = timed(before, rows, repeat)
+        t_after = timed(after, rows, repeat)
+        print(
+            f"{size:>7} rows  before {t_before * 1000:9.2f} ms  after {t_after * 1000:9.2f} ms"
+            f"  x{t_before / t_after:5.1f}  ({len(new) / 1024:.0f} KiB)"
+        )
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    repeat = 5
+    if "--repeat" in args:
+        index = args.index("--repeat")
+        repeat = int(args[index + 1])
+        del args[index:index + 2]
+    main([int(arg) for arg in args] or [1000, 50000], repeat)
@@ -0,0 +1,93 @@
+"""
+Roll-number contention: 50 concurrent admitters on one section.
+
+Strategies:
+  per_admission  one find_one_and_update ($inc 1) per admission (the previous behaviour)
+  leased         RollNumberLeases: one $inc per block of --block numbers per worker
+  reserved       one reserve_roll_numbers(N) call for the whole batch (bulk admission)
+
+Needs a reachable MongoDB (MONGO_* settings). Uses a throwaway sequence key and removes it afterwards.
+
+Usage: SECRET_KEY=bench python -m benchmarks.roll_number_contention [admitters] [admissions_each] [block]
+"""
+import asyncio
+import os
+import statistics
+import sys
+import time
+from uuid import uuid4
+
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from app.core.database import db
+from app.core.roll_number import RollNumberLeases, _sequence_key, reserve_roll_numbers
+
+CLASS_ID = "bench_class"
+SECTION_ID = "bench_section"
+ACADEMIC_YEAR = "2025-26"
+
+async def per_admission(school_id: str):
+    first, _ = await reserve_roll_numbers(school_id, CLASS_ID, SECTION_ID, ACADEMIC_YEAR, 1)
+    return first
+
+async def run(label: str, take, school_id: str, admitters: int, each: int):
+    latencies = []
+    numbers = []
+
+    async def admitter():
+        for _ in range(each):
+            start = time.perf_counter()
+            numbers.append(await take(school_id))
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(admitter() for _ in range(admitters)))
+    elapsed = time.perf_counter() - start
+
+    assert len(set(numbers)) == len(numbers), "duplicate roll numbers issued"
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{label:14} {len(numbers) / elapsed:9.0f} numbers/s   "
+        f"p50 {statistics.median(latencies) * 1000:7.2f} ms   p99 {p99 * 1000:7.2f} ms   "
+        f"range {min(numbers)}..{max(numbers)}"
+    )
+
+async def main(admitters: int, each: int, block: int):
+    db.connect()
+    database = db.get_db()
+    schools = []
+    try:
+        print(f"{admitters} concurrent admitters x {each} admissions, one section")
+
+        school_id = f"bench_{uuid4().hex[:8]}"
+        schools.append(school_id)
+        await run("per_admission", per_admission, school_id, admitters, each)
+
+        school_id = f"bench_{uuid4().hex[:8]}"
+        schools.append(school_id)
+        leases = RollNumberLeases(block_size=block)
+        await run(
+            f"leased({block})",
+            lambda s: leases.next(s, CLASS_ID, SECTION_ID, ACADEMIC_YEAR),
+            school_id, admitters, each
+        )
+        print(f"{'':14} blocks reserved: {leases.blocks_reserved}")
+
+        school_id = f"bench_{uuid4().hex[:8]}"
+        schools.append(school_id)
+        start = time.perf_counter()
+        first, last = await reserve_roll_numbers(school_id, CLASS_ID, SECTION_ID, ACADEMIC_YEAR, admitters * each)
+        elapsed = time.perf_counter() - start
+        print(f"{'reserved':14} {last - first + 1} numbers in one round trip ({elapsed * 1000:.2f} ms)")
+    finally:
+        await database["sequences"].delete_many({
+            "_id": {"$in": [_sequence_key(s, CLASS_ID, SECTION_ID, ACADEMIC_YEAR) for s in schools]}
+        })
+        db.close()
+
+if __name__ == "__main__":
+    admitters = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    each = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    block = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+    asyncio.run(main(admitters, each, block))
@@ -0,0 +1,118 @@
+"""
+Explain-plan check for the student-scoped report pipelines.
+
+Seeds a throwaway school with --sections sections x --days days of approved
+submissions, then explains AttendanceReportService._student_records_pipeline for
+one student and checks that:
+  - the first stage uses student_attendance_student_idx (IXSCAN, no COLLSCAN)
+  - documents examined == submissions of that student's section in the range
+
+Needs a reachable MongoDB (MONGO_* settings). The seeded school is removed afterwards.
+
+Usage: SECRET_KEY=bench python -m benchmarks.student_report_plans [sections] [days] [students_per_section]
+"""
+import asyncio
+import os
+import sys
+from datetime import date, timedelta
+from uuid import uuid4
+
+os.environ.setdefault("SECRET_KEY", "bench")
+
+from app.core.database import db
+from app.core.academic_year import get_current_academic_year
+from app.modules.attendance.model import COLLECTION_NAME, ensure_attendance_indexes
+from app.modules.reports.attendance_reports.service import AttendanceReportService
+
+def _stages(plan: dict):
+    """
+    Yield every stage name in a (possibly nested) explain document.
+    """
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan["stage"]
+        for value in plan.values():
+            yield from _stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from _stages(value)
+
+def _find(plan, key):
+    if isinstance(plan, dict):
+        if key in plan:
+            return plan[key]
+        for value in plan.values():
+            found = _find(value, key)
+            if found is not None:
+                return found
+    elif isinstance(plan, list):
+        for value in plan:
+            found = _find(value, key)
+            if found is not None:
+                return found
+    return None
+
+async def main(sections: int, days: int, students: int):
+    db.connect()
+    database = db.get_db()
+    school_id = f"bench_{uuid4().hex[:8]}"
+    academic_year = get_current_academic_year()
+    start = date.today() - timedelta(days=days - 1)
+    try:
+        await ensure_attendance_indexes()
+
+        docs = []
+        for section in range(sections):
+            for offset in range(days):
+                docs.append({
+                    "_id": uuid4().hex,
+                    "school_id": school_id,
+                    "class_id": "bench_class",
+                    "section_id": f"section_{section}",
+                    "subject_id": None,
+                    "date": str(start + timedelta(days=offset)),
+                    "academic_year": academic_year,
+                    "status": "APPROVED",
+                    "locked": True,
+                    "records": [
+                        {"student_id": f"student_{section}_{n}", "status": "present" if n % 5 else "absent"}
+                        for n in range(students)
+                    ]
+                })
+        await database[COLLECTION_NAME].insert_many(docs, ordered=False)
+        print(f"seeded {len(docs)} submissions ({sections} sections x {days} days, {students} students each)")
+
+        student_id = "student_0_1"
+        pipeline = AttendanceReportService._student_records_pipeline(
+            school_id, academic_year, student_id, start, date.today()
+        )
+        explain = await database.command(
+            "explain",
+            {"aggregate": COLLECTION_NAME, "pipeline": pipeline, "cursor": {}},
+            verbosity="executionStats"
+        )
+
+        stages = set(_stages(explain))
+        index_name = _find(explain, "indexName")
+        examined = _find(explain, "totalDocsExamined")
+        returned = len(await database[COLLECTION_NAME].aggregate(pipeline).to_list(None))
+
+        print(f"plan stages:        {sorted(stages)}")
+        print(f"index:              {index_name}")
+        print(f"docs examined:      {examined}")
+        print(f"rows returned:      {returned}")
+
+        assert "COLLSCAN" not in stages, "student pipeline fell back to a collection scan"
+        assert index_name == "student_attendance_student_idx", f"unexpected index {index_name}"
+        assert examined == days, f"examined {examined} documents, expected {days} (one section)"
+        assert returned == days
+        print("ok: only the student's own section was read")
+    finally:
+        await database[COLLECTION_NAME].delete_many({"school_id": school_id})
+        db.close()
+
+if __name__ == "__main__":
+    sections = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    students = int(sys.argv[3]) if len(sys.argv) > 3 else 40
+    asyncio.run(main(sections, days, students))